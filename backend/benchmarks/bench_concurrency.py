@@ -0,0 +1,83 @@
+"""
+Throughput and latency of the API under many concurrent clients.
+
+Run the same app twice, once per DB mode, with the response cache effectively off
+(CACHE_MAX_BYTES=1 stores nothing) so every request reaches the database, and point
+this script at each:
+
+    CACHE_MAX_BYTES=1 DB_ASYNC=false uvicorn backend.database_api.main:app --port 8000
+    CACHE_MAX_BYTES=1 DB_ASYNC=true  uvicorn backend.database_api.main:app --port 8001
+
+    python -m backend.benchmarks.bench_concurrency --url http://localhost:8000 --clients 200
+    python -m backend.benchmarks.bench_concurrency --url http://localhost:8001 --clients 200
+
+Each client loops over a read-heavy mix (list tasks, list projects, read a task). In
+sync mode every database request needs a threadpool thread (40 by default) as well as
+a pooled connection; in async mode it needs only the connection. The async mode can
+only pull ahead when queries wait on the network (Postgres) and DB_POOL_SIZE plus
+DB_MAX_OVERFLOW exceeds the threadpool; with SQLite, or a pool smaller than the
+threadpool, expect the two modes to be level.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def _client(
+    http: httpx.AsyncClient, paths: list[str], requests: int, latencies: list[float]
+) -> int:
+    errors = 0
+    for i in range(requests):
+        path = paths[i % len(paths)]
+        start = time.perf_counter()
+        try:
+            response = await http.get(path)
+        except httpx.HTTPError:
+            errors += 1
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response.status_code >= 400:
+            errors += 1
+    return errors
+
+
+async def run(url: str, clients: int, requests: int) -> None:
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as http:
+        tasks = (await http.get("/tasks/", params={"limit": 1})).json()
+        paths = ["/tasks/?limit=50", "/projects/?limit=20&include_tasks=false"]
+        if tasks:
+            paths.append(f"/tasks/{tasks[0]['id']}")
+
+        latencies: list[float] = []
+        start = time.perf_counter()
+        errors = await asyncio.gather(
+            *(_client(http, paths, requests, latencies) for _ in range(clients))
+        )
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"url={url} clients={clients} requests={total} errors={sum(errors)}")
+    print(f"throughput  {total / elapsed:9.1f} req/s")
+    print(
+        f"latency     p50={statistics.median(latencies):.1f} ms  "
+        f"p95={latencies[int(total * 0.95) - 1]:.1f} ms  "
+        f"p99={latencies[int(total * 0.99) - 1]:.1f} ms  max={latencies[-1]:.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=25, help="requests per client")
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.clients, args.requests))
+
+
+if __name__ == "__main__":
+    main()
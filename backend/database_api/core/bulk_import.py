@@ -0,0 +1,157 @@
+import codecs
+import csv
+import tempfile
+import time
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Union
+
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+
+from backend.database_api.core.export import ExportFormat
+from backend.database_api.schemas.task import BulkItemError, ImportReport
+
+# Rejected records listed in an ImportReport; the others are only counted.
+MAX_REPORTED_ERRORS = 100
+# Uploads larger than this are spooled to a temporary file instead of memory.
+SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+# An NDJSON line (parsed by the schema) or a CSV row as a dict.
+Record = Union[bytes, dict[str, Any]]
+# Loads a chunk of validated (index, item) pairs, returning the items it rejected.
+ChunkLoader = Callable[[list[tuple[int, BaseModel]]], list[BulkItemError]]
+
+
+def read_records(stream: IO[bytes], fmt: ExportFormat) -> Iterator[Record]:
+    """
+    Records of an NDJSON or CSV upload, in the layout written by the exports: one
+    object per non-blank line, or one CSV row per record under a header row. Fields
+    the schema does not know (e.g. id in an export) are ignored.
+    """
+    if fmt is ExportFormat.NDJSON:
+        return (line for line in stream if line.strip())
+    return csv.DictReader(codecs.iterdecode(stream, "utf-8-sig"))
+
+
+def _describe(exc: ValidationError) -> str:
+    messages = []
+    for error in exc.errors():
+        location = ".".join(map(str, error["loc"]))
+        messages.append(f"{location}: {error['msg']}" if location else error["msg"])
+    return "; ".join(messages)
+
+
+def _validate(schema: type[BaseModel], record: Record) -> BaseModel:
+    if isinstance(record, bytes):
+        return schema.model_validate_json(record)
+    return schema.model_validate(record)
+
+
+def _record(report: ImportReport, errors: list[BulkItemError]) -> None:
+    report.rejected += len(errors)
+    room = MAX_REPORTED_ERRORS - len(report.errors)
+    report.errors.extend(sorted(errors, key=lambda e: e.index)[:room])
+
+
+def run_import(
+    records: Iterable[Record],
+    schema: type[BaseModel],
+    load: ChunkLoader,
+    chunk_size: int,
+    on_progress: Optional[Callable[[ImportReport], None]] = None,
+) -> ImportReport:
+    """
+    Validate records with schema chunk_size at a time and hand each chunk's valid
+    items to load. Invalid or rejected records are counted and reported, and do
+    not stop the import. on_progress gets the running report after every chunk.
+    """
+    report = ImportReport()
+    start = time.perf_counter()
+    numbered = enumerate(records)
+    while chunk := list(islice(numbered, chunk_size)):
+        valid, errors = [], []
+        for index, record in chunk:
+            try:
+                valid.append((index, _validate(schema, record)))
+            except ValidationError as exc:
+                errors.append(BulkItemError(index=index, error=_describe(exc)))
+        rejected = load(valid) if valid else []
+        report.records += len(chunk)
+        report.imported += len(valid) - len(rejected)
+        _record(report, errors + rejected)
+        report.seconds = time.perf_counter() - start
+        if on_progress is not None:
+            on_progress(report)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+async def spool_body(request: Request) -> IO[bytes]:
+    """
+    The request body in a temporary file (in memory up to SPOOL_MAX_BYTES), read
+    from the start. The caller closes it.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def main() -> None:
+    """
+    Command line entry point:
+        python -m backend.database_api.core.bulk_import projects projects.ndjson
+        python -m backend.database_api.core.bulk_import tasks tasks.csv
+    """
+    import argparse
+
+    from backend.database_api.core.config import settings
+    from backend.database_api.db.connection import database
+    from backend.database_api.db.repositories.project_repository import (
+        ProjectRepository,
+    )
+    from backend.database_api.db.repositories.task_repository import TaskRepository
+    from backend.database_api.services.project_service import ProjectService
+    from backend.database_api.services.task_service import TaskService
+
+    parser = argparse.ArgumentParser(description="Bulk import NDJSON or CSV files.")
+    parser.add_argument("kind", choices=["projects", "tasks"])
+    parser.add_argument("path")
+    parser.add_argument(
+        "--format",
+        choices=[f.value for f in ExportFormat],
+        help="default: from the file extension",
+    )
+    parser.add_argument("--chunk-size", type=int, default=settings.IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+    fmt = ExportFormat(args.format or args.path.rsplit(".", 1)[-1].lower())
+
+    def _progress(report: ImportReport) -> None:
+        rate = report.records / report.seconds if report.seconds else 0
+        print(
+            f"{report.records} records: {report.imported} imported, "
+            f"{report.rejected} rejected ({rate:,.0f} records/s)",
+            end="\r",
+            flush=True,
+        )
+
+    with open(args.path, "rb") as stream, database.SessionLocal() as db:
+        if args.kind == "tasks":
+            service = TaskService(TaskRepository(db))
+        else:
+            service = ProjectService(ProjectRepository(db))
+        report = service.import_records(
+            read_records(stream, fmt),
+            chunk_size=args.chunk_size,
+            on_progress=_progress,
+        )
+    print()
+    for error in report.errors:
+        print(f"record {error.index}: {error.error}")
+    if report.rejected > len(report.errors):
+        print(f"... and {report.rejected - len(report.errors)} more rejected")
+
+
+if __name__ == "__main__":
+    main()
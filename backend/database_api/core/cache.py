@@ -1,32 +1,715 @@
+import asyncio
+import json
 import logging
-from typing import Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Iterable, Optional
 
-from cachetools import TTLCache
+import cachetools
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+from backend.database_api.core.cache_backends import CacheBackend, RedisBackend
+from backend.database_api.core.cache_metrics import (
+    CacheMetrics,
+    entry_size,
+    key_namespace,
+)
+from backend.database_api.core.conditional import ValidatedBody
+from backend.database_api.core.config import settings
+
+
+class _NotFound:
+    """
+    Cached marker for "looked up and does not exist", so a cache hit can be told
+    apart both from a miss (None) and from a real value.
+    """
+
+    def __repr__(self) -> str:
+        return "NOT_FOUND"
+
+
+NOT_FOUND = _NotFound()
+
+
+class _Entry:
+    """
+    A cached value, the version of each tag it was computed under and its
+    approximate size in bytes. It is invalid as soon as any of those tags has been
+    invalidated since. Past fresh_until (wall clock, so it can be shared between
+    processes) it may still be served while `refresh` reloads it.
+    """
+
+    __slots__ = ("value", "versions", "size", "fresh_until", "refresh")
+
+    def __init__(
+        self,
+        value: Any,
+        versions: tuple[tuple[str, int], ...],
+        size: int,
+        fresh_until: float,
+        refresh: Optional[Callable[[], Any]] = None,
+    ):
+        self.value = value
+        self.versions = versions
+        self.size = size
+        self.fresh_until = fresh_until
+        self.refresh = refresh
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+
+class _Flight:
+    """
+    One in-progress cache fill that other callers for the same key wait on.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def finish(self) -> None:
+        with self._lock:
+            self.done.set()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+
+    async def wait_async(self) -> None:
+        """Wait for finish() without blocking the event loop thread."""
+        future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            if self.done.is_set():
+                return
+            self._waiters.append((future.get_loop(), future))
+        await future
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _found(value: Any) -> Optional[Any]:
+    return None if value is NOT_FOUND else value
+
+
+def make_key(namespace: str, params: dict) -> str:
+    """
+    Deterministic cache key for a set of query parameters: None values are dropped,
+    enums and datetimes are reduced to their JSON form and keys are sorted, so equal
+    filters map to one entry however the caller spelled them.
+    """
+    normalized = {}
+    for name, value in sorted(params.items()):
+        if value is None:
+            continue
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        normalized[name] = value
+    return f"{namespace}:{json.dumps(normalized, separators=(',', ':'))}"
+
+
+def _encode_entry(
+    value: Any, versions: tuple[tuple[str, int], ...], fresh_until: float
+) -> bytes:
+    """
+    Serialize a cached value for a CacheBackend: a JSON header line, then the body.
+    Only the value shapes the services cache are supported: encoded JSON bytes,
+    a ValidatedBody, (bytes, next_cursor) list pages and NOT_FOUND.
+    """
+    cursor = etag = last_modified = None
+    if value is NOT_FOUND:
+        kind, body = "missing", b""
+    elif isinstance(value, bytes):
+        kind, body = "bytes", value
+    elif isinstance(value, ValidatedBody):
+        kind, body, etag = "validated", value.body, value.etag
+        if value.last_modified is not None:
+            last_modified = value.last_modified.isoformat()
+    elif isinstance(value, tuple):
+        kind, (body, cursor) = "page", value
+    else:
+        raise TypeError(f"Cannot store {type(value).__name__} in a shared cache")
+    header = {
+        "kind": kind,
+        "cursor": cursor,
+        "etag": etag,
+        "last_modified": last_modified,
+        "versions": versions,
+        "fresh_until": fresh_until,
+    }
+    return json.dumps(header).encode() + b"\n" + body
+
+
+def _decode_entry(data: bytes) -> tuple[Any, tuple[tuple[str, int], ...], float]:
+    header, body = data.split(b"\n", 1)
+    header = json.loads(header)
+    versions = tuple((tag, version) for tag, version in header["versions"])
+    if header["kind"] == "missing":
+        value = NOT_FOUND
+    elif header["kind"] == "page":
+        value = (body, header["cursor"])
+    elif header["kind"] == "validated":
+        last_modified = header["last_modified"]
+        if last_modified is not None:
+            last_modified = datetime.fromisoformat(last_modified)
+        value = ValidatedBody(body, header["etag"], last_modified)
+    else:
+        value = body
+    return value, versions, header["fresh_until"]
+
+
+EVICTION_POLICIES = ("lru", "lfu")
+
+
+class _InstrumentedTLRUCache(cachetools.TLRUCache):
+    """
+    TLRUCache that reports evictions (capacity) and expirations (TTL) to CacheMetrics.
+    Expired entries always go first; when the cache is still full, policy "lru"
+    evicts the least recently used entry and "lfu" the least frequently used one
+    (oldest first among equals).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttu,
+        metrics: CacheMetrics,
+        getsizeof: Optional[Callable[[Any], int]] = None,
+        policy: str = "lru",
+    ):
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown cache eviction policy: {policy!r}")
+        super().__init__(maxsize=maxsize, ttu=ttu, getsizeof=getsizeof)
+        self.metrics = metrics
+        self.policy = policy
+        # Reads per live key, for "lfu". Kept in insertion order for tie-breaking.
+        self._uses: dict[str, int] = {}
+        self._clearing = False
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self._uses[key] += 1
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if cachetools.Cache.__contains__(self, key):
+            self._uses.setdefault(key, 0)
+
+    def __delitem__(self, key):
+        try:
+            super().__delitem__(key)
+        finally:
+            self._uses.pop(key, None)
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, _ in expired:
+            self._uses.pop(key, None)
+            if not self._clearing:
+                self.metrics.record("expirations", key)
+        return expired
+
+    def _pop_least_used(self):
+        with self.timer as time:
+            self.expire(time)
+            if not self._uses:
+                raise KeyError(f"{self.__class__.__name__} is empty")
+            # Linear in the number of entries, which only matters when evicting.
+            key = min(self._uses, key=self._uses.__getitem__)
+            return key, self.pop(key)
+
+    def popitem(self):
+        if self.policy == "lfu":
+            key, value = self._pop_least_used()
+        else:
+            key, value = super().popitem()
+        if not self._clearing:
+            self.metrics.record("evictions", key)
+        return key, value
+
+    def clear(self) -> None:
+        # MutableMapping.clear() pops item by item; those are not evictions.
+        self._clearing = True
+        try:
+            super().clear()
+        finally:
+            self._clearing = False
+
+    def peek_items(self) -> list[tuple[str, Any]]:
+        """Live (key, value) pairs, read without touching LRU order."""
+        return [(key, cachetools.Cache.__getitem__(self, key)) for key in self]
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
 
 class Cache:
-    def __init__(self, maxsize: int = 100, ttl: int = 30):
-        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    """
+    Process-local TTL cache, optionally in front of a shared CacheBackend (e.g. Redis).
+    Capacity is maxsize entries, or with max_bytes a budget in approximate bytes
+    (see cache_metrics.entry_size), so one large list page weighs as much as the
+    many small entries it displaces. namespace_ttls overrides ttl per key namespace.
+    With stale_ttl, an entry loaded with a refresh_fn is kept that much longer
+    past its TTL: a read in that window gets the stale value at once and reloads it
+    in the background, so hot keys never make a request wait at a TTL boundary.
+    Entries nobody reads lapse. Invalidated entries are never served stale.
+    With a backend the local copy is an L1 that lives at most l1_ttl seconds:
+    misses fall through to the backend before loading, and deletes and tag
+    invalidations are broadcast so every worker drops its L1 entries.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 100,
+        ttl: float = 30,
+        negative_ttl: float = 5,
+        backend: Optional[CacheBackend] = None,
+        l1_ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: str = "lru",
+        namespace_ttls: Optional[dict[str, float]] = None,
+        stale_ttl: float = 0,
+        refresh_workers: int = 2,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self.refresh_workers = refresh_workers
+        self.namespace_ttls = dict(namespace_ttls or {})
+        self.backend = backend
+        self.l1_ttl = l1_ttl
+        self.max_bytes = max_bytes
+        self.metrics = CacheMetrics()
+        self._cache = _InstrumentedTLRUCache(
+            max_bytes if max_bytes is not None else maxsize,
+            self._time_to_use,
+            self.metrics,
+            getsizeof=(lambda entry: entry.size) if max_bytes is not None else None,
+            policy=eviction_policy,
+        )
+        # TLRUCache mutates itself on reads (expiry), so every access is serialized.
+        self._lock = threading.RLock()
+        self._flights: dict[str, _Flight] = {}
+        self._async_flights: dict[tuple[int, str], asyncio.Future] = {}
+        # Key -> token of its running background refresh; delete() drops the token
+        # so a refresh that read the old row does not store it afterwards.
+        self._refreshing: dict[str, object] = {}
+        self._refresher: Optional[ThreadPoolExecutor] = None
+        # Local view of tag versions; with a backend it follows the shared counters.
+        self._tag_versions: dict[str, int] = {}
+        if backend is not None:
+            backend.subscribe(self._on_invalidation)
+
+    def _ttl_for(self, key: str, value: Any) -> float:
+        if value is NOT_FOUND:
+            return self.negative_ttl
+        return self.namespace_ttls.get(key_namespace(key), self.ttl)
+
+    def _lifetime(self, key: str, value: Any, refresh: Optional[Callable]) -> float:
+        # Seconds until the entry is dropped: its TTL plus any stale grace window.
+        ttl = self._ttl_for(key, value)
+        if refresh is not None and value is not NOT_FOUND:
+            ttl += self.stale_ttl
+        return ttl
+
+    def _time_to_use(self, key: str, entry: _Entry, now: float) -> float:
+        ttl = self._lifetime(key, entry.value, entry.refresh)
+        if self.l1_ttl is not None:
+            ttl = min(ttl, self.l1_ttl)
+        return now + ttl
+
+    def _versions(self, tags: Iterable[str]) -> tuple[tuple[str, int], ...]:
+        return tuple((tag, self._tag_versions.get(tag, 0)) for tag in tags)
+
+    def _observe_versions(self, versions: dict[str, int]) -> None:
+        # Caller holds self._lock. Versions only move forward.
+        for tag, version in versions.items():
+            if version > self._tag_versions.get(tag, 0):
+                self._tag_versions[tag] = version
+
+    def _lookup_entry(self, key: str) -> Optional[_Entry]:
+        # Caller holds self._lock. Entries past fresh_until are returned too.
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry.versions and entry.versions != self._versions(
+            tag for tag, _ in entry.versions
+        ):
+            del self._cache[key]
+            return None
+        return entry
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        # Caller holds self._lock.
+        entry = self._lookup_entry(key)
+        if entry is None or not entry.is_fresh():
+            return None
+        return entry.value
+
+    def _store_local(
+        self,
+        key: str,
+        value: Any,
+        versions: tuple[tuple[str, int], ...],
+        fresh_until: float,
+        refresh: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        size = entry_size(key, value)
+        entry = _Entry(value, versions, size, fresh_until, refresh)
+        with self._lock:
+            try:
+                self._cache[key] = entry
+            except ValueError:
+                # Larger than the whole budget: not cached, and not left stale.
+                logging.debug(f"CACHE SKIP: {key} ({entry.size} bytes)")
+                self._cache.pop(key, None)
+                return
+        self.metrics.record("sets", key)
 
-    def set(self, key: str, value: Any) -> None:
-        """Set a value to cache"""
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        versions: tuple[tuple[str, int], ...],
+        refresh: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        fresh_until = time.time() + self._ttl_for(key, value)
+        self._store_local(key, value, versions, fresh_until, refresh)
+        if self.backend is not None:
+            self._call_backend(
+                "set",
+                key,
+                _encode_entry(value, versions, fresh_until),
+                self._lifetime(key, value, refresh),
+            )
+
+    def _call_backend(self, method: str, *args) -> Any:
+        """
+        Call a (blocking) backend method. Under AsyncSession.run_sync the caller is
+        a greenlet on the event loop thread: the call then runs on a worker thread
+        and is awaited, so the loop keeps serving other requests meanwhile.
+        """
+        call = getattr(self.backend, method)
+        if _in_event_loop() and in_greenlet():
+            return await_only(asyncio.to_thread(call, *args))
+        return call(*args)
+
+    def _lookup_shared(
+        self,
+        key: str,
+        tags: Iterable[str] = (),
+        refresh: Optional[Callable[[], Any]] = None,
+    ) -> tuple[Optional[_Entry], tuple[tuple[str, int], ...]]:
+        """
+        Read key from the backend into L1. Also returns the current versions of
+        `tags`, fetched in the same round trip, for a load that follows a miss.
+        Without a refresh function an entry past its TTL counts as a miss.
+        """
+        tags = tuple(tags)
+        data, current = self._call_backend("get_with_tags", key, tags)
+        with self._lock:
+            self._observe_versions(current)
+            versions = self._versions(tags)
+        if data is None:
+            return None, versions
+
+        value, entry_versions, fresh_until = _decode_entry(data)
+        if refresh is None and time.time() >= fresh_until:
+            return None, versions
+        entry_tags = [tag for tag, _ in entry_versions if tag not in current]
+        if entry_tags:
+            _, extra = self._call_backend("get_with_tags", key, entry_tags)
+            current = {**current, **extra}
+        if any(current.get(tag, 0) != version for tag, version in entry_versions):
+            return None, versions
+        with self._lock:
+            self._observe_versions(current)
+        self._store_local(key, value, entry_versions, fresh_until, refresh)
+        with self._lock:
+            return self._cache.get(key), versions
+
+    def _serve(self, key: str, entry: _Entry, refresh: Optional[Callable]) -> bool:
+        """
+        Whether entry can answer a read; a stale one can if it has a refresh
+        function, which is then started in the background (once per key).
+        """
+        if entry.is_fresh():
+            return True
+        refresh = refresh or entry.refresh
+        if refresh is None or entry.value is NOT_FOUND:
+            return False
+        with self._lock:
+            if key in self._refreshing:
+                return True
+            token = self._refreshing[key] = object()
+            versions = self._versions(tag for tag, _ in entry.versions)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(
+                    self.refresh_workers, thread_name_prefix="cache-refresh"
+                )
+        logging.debug(f"CACHE REFRESH: {key}")
+        self._refresher.submit(self._refresh, key, refresh, versions, token)
+        return True
+
+    def _refresh(
+        self,
+        key: str,
+        refresh: Callable,
+        versions: tuple[tuple[str, int], ...],
+        token: object,
+    ) -> None:
+        try:
+            value = refresh()
+            with self._lock:
+                if self._refreshing.get(key) is not token:
+                    return
+            self.metrics.record("refreshes", key)
+            self._store(key, NOT_FOUND if value is None else value, versions, refresh)
+        except Exception as exc:
+            # The stale entry lapses at the end of its grace window instead.
+            logging.warning(f"Cache refresh of {key} failed: {exc}")
+        finally:
+            with self._lock:
+                if self._refreshing.get(key) is token:
+                    del self._refreshing[key]
+
+    def _on_invalidation(self, message: dict) -> None:
+        """Apply a delete or tag invalidation broadcast by any worker (this one too)."""
+        with self._lock:
+            for key in message.get("keys", []):
+                self._cache.pop(key, None)
+                self._refreshing.pop(key, None)
+            self._observe_versions(message.get("tags", {}))
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = ()) -> None:
+        """Set a value to cache, dropped again when any of `tags` is invalidated"""
         logging.debug(f"CACHE SET: {key}")
-        self._cache[key] = value
+        with self._lock:
+            versions = self._versions(tags)
+        self._store(key, value, versions)
 
     def get(self, key: str) -> Optional[Any]:
-        """Retrieve a value from cache"""
+        """Retrieve a value from cache (NOT_FOUND for a cached negative result)"""
         logging.debug(f"CACHE GET: {key}")
-        return self._cache.get(key)
+        with self._lock:
+            value = self._lookup(key)
+        if value is None and self.backend is not None:
+            entry, _ = self._lookup_shared(key)
+            value = entry.value if entry is not None else None
+        self.metrics.record("misses" if value is None else "hits", key)
+        return value
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """Drop every entry tagged with any of `tags`"""
+        logging.debug(f"CACHE INVALIDATE: {', '.join(tags)}")
+        versions = {}
+        if self.backend is not None:
+            versions = self._call_backend("incr_tags", tags)
+        with self._lock:
+            self._observe_versions(versions)
+            # Without a backend (or when it failed) the local versions still move,
+            # so at least this worker stops serving the stale entries.
+            for tag in tags:
+                if tag not in versions:
+                    self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+        if versions:
+            self._call_backend("publish", {"tags": versions})
 
     def clear(self) -> None:
         """Clear all cached values"""
         logging.debug("CLEAR CACHE")
-        self._cache.clear()
+        with self._lock:
+            # Tag versions are kept: an in-flight load may still store under them.
+            self._cache.clear()
+            self._refreshing.clear()
+        if self.backend is not None:
+            self._call_backend("clear")
 
     def delete(self, key: str) -> None:
-        if key in self._cache:
-            logging.debug(f"CACHE DELETE: {key}")
-            del self._cache[key]
+        with self._lock:
+            if key in self._cache:
+                logging.debug(f"CACHE DELETE: {key}")
+                del self._cache[key]
+            self._refreshing.pop(key, None)
+        if self.backend is not None:
+            self._call_backend("delete", key)
+            self._call_backend("publish", {"keys": [key]})
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Event counters plus current entries and approximate memory per key namespace.
+        """
+        stats = self.metrics.snapshot()
+        with self._lock:
+            self._cache.expire()
+            items = self._cache.peek_items()
+        for key, entry in items:
+            namespace = stats.setdefault(key_namespace(key), {})
+            namespace["entries"] = namespace.get("entries", 0) + 1
+            namespace["memory_bytes"] = namespace.get("memory_bytes", 0) + entry.size
+        return stats
+
+    def get_or_load(
+        self,
+        key: str,
+        load_fn: Callable[[], Any],
+        tags: Iterable[str] = (),
+        refresh_fn: Optional[Callable[[], Any]] = None,
+    ) -> Optional[Any]:
+        """
+        Return the cached value, or call load_fn to fill it.
+        Concurrent misses for the same key across threads are coalesced: the first
+        caller loads while the others block until its result (or error) is ready.
+        Callers on an event loop inside AsyncSession.run_sync await it instead.
+        A None result is cached as NOT_FOUND for negative_ttl seconds, and returned
+        as None; writers that create the key must delete() it.
+        Tag versions are read before loading, so a write that invalidates `tags`
+        while load_fn runs leaves the stored value already stale.
+        refresh_fn reloads the value for a stale-while-revalidate refresh. It runs
+        on a background thread after the request is gone, so unlike load_fn it must
+        not use request-scoped resources such as the request's DB session.
+        """
+        with self._lock:
+            entry = self._lookup_entry(key)
+            if entry is not None and self._serve(key, entry, refresh_fn):
+                self.metrics.record("hits", key)
+                return _found(entry.value)
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                versions = self._versions(tags)
+
+        if not leader:
+            # Blocking on an event loop thread would stall the leader too. Under
+            # AsyncSession.run_sync we are in a greenlet and can await the flight;
+            # any other loop caller should use get_or_load_async, and loads here.
+            if _in_event_loop():
+                if not in_greenlet():
+                    self.metrics.record("misses", key)
+                    return load_fn()
+                self.metrics.record("hits", key)
+                logging.debug(f"CACHE WAIT: {key}")
+                await_only(flight.wait_async())
+            else:
+                self.metrics.record("hits", key)
+                logging.debug(f"CACHE WAIT: {key}")
+                flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            if self.backend is not None:
+                shared, versions = self._lookup_shared(key, tags, refresh_fn)
+                if shared is not None and self._serve(key, shared, refresh_fn):
+                    self.metrics.record("hits", key)
+                    flight.value = _found(shared.value)
+                    return flight.value
+            self.metrics.record("misses", key)
+            flight.value = load_fn()
+            value = NOT_FOUND if flight.value is None else flight.value
+            self._store(key, value, versions, refresh_fn)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.finish()
+
+    async def get_or_load_async(
+        self,
+        key: str,
+        load_fn: Callable[[], Awaitable[Any]],
+        tags: Iterable[str] = (),
+    ) -> Optional[Any]:
+        """
+        Awaitable counterpart of get_or_load for coroutines on one event loop.
+        Waiting callers await the first caller's result instead of blocking a thread.
+        If that caller is cancelled (its client went away) the next one takes over.
+        Only L1 is consulted and filled here, so the event loop never waits on the
+        backend; load_fn is expected to go through get_or_load (in the threadpool,
+        or under AsyncSession.run_sync, which sends its backend calls to a worker
+        thread) which reads and fills the backend, and counts the miss. A stale
+        entry that get_or_load stored with a refresh_fn is served here and
+        refreshed the same way.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        while True:
+            with self._lock:
+                entry = self._lookup_entry(key)
+                served = entry is not None and self._serve(key, entry, None)
+            if served:
+                self.metrics.record("hits", key)
+                return _found(entry.value)
+            flight = self._async_flights.get(flight_key)
+            if flight is None:
+                break
+            self.metrics.record("hits", key)
+            logging.debug(f"CACHE WAIT: {key}")
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+
+        flight = self._async_flights[flight_key] = loop.create_future()
+        with self._lock:
+            versions = self._versions(tags)
+        try:
+            value = await load_fn()
+            with self._lock:
+                # Usually already filled by the get_or_load that load_fn ran.
+                if self._lookup(key) is None:
+                    stored = NOT_FOUND if value is None else value
+                    fresh_until = time.time() + self._ttl_for(key, stored)
+                    self._store_local(key, stored, versions, fresh_until)
+            flight.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            # Mark retrieved so an error nobody waited for is not logged as lost.
+            flight.exception()
+            raise
+        finally:
+            del self._async_flights[flight_key]
+
+
+def _shared_backend() -> Optional[CacheBackend]:
+    if not settings.CACHE_REDIS_URL:
+        return None
+    return RedisBackend.from_url(settings.CACHE_REDIS_URL)
 
 
-global_cache = Cache(maxsize=200, ttl=30)
+global_cache = Cache(
+    max_bytes=settings.CACHE_MAX_BYTES,
+    eviction_policy=settings.CACHE_EVICTION_POLICY,
+    ttl=settings.CACHE_TTL,
+    namespace_ttls=settings.CACHE_NAMESPACE_TTLS,
+    negative_ttl=settings.CACHE_NEGATIVE_TTL,
+    stale_ttl=settings.CACHE_STALE_TTL,
+    backend=_shared_backend(),
+    l1_ttl=settings.CACHE_L1_TTL if settings.CACHE_REDIS_URL else None,
+)
@@ -0,0 +1,134 @@
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Optional
+
+
+class CacheBackend(ABC):
+    """
+    Shared store behind core.cache.Cache (its L2), so every worker process sees the
+    same entries and tag versions. Entries are opaque bytes encoded by Cache.
+    Invalidation messages are broadcast to every subscribed process.
+    """
+
+    @abstractmethod
+    def get_with_tags(
+        self, key: str, tags: Iterable[str] = ()
+    ) -> tuple[Optional[bytes], dict[str, int]]:
+        """The entry for key plus the current version of each tag, in one round trip"""
+
+    @abstractmethod
+    def set(self, key: str, data: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def incr_tags(self, tags: Iterable[str]) -> dict[str, int]:
+        """Bump the version of every tag and return the new versions"""
+
+    @abstractmethod
+    def publish(self, message: dict) -> None: ...
+
+    @abstractmethod
+    def subscribe(self, callback: Callable[[dict], None]) -> None:
+        """Call callback(message) for each broadcast, from a background thread"""
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class RedisBackend(CacheBackend):
+    """
+    CacheBackend on a redis-py compatible client (redis.Redis, or fakeredis in tests).
+    Errors from Redis are logged and treated as misses / no-ops, so an outage
+    degrades to the per-process cache instead of failing requests.
+    """
+
+    def __init__(self, client, prefix: str = "project-tracker:cache:"):
+        self.client = client
+        self.prefix = prefix
+        self.channel = f"{prefix}invalidate"
+        self._listener = None
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_REDIS_URL is set but redis is not installed.")
+        return cls(redis.Redis.from_url(url))
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.prefix}entry:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def get_with_tags(
+        self, key: str, tags: Iterable[str] = ()
+    ) -> tuple[Optional[bytes], dict[str, int]]:
+        tags = list(tags)
+        try:
+            data, *versions = self.client.mget(
+                [self._entry_key(key), *(self._tag_key(tag) for tag in tags)]
+            )
+        except Exception as exc:
+            logging.warning(f"Cache backend read failed: {exc}")
+            return None, {}
+        return data, {tag: int(v or 0) for tag, v in zip(tags, versions)}
+
+    def set(self, key: str, data: bytes, ttl: float) -> None:
+        try:
+            self.client.set(self._entry_key(key), data, px=max(int(ttl * 1000), 1))
+        except Exception as exc:
+            logging.warning(f"Cache backend write failed: {exc}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete(self._entry_key(key))
+        except Exception as exc:
+            logging.warning(f"Cache backend delete failed: {exc}")
+
+    def incr_tags(self, tags: Iterable[str]) -> dict[str, int]:
+        tags = list(tags)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.incr(self._tag_key(tag))
+            return dict(zip(tags, pipe.execute()))
+        except Exception as exc:
+            logging.warning(f"Cache backend tag invalidation failed: {exc}")
+            return {}
+
+    def publish(self, message: dict) -> None:
+        try:
+            self.client.publish(self.channel, json.dumps(message))
+        except Exception as exc:
+            logging.warning(f"Cache backend publish failed: {exc}")
+
+    def subscribe(self, callback: Callable[[dict], None]) -> None:
+        def _handle(message):
+            callback(json.loads(message["data"]))
+
+        def _on_error(exc, pubsub, thread):
+            # Keep listening; redis-py resubscribes when the connection comes back.
+            logging.warning(f"Cache invalidation listener error: {exc}")
+            time.sleep(1.0)
+
+        try:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: _handle})
+            self._listener = pubsub.run_in_thread(
+                sleep_time=1.0, daemon=True, exception_handler=_on_error
+            )
+        except Exception as exc:
+            logging.warning(f"Cache invalidation subscribe failed: {exc}")
+
+    def clear(self) -> None:
+        try:
+            for key in self.client.scan_iter(match=f"{self.prefix}entry:*"):
+                self.client.delete(key)
+        except Exception as exc:
+            logging.warning(f"Cache backend clear failed: {exc}")
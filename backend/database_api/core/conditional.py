@@ -0,0 +1,105 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Strong ETag for an encoded response body: equal bodies get equal tags, so it
+    also changes when e.g. a project's embedded tasks change.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+@dataclass(frozen=True)
+class ValidatedBody:
+    """
+    An encoded JSON body with its ETag and Last-Modified, worked out once when the
+    body is built, so serving it from the cache neither rehashes nor reparses it.
+    """
+
+    body: bytes
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def build(
+        cls, body: bytes, last_modified: Optional[datetime] = None
+    ) -> "ValidatedBody":
+        if last_modified is not None and last_modified.tzinfo is None:
+            # Timestamps are stored without a zone, in UTC (the database's now()).
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return cls(body, make_etag(body), last_modified)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison: W/ prefixes are ignored.
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def _not_modified_since(
+    if_modified_since: str, last_modified: Optional[datetime]
+) -> bool:
+    if last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have whole seconds.
+    return last_modified.replace(microsecond=0) <= since
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Whether a GET can be answered with 304 (RFC 9110 section 13.2.2):
+    If-None-Match when present, otherwise If-Modified-Since.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        return _not_modified_since(if_modified_since, last_modified)
+    return False
+
+
+def conditional_json_response(
+    request: Request,
+    body: bytes | ValidatedBody,
+    headers: Optional[dict[str, str]] = None,
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    """
+    A JSON response for body with validators, or 304 without a body when the
+    client's copy is current. last_modified must be timezone aware; a ValidatedBody
+    brings its own ETag and last_modified.
+    "Cache-Control: no-cache" lets clients keep the body but revalidate each use.
+    """
+    if isinstance(body, ValidatedBody):
+        etag, last_modified, body = body.etag, body.last_modified, body.body
+    else:
+        etag = make_etag(body)
+    headers = {
+        **(headers or {}),
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    if is_not_modified(request, headers["ETag"], last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
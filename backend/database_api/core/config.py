@@ -1,4 +1,6 @@
+import json
 import os
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -8,6 +10,74 @@ class Settings(BaseModel):
     DESCRIPTION: str = "Backend API to manage projects and tasks"
     VERSION: str = "1.0.0"
     ENV: str = os.getenv("ENV", "development")
+    DEFAULT_PAGE_SIZE: int = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+    MAX_PAGE_SIZE: int = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+    MAX_BULK_ITEMS: int = int(os.getenv("MAX_BULK_ITEMS", "1000"))
+    # Rows fetched per round trip (and sent per chunk) by the streaming exports.
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+    # Records validated and loaded (and committed) together by the bulk imports.
+    IMPORT_CHUNK_SIZE: int = int(os.getenv("IMPORT_CHUNK_SIZE", "10000"))
+    # Seconds the change feed stays behind the clock, so a write that commits after
+    # a client read past its timestamp (a transaction that started earlier, or a
+    # timestamp of second resolution on SQLite) is not skipped. Must exceed the
+    # longest write transaction.
+    CHANGES_SETTLE_SECONDS: float = float(os.getenv("CHANGES_SETTLE_SECONDS", "2"))
+    # Seconds tombstones, and so the deletes GET /changes reports, are kept. A since=
+    # cursor older than that gets 410 Gone and must resync from the start.
+    CHANGES_RETENTION_SECONDS: float = float(
+        os.getenv("CHANGES_RETENTION_SECONDS", str(30 * 24 * 3600))
+    )
+    # Seconds between tombstone prunes in each worker process.
+    CHANGES_PRUNE_INTERVAL_SECONDS: float = float(
+        os.getenv("CHANGES_PRUNE_INTERVAL_SECONDS", "3600")
+    )
+    # Events buffered per /changes/stream subscriber. One that falls further behind
+    # is sent an "overflow" event and disconnected, instead of buffering more.
+    EVENTS_QUEUE_SIZE: int = int(os.getenv("EVENTS_QUEUE_SIZE", "256"))
+    # Seconds without events after which the stream sends a keep-alive comment.
+    EVENTS_HEARTBEAT_SECONDS: float = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+    # Relay change events through Postgres LISTEN/NOTIFY, so subscribers of every
+    # worker see the writes of all of them (Postgres DATABASE_URL only).
+    EVENTS_PG_NOTIFY: bool = os.getenv("EVENTS_PG_NOTIFY", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    # Connection pool (ignored for in-memory SQLite, which uses a single shared connection).
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    # Budget for the per-process cache, in approximate bytes of keys and payloads.
+    CACHE_MAX_BYTES: int = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    # What to drop when the budget is full: "lru" (least recently used) or "lfu"
+    # (least frequently used).
+    CACHE_EVICTION_POLICY: str = os.getenv("CACHE_EVICTION_POLICY", "lru")
+    # Seconds an entry stays cached, unless its namespace has its own TTL below. API
+    # writes invalidate the entries they affect; this bounds how long a change made
+    # outside the API (or a missed invalidation) can go unnoticed.
+    CACHE_TTL: float = float(os.getenv("CACHE_TTL", "30"))
+    # Per-namespace TTLs as JSON, e.g. {"project": 60, "tasks:list": 10}.
+    CACHE_NAMESPACE_TTLS: dict[str, float] = json.loads(
+        os.getenv("CACHE_NAMESPACE_TTLS") or "{}"
+    )
+    # Seconds past its TTL a cached entry may still be served while it is reloaded
+    # in the background (stale-while-revalidate); 0 disables.
+    CACHE_STALE_TTL: float = float(os.getenv("CACHE_STALE_TTL", "30"))
+    # Seconds a "not found" lookup stays cached; creates invalidate it sooner.
+    CACHE_NEGATIVE_TTL: int = int(os.getenv("CACHE_NEGATIVE_TTL", "5"))
+    # Shared cache for several workers (redis://...); unset keeps it per process.
+    CACHE_REDIS_URL: Optional[str] = os.getenv("CACHE_REDIS_URL") or None
+    # With CACHE_REDIS_URL, seconds an entry stays in a worker's local copy. Caps how
+    # long a worker can serve a stale entry if an invalidation broadcast is missed.
+    CACHE_L1_TTL: float = float(os.getenv("CACHE_L1_TTL", "5"))
+    # Run DB work on an async engine (asyncpg / aiosqlite) instead of the threadpool.
+    DB_ASYNC: bool = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
 
 
 settings = Settings()
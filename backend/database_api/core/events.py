@@ -0,0 +1,313 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
+
+from backend.database_api.core.config import settings
+from backend.database_api.core.serialization import dumps
+from backend.database_api.enum.change import ChangeEntity, ChangeOp
+
+# Largest NOTIFY payload Postgres accepts is 8000 bytes; leave room for the channel.
+MAX_NOTIFY_BYTES = 7900
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    One committed create, update or delete of a project or task, as pushed to the
+    subscribers of /changes/stream.
+    """
+
+    entity: ChangeEntity
+    op: ChangeOp
+    # The row as the API returns it (a project without its tasks); for deletes, the
+    # row as it was.
+    data: dict[str, Any]
+    # Projects and assignees the change concerns, before and after it, which
+    # subscriptions filter on.
+    project_ids: frozenset[int] = frozenset()
+    assignees: frozenset[str] = frozenset()
+
+    def sse_data(self) -> bytes:
+        return dumps(
+            {
+                "entity": self.entity,
+                "op": self.op,
+                "id": self.data["id"],
+                "data": self.data,
+            }
+        )
+
+    def to_message(self) -> dict:
+        return {
+            "entity": self.entity.value,
+            "op": self.op.value,
+            "data": self.data,
+            "project_ids": sorted(self.project_ids),
+            "assignees": sorted(self.assignees),
+        }
+
+    @classmethod
+    def from_message(cls, message: dict) -> "ChangeEvent":
+        return cls(
+            entity=ChangeEntity(message["entity"]),
+            op=ChangeOp(message["op"]),
+            data=message["data"],
+            project_ids=frozenset(message["project_ids"]),
+            assignees=frozenset(message["assignees"]),
+        )
+
+
+# Put in place of a subscriber's buffered events when it falls too far behind.
+OVERFLOW = object()
+
+
+class Subscription:
+    """
+    One subscriber's bounded queue of events, owned by the event loop that created
+    it. Events that arrive while the queue is full are not buffered elsewhere: the
+    queue is replaced by OVERFLOW and the subscriber has to resync.
+    """
+
+    def __init__(
+        self,
+        queue_size: int,
+        project_id: Optional[int] = None,
+        assigned_to: Optional[str] = None,
+    ):
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.project_id = project_id
+        # Assignees are stored lowercased.
+        self.assigned_to = assigned_to.lower() if assigned_to else None
+        self.overflowed = False
+
+    def matches(self, event: ChangeEvent) -> bool:
+        if self.project_id is not None and self.project_id not in event.project_ids:
+            return False
+        return self.assigned_to is None or self.assigned_to in event.assignees
+
+    def offer(self, event: ChangeEvent) -> None:
+        """
+        Queue an event. Runs on the subscription's loop (see EventBroker.deliver).
+        """
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+
+
+class EventBridge(ABC):
+    """
+    Carries change events between worker processes: publish() reaches the callback
+    given to subscribe() in every process, this one included.
+    """
+
+    @abstractmethod
+    def publish(self, messages: list[dict]) -> None:
+        """Send messages without blocking the caller, which is the writer's thread"""
+
+    @abstractmethod
+    def subscribe(self, callback: Callable[[dict], None]) -> None:
+        """Call callback(message) for each message, from a background thread"""
+
+
+class PostgresBridge(EventBridge):
+    """
+    EventBridge over Postgres LISTEN/NOTIFY on a channel, with psycopg2 connections
+    of its own (one notifying from a sender thread, one listening in a daemon
+    thread). publish() only queues: the writer, which may be the event loop thread,
+    never waits on the notify. Errors are logged, so an outage stops events without
+    failing the writes that publish them.
+    """
+
+    def __init__(self, dsn: str, channel: str = "project_tracker_changes"):
+        self.dsn = dsn
+        self.channel = channel
+        self._conn = None
+        # One worker, so notifies go out in publish order over one connection.
+        self._sender = ThreadPoolExecutor(1, thread_name_prefix="change-notify")
+
+    @classmethod
+    def from_url(cls, url: str) -> "PostgresBridge":
+        try:
+            import psycopg2  # noqa: F401
+        except ImportError:
+            raise RuntimeError("EVENTS_PG_NOTIFY is set but psycopg2 is not installed.")
+        from sqlalchemy.engine import make_url
+
+        parsed = make_url(url)
+        if parsed.get_backend_name() != "postgresql":
+            raise RuntimeError("EVENTS_PG_NOTIFY needs a Postgres DATABASE_URL.")
+        dsn = parsed.set(drivername="postgresql").render_as_string(hide_password=False)
+        return cls(dsn)
+
+    def _connect(self):
+        import psycopg2
+
+        conn = psycopg2.connect(self.dsn)
+        conn.autocommit = True
+        return conn
+
+    def publish(self, messages: list[dict]) -> None:
+        payloads = []
+        for message in messages:
+            payload = dumps(message)
+            if len(payload) > MAX_NOTIFY_BYTES:
+                # Too large to notify: subscribers get the id and can fetch the row.
+                payload = dumps({**message, "data": {"id": message["data"]["id"]}})
+            payloads.append((self.channel, payload.decode()))
+        self._sender.submit(self._notify, payloads)
+
+    def _notify(self, payloads: list[tuple[str, str]]) -> None:
+        try:
+            if self._conn is None or self._conn.closed:
+                self._conn = self._connect()
+            with self._conn.cursor() as cursor:
+                cursor.executemany("SELECT pg_notify(%s, %s)", payloads)
+        except Exception as exc:
+            logging.warning(f"Change event publish failed: {exc}")
+            self._conn = None
+
+    def subscribe(self, callback: Callable[[dict], None]) -> None:
+        import select
+
+        def _listen():
+            while True:
+                conn = None
+                try:
+                    conn = self._connect()
+                    with conn.cursor() as cursor:
+                        cursor.execute(f"LISTEN {self.channel}")
+                    while True:
+                        if select.select([conn], [], [], 5.0) == ([], [], []):
+                            continue
+                        conn.poll()
+                        while conn.notifies:
+                            callback(json.loads(conn.notifies.pop(0).payload))
+                except Exception as exc:
+                    # Reconnect and keep listening.
+                    logging.warning(f"Change event listener error: {exc}")
+                    if conn is not None:
+                        conn.close()
+                    time.sleep(1.0)
+
+        threading.Thread(target=_listen, name="change-events", daemon=True).start()
+
+
+class EventBroker:
+    """
+    In-process fan-out of change events to the subscriptions of this process.
+    publish() may be called from any thread (the services run in the threadpool);
+    each event is handed to the loop of every matching subscription without
+    blocking the writer. With a bridge, events go through it, so subscribers in
+    every worker receive the writes of all of them.
+    """
+
+    def __init__(self, queue_size: int, bridge: Optional[EventBridge] = None):
+        self.queue_size = queue_size
+        self.bridge = bridge
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+        if bridge is not None:
+            bridge.subscribe(self._on_message)
+
+    def subscribe(
+        self, project_id: Optional[int] = None, assigned_to: Optional[str] = None
+    ) -> Subscription:
+        """
+        A subscription to the events of one project and/or assignee (all when
+        None). Call from the event loop that will read it.
+        """
+        subscription = Subscription(self.queue_size, project_id, assigned_to)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    def publish(self, events: Iterable[ChangeEvent]) -> None:
+        events = list(events)
+        if not events:
+            return
+        if self.bridge is not None:
+            self.bridge.publish([event.to_message() for event in events])
+            return
+        for event in events:
+            self.deliver(event)
+
+    def deliver(self, event: ChangeEvent) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if not subscription.matches(event):
+                continue
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # Its loop is closed: the subscriber is gone.
+                self.unsubscribe(subscription)
+
+    def _on_message(self, message: dict) -> None:
+        try:
+            event = ChangeEvent.from_message(message)
+        except (KeyError, ValueError) as exc:
+            logging.warning(f"Ignoring malformed change event {message!r}: {exc}")
+            return
+        self.deliver(event)
+
+
+async def sse_stream(
+    broker: EventBroker,
+    subscription: Subscription,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat: float,
+) -> AsyncIterator[bytes]:
+    """
+    The subscription's events as Server-Sent Events ("change", with the event as
+    JSON data), with a comment every `heartbeat` seconds without one. A subscriber
+    that overflowed gets an "overflow" event and the stream ends: it should catch up
+    with GET /changes and reconnect. Always unsubscribes when done.
+    """
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                if await is_disconnected():
+                    return
+                yield b": keepalive\n\n"
+                continue
+            if event is OVERFLOW:
+                detail = b'{"detail":"Too far behind; resync with GET /changes"}'
+                yield b"event: overflow\ndata: " + detail + b"\n\n"
+                return
+            yield b"event: change\ndata: " + event.sse_data() + b"\n\n"
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def _bridge() -> Optional[EventBridge]:
+    if not settings.EVENTS_PG_NOTIFY:
+        return None
+    return PostgresBridge.from_url(os.getenv("DATABASE_URL", ""))
+
+
+change_events = EventBroker(queue_size=settings.EVENTS_QUEUE_SIZE, bridge=_bridge())
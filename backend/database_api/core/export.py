@@ -0,0 +1,71 @@
+import csv
+import io
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from fastapi.responses import StreamingResponse
+
+from backend.database_api.core.serialization import dumps
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _csv_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_batches(
+    batches: Iterable[Sequence[Sequence[Any]]],
+    fields: Sequence[str],
+    fmt: ExportFormat,
+) -> Iterator[bytes]:
+    """
+    One chunk of NDJSON lines (an object per row) or CSV records per batch of rows.
+    CSV starts with a header chunk of the field names.
+    """
+    if fmt is ExportFormat.NDJSON:
+        for rows in batches:
+            yield b"".join(dumps(dict(zip(fields, row))) + b"\n" for row in rows)
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    yield buffer.getvalue().encode()
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(v) for v in row] for row in rows)
+        yield buffer.getvalue().encode()
+
+
+def as_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    A client-supplied datetime in the form timestamps are stored in (naive UTC).
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def export_response(
+    chunks: Iterator[bytes], fmt: ExportFormat, name: str
+) -> StreamingResponse:
+    """
+    Stream chunks as a download named `name`.<format>.
+    """
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt.value}"'},
+    )
@@ -0,0 +1,124 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import Request
+
+
+class InvalidCursorError(ValueError):
+    """
+    Raised when a client sends a cursor that was not produced by encode_cursor
+    (or, for the change feed, encode_change_cursor).
+    """
+
+
+def _encode(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+    if not isinstance(payload, dict):
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return payload
+
+
+def _is_id(value: Any) -> bool:
+    # bool is a subclass of int, but true/false is no row id.
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode the id of the last row on a page into an opaque, URL-safe cursor.
+    """
+    return _encode({"id": last_id})
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor produced by encode_cursor back into the id to resume after.
+    """
+    last_id = _decode(cursor).get("id")
+    if not _is_id(last_id):
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return last_id
+
+
+def paginate(rows: Sequence[Any], limit: int) -> tuple[list[Any], Optional[str]]:
+    """
+    Split rows fetched with `limit + 1` into the page itself and the cursor for
+    the next page (None when this is the last page).
+    """
+    if len(rows) <= limit:
+        return list(rows), None
+    page = list(rows[:limit])
+    return page, encode_cursor(page[-1].id)
+
+
+# OpenAPI responses of the paged list routes: the headers that tell a client its
+# list was cut at `limit` are part of their documented contract.
+PAGE_RESPONSES = {
+    200: {
+        "headers": {
+            "X-Next-Cursor": {
+                "description": "Cursor of the next page; absent on the last page.",
+                "schema": {"type": "string"},
+            },
+            "Link": {
+                "description": 'URL of the next page (rel="next"); absent on the '
+                "last page.",
+                "schema": {"type": "string"},
+            },
+        }
+    }
+}
+
+
+def page_headers(request: Request, next_cursor: Optional[str]) -> Optional[dict]:
+    """
+    Headers announcing the page after this one, if any: X-Next-Cursor, and a Link
+    to the same request resumed at that cursor (rel="next"), which generic HTTP
+    clients know to follow.
+    """
+    if not next_cursor:
+        return None
+    next_url = request.url.include_query_params(cursor=next_cursor)
+    return {"X-Next-Cursor": next_cursor, "Link": f'<{next_url}>; rel="next"'}
+
+
+# Position in the change feed: (changed_at, source, id) of the last change read.
+ChangePosition = tuple[datetime, str, int]
+
+
+def encode_change_cursor(position: ChangePosition) -> str:
+    """
+    Encode a change feed position into an opaque, URL-safe cursor.
+    """
+    changed_at, source, row_id = position
+    return _encode({"at": changed_at.isoformat(), "src": source, "id": row_id})
+
+
+def decode_change_cursor(cursor: str) -> ChangePosition:
+    """
+    Decode a cursor produced by encode_change_cursor back into the position to
+    resume after.
+    """
+    payload = _decode(cursor)
+    source, row_id = payload.get("src"), payload.get("id")
+    if not isinstance(source, str) or not _is_id(row_id):
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    try:
+        changed_at = datetime.fromisoformat(payload.get("at"))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+    if changed_at.tzinfo is not None:
+        # Positions are naive UTC, like the timestamps they are compared with.
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return changed_at, source, row_id
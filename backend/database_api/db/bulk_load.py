@@ -0,0 +1,59 @@
+import csv
+import io
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import Table, column, insert, select, table, text
+from sqlalchemy.orm import Session
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _copy_merge(db: Session, target: Table, columns: list[str], rows: list[dict]):
+    staging_name = f"{target.name}_import_staging"
+    names = ", ".join(columns)
+    # Only the imported columns: ids and timestamps come from the target's defaults.
+    db.execute(
+        text(
+            f"CREATE TEMP TABLE {staging_name} ON COMMIT DROP AS "
+            f"SELECT {names} FROM {target.name} WITH NO DATA"
+        )
+    )
+    buffer = io.StringIO()
+    # Quote every field: in COPY's CSV format an unquoted empty field is NULL.
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+    writer.writerows([_copy_value(row[name]) for name in columns] for row in rows)
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {staging_name} ({names}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+    finally:
+        cursor.close()
+
+    staging = table(staging_name, *(column(name) for name in columns))
+    db.execute(insert(target).from_select(columns, select(*staging.c)))
+
+
+def load_rows(db: Session, target: Table, rows: list[dict]) -> None:
+    """
+    Insert rows (dicts with the same keys) into target within the session's current
+    transaction; the caller commits.
+    Postgres streams them with COPY into a temporary staging table, then merges it
+    into target with one INSERT ... SELECT, so column defaults and constraints apply
+    as for any insert. Other databases get a plain executemany INSERT.
+    """
+    if not rows:
+        return
+    if db.get_bind().dialect.name == "postgresql":
+        _copy_merge(db, target, list(rows[0]), rows)
+        return
+    db.execute(insert(target), rows)
@@ -1,7 +1,94 @@
 import os
+from abc import ABC, abstractmethod
+from typing import Callable, TypeVar
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+from starlette.concurrency import run_in_threadpool
+
+from backend.database_api.core.config import settings
+from backend.database_api.db.pool_metrics import (
+    PoolMetrics,
+    instrumented_pool_class,
+    pool_status,
+)
+
+T = TypeVar("T")
+
+# Async driver for each sync backend accepted in DATABASE_URL.
+ASYNC_DRIVERS: dict[str, str] = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """
+    Rewrite a sync DATABASE_URL (e.g. postgresql://...) to its async driver.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise RuntimeError(f"No async driver configured for '{backend}' databases.")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+def engine_options(database_url: str, pool_class: type[Pool]) -> dict:
+    """
+    create_engine keyword arguments for the pool settings in core/config.Settings.
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": pool_class,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+class SessionRunner(ABC):
+    """
+    Runs session-bound work, `fn(session)`, for one request without blocking the event loop.
+    """
+
+    @abstractmethod
+    async def run(self, fn: Callable[[Session], T]) -> T: ...
+
+
+class ThreadpoolSessionRunner(SessionRunner):
+    """
+    Sync engine: the work runs in Starlette's threadpool, as sync routes would.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        return await run_in_threadpool(fn, self.session)
+
+
+class AsyncSessionRunner(SessionRunner):
+    """
+    Async engine: the same sync repository code runs via AsyncSession.run_sync, in a
+    greenlet on the event loop; the driver's IO is awaited rather than blocking a
+    threadpool thread. There are no separate async repositories: this mode only
+    changes where the waiting happens (aiosqlite still uses one thread per connection).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        return await self.session.run_sync(fn)
 
 
 class Database:
@@ -10,12 +97,56 @@ class Database:
         if not self.database_url:
             raise RuntimeError("DATABASE_URL environment variable is not set.")
 
-        self.engine = create_engine(self.database_url)
+        # Checkout metrics for the engine that serves requests (see request_engine).
+        self.pool_metrics = PoolMetrics()
+
+        sync_pool = QueuePool
+        if not settings.DB_ASYNC:
+            sync_pool = instrumented_pool_class(QueuePool, self.pool_metrics)
+        self.engine = create_engine(
+            self.database_url, **engine_options(self.database_url, sync_pool)
+        )
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
+        self.async_engine = None
+        self.AsyncSessionLocal = None
+        if settings.DB_ASYNC:
+            async_url = to_async_url(self.database_url)
+            async_pool = instrumented_pool_class(
+                AsyncAdaptedQueuePool, self.pool_metrics
+            )
+            self.async_engine = create_async_engine(
+                async_url, **engine_options(async_url, async_pool)
+            )
+            self.AsyncSessionLocal = async_sessionmaker(
+                autoflush=False, bind=self.async_engine
+            )
         self.Base = declarative_base()
 
+    @property
+    def request_engine(self):
+        """
+        The sync Engine whose connections serve API requests (for events and instrumentation).
+        """
+        if self.async_engine is not None:
+            return self.async_engine.sync_engine
+        return self.engine
+
+    def pool_status(self) -> dict:
+        """
+        Live statistics of the request engine's connection pool and its configuration.
+        """
+        status = pool_status(self.request_engine.pool, self.pool_metrics)
+        status["config"] = {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }
+        return status
+
     def get_db(self) -> Session:
         """
         FastAPI dependency for DB session
@@ -26,12 +157,38 @@ class Database:
         finally:
             db.close()
 
+    async def get_runner(self) -> SessionRunner:
+        """
+        FastAPI dependency for a request-scoped SessionRunner.
+        Uses the async engine when DB_ASYNC is set, otherwise the sync engine in the threadpool.
+        """
+        if self.AsyncSessionLocal is not None:
+            async with self.AsyncSessionLocal() as session:
+                yield AsyncSessionRunner(session)
+            return
+
+        db = self.SessionLocal()
+        try:
+            yield ThreadpoolSessionRunner(db)
+        finally:
+            # A session that never began a transaction (e.g. the request was
+            # answered from the cache) has no connection to release.
+            if db.in_transaction():
+                await run_in_threadpool(db.close)
+            else:
+                db.close()
+
     def init_db(self):
         """
-        Creates all tables in the db according to models inheriting from Base.
+        Creates all tables in the db according to models inheriting from Base,
+        then applies pending migrations (indexes and other changes create_all
+        cannot make to existing tables).
         Call ONCE for initial setup.
         """
+        from backend.database_api.db.migrations import run_migrations
+
         self.Base.metadata.create_all(bind=self.engine)
+        run_migrations(self.engine)
 
 
 # Create a single instance for use throughout the app
@@ -0,0 +1,295 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, func, select, text
+from sqlalchemy.engine import Connection, Engine
+
+# Arbitrary key for pg_advisory_lock so concurrent workers don't migrate at the same time.
+MIGRATION_LOCK_ID: int = 72_410_001
+
+migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", String, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False, default=func.now()),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    One versioned schema change.
+    `statements` maps a dialect name (engine.dialect.name) to the SQL to run on it.
+    A dialect without an entry has nothing to do and the migration is recorded as applied,
+    which is how Postgres-only features (e.g. pg_trgm) degrade gracefully on SQLite.
+    Set `transactional=False` for statements that cannot run inside a transaction,
+    such as CREATE INDEX CONCURRENTLY.
+    `run`, when set, is called with the connection after the statements, for data
+    changes written with SQLAlchemy instead of per-dialect SQL.
+    """
+
+    version: str
+    description: str
+    statements: dict[str, list[str]] = field(default_factory=dict)
+    transactional: bool = True
+    run: Optional[Callable[[Connection], None]] = None
+
+
+def create_index(name: str, table: str, columns: str) -> dict[str, list[str]]:
+    """
+    Per-dialect statements for a plain B-tree index. Postgres builds it CONCURRENTLY
+    so existing tables stay writable, which requires a non-transactional Migration.
+    """
+    return {
+        "postgresql": [
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})"
+        ],
+        "sqlite": [f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"],
+    }
+
+
+def _backfill_project_stats(conn: Connection) -> None:
+    from backend.database_api.db.repositories.project_stats_repository import (
+        missing_project_ids,
+        rebuild_statements,
+    )
+
+    for statement in rebuild_statements(missing_project_ids()):
+        conn.execute(statement)
+
+
+def _merge(*statement_maps: dict[str, list[str]]) -> dict[str, list[str]]:
+    merged: dict[str, list[str]] = {}
+    for statements in statement_maps:
+        for dialect, sql in statements.items():
+            merged.setdefault(dialect, []).extend(sql)
+    return merged
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(
+        version="0001",
+        description="pg_trgm GIN indexes for substring search on names, titles and assignees",
+        statements={
+            "postgresql": [
+                "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_projects_name_trgm "
+                "ON projects USING gin (name gin_trgm_ops)",
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_title_trgm "
+                "ON tasks USING gin (title gin_trgm_ops)",
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_assigned_to_trgm "
+                "ON tasks USING gin (assigned_to gin_trgm_ops)",
+            ],
+        },
+        transactional=False,
+    ),
+    Migration(
+        version="0002",
+        description="Composite indexes for the TaskRepository.list filter combinations",
+        statements=_merge(
+            # Foreign key + keyset pagination within a project (also serves cascades).
+            create_index("ix_tasks_project_id_id", "tasks", "project_id, id"),
+            create_index(
+                "ix_tasks_project_id_status_id", "tasks", "project_id, status, id"
+            ),
+            create_index("ix_tasks_status_assigned_to", "tasks", "status, assigned_to"),
+            create_index("ix_tasks_due_date", "tasks", "due_date"),
+        ),
+        transactional=False,
+    ),
+    Migration(
+        version="0003",
+        description="Partial index on open tasks for per-project overdue counts",
+        statements={
+            "postgresql": [
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                "ix_tasks_open_project_id_due_date "
+                "ON tasks (project_id, due_date) WHERE status <> 'complete'"
+            ],
+            "sqlite": [
+                "CREATE INDEX IF NOT EXISTS ix_tasks_open_project_id_due_date "
+                "ON tasks (project_id, due_date) WHERE status <> 'complete'"
+            ],
+        },
+        transactional=False,
+    ),
+    Migration(
+        version="0004",
+        description="Backfill project_stats for projects created before it existed",
+        run=_backfill_project_stats,
+    ),
+    Migration(
+        version="0005",
+        description="(last_modified, id) indexes for the change feed",
+        statements=_merge(
+            create_index(
+                "ix_projects_last_modified_id", "projects", "last_modified, id"
+            ),
+            create_index("ix_tasks_last_modified_id", "tasks", "last_modified, id"),
+        ),
+        transactional=False,
+    ),
+    Migration(
+        version="0006",
+        description="Status and status + assignee indexes the assignee filter can use",
+        # The assignee filter is an unanchored ILIKE, which no B-tree serves (on the
+        # column or on lower() of it): ix_tasks_status_assigned_to only ever served
+        # status. (status, id) does that and keeps keyset order; on Postgres a GIN
+        # index over status and the assignee's trigrams serves both predicates.
+        statements=_merge(
+            create_index("ix_tasks_status_id", "tasks", "status, id"),
+            {
+                "postgresql": [
+                    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+                    "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                    "ix_tasks_status_assigned_to_trgm "
+                    "ON tasks USING gin (status, assigned_to gin_trgm_ops)",
+                    "DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_status_assigned_to",
+                ],
+                "sqlite": ["DROP INDEX IF EXISTS ix_tasks_status_assigned_to"],
+            },
+        ),
+        transactional=False,
+    ),
+]
+
+
+def applied_versions(conn: Connection) -> set[str]:
+    return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def pending_migrations(engine: Engine) -> list[Migration]:
+    migration_metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        done = applied_versions(conn)
+    return [m for m in MIGRATIONS if m.version not in done]
+
+
+def invalid_indexes(engine: Engine) -> list[str]:
+    """
+    Indexes left INVALID by an interrupted CREATE INDEX CONCURRENTLY (Postgres only).
+    Drop them and re-run the migration that creates them.
+    """
+    if engine.dialect.name != "postgresql":
+        return []
+    with engine.connect() as conn:
+        return list(
+            conn.execute(
+                text(
+                    "SELECT c.relname FROM pg_index i "
+                    "JOIN pg_class c ON c.oid = i.indexrelid "
+                    "WHERE NOT i.indisvalid"
+                )
+            ).scalars()
+        )
+
+
+def _apply(engine: Engine, migration: Migration) -> None:
+    statements = migration.statements.get(engine.dialect.name, [])
+    if migration.transactional:
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+            if migration.run is not None:
+                migration.run(conn)
+            conn.execute(
+                schema_migrations.insert().values(
+                    version=migration.version, description=migration.description
+                )
+            )
+        return
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+        if migration.run is not None:
+            migration.run(conn)
+        conn.execute(
+            schema_migrations.insert().values(
+                version=migration.version, description=migration.description
+            )
+        )
+
+
+def run_migrations(engine: Engine) -> list[str]:
+    """
+    Apply every migration in MIGRATIONS that is not yet recorded in schema_migrations.
+    Returns the versions applied by this call.
+    """
+    migration_metadata.create_all(bind=engine)
+    is_postgres = engine.dialect.name == "postgresql"
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        if is_postgres:
+            lock_conn.execute(
+                text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID}
+            )
+        try:
+            done = applied_versions(lock_conn)
+            applied = []
+            for migration in MIGRATIONS:
+                if migration.version in done:
+                    continue
+                logging.info(
+                    f"Applying migration {migration.version}: {migration.description}"
+                )
+                _apply(engine, migration)
+                applied.append(migration.version)
+            return applied
+        finally:
+            if is_postgres:
+                lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID}
+                )
+
+
+def main() -> None:
+    """
+    Command line entry point:
+        python -m backend.database_api.db.migrations status
+        python -m backend.database_api.db.migrations upgrade
+        python -m backend.database_api.db.migrations rebuild-stats
+    """
+    import argparse
+
+    # Imported for its side effect: registers the tables on database.Base.metadata.
+    from backend.database_api.db import models  # noqa: F401
+    from backend.database_api.db.connection import database
+
+    parser = argparse.ArgumentParser(description="Manage schema migrations and indexes.")
+    parser.add_argument("command", choices=["status", "upgrade", "rebuild-stats"])
+    args = parser.parse_args()
+
+    if args.command == "rebuild-stats":
+        # Repairs drift, e.g. after tasks were changed with SQL outside the API.
+        from backend.database_api.db.repositories.project_stats_repository import (
+            rebuild_statements,
+        )
+
+        with database.engine.begin() as conn:
+            remove, recompute = rebuild_statements()
+            conn.execute(remove)
+            rows = conn.execute(recompute).rowcount
+        print(f"Rebuilt project_stats for {rows} project(s)")
+        return
+
+    if args.command == "upgrade":
+        database.Base.metadata.create_all(bind=database.engine)
+        applied = run_migrations(database.engine)
+        print(f"Applied: {', '.join(applied) or 'nothing to do'}")
+        return
+
+    pending = {m.version for m in pending_migrations(database.engine)}
+    for migration in MIGRATIONS:
+        state = "pending" if migration.version in pending else "applied"
+        print(f"{migration.version}  {state:<8} {migration.description}")
+    for index in invalid_indexes(database.engine):
+        print(f"INVALID index {index}: drop it and run upgrade again")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -37,3 +37,36 @@ class Task(database.Base):
     )
 
     project = relationship("Project", back_populates="tasks")
+
+
+class ProjectStats(database.Base):
+    # Task counters of one project, changed by every task write in the same
+    # transaction (see ProjectStatsRepository), so reading them is O(1) per project.
+    __tablename__ = "project_stats"
+
+    project_id = Column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    task_count = Column(Integer, nullable=False, default=0)
+    # One counter per TaskStatus, named after the member (TaskStatus.TO_DO: to_do).
+    to_do = Column(Integer, nullable=False, default=0)
+    in_progress = Column(Integer, nullable=False, default=0)
+    pending_approval = Column(Integer, nullable=False, default=0)
+    block = Column(Integer, nullable=False, default=0)
+    complete = Column(Integer, nullable=False, default=0)
+    last_activity = Column(DateTime, nullable=False, default=func.now())
+
+
+class Tombstone(database.Base):
+    # One row per deleted project or task, written in the deleting transaction (see
+    # ChangeRepository), so the change feed can report deletes as well as upserts.
+    __tablename__ = "tombstones"
+    __table_args__ = (Index("ix_tombstones_deleted_at_id", "deleted_at", "id"),)
+
+    id = Column(Integer, primary_key=True)
+    # "project" or "task".
+    entity = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    # The deleted task's project; None for projects.
+    project_id = Column(Integer)
+    deleted_at = Column(DateTime, nullable=False, default=func.now())
@@ -0,0 +1,94 @@
+import math
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram buckets, Prometheus style (cumulative).
+WAIT_BUCKETS_MS: tuple[float, ...] = (
+    1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, math.inf,
+)
+
+
+class PoolMetrics:
+    """
+    Thread-safe counters for connection checkouts: how many, how long each waited
+    for a connection, and how many gave up with a pool timeout.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_sum_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_buckets = [0] * len(WAIT_BUCKETS_MS)
+
+    def observe(self, wait_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_sum_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            for i, bound in enumerate(WAIT_BUCKETS_MS):
+                if wait_ms <= bound:
+                    self.wait_buckets[i] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms": {
+                    "sum": round(self.wait_sum_ms, 3),
+                    "max": round(self.wait_max_ms, 3),
+                    "buckets": {
+                        ("+Inf" if math.isinf(b) else f"{b:g}"): count
+                        for b, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)
+                    },
+                },
+            }
+
+
+def instrumented_pool_class(base: type[Pool], metrics: PoolMetrics) -> type[Pool]:
+    """
+    Subclass a pool so every checkout reports its wait time to `metrics`.
+    Pool.connect() is where a request blocks when the pool is exhausted.
+    """
+
+    class InstrumentedPool(base):
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                connection = super().connect()
+            except exc.TimeoutError:
+                metrics.observe((time.perf_counter() - start) * 1000, timed_out=True)
+                raise
+            metrics.observe((time.perf_counter() - start) * 1000)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def pool_status(pool: Pool, metrics: PoolMetrics) -> dict:
+    """
+    Live occupancy of a pool plus its accumulated checkout metrics.
+    """
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            timeout_s=pool.timeout(),
+        )
+    status.update(metrics.snapshot())
+    return status
@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Row,
+    Select,
+    and_,
+    delete,
+    insert,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+
+from backend.database_api.core.pagination import ChangePosition
+from backend.database_api.db.models import Project, Task, Tombstone
+from backend.database_api.enum.change import ChangeEntity
+
+# Tables the change feed reads, by source name, with the (changed_at, id) pair each
+# is ordered by. Within one changed_at, changes sort by source name, then id.
+SOURCES = {
+    "project": (Project.last_modified, Project.id),
+    "task": (Task.last_modified, Task.id),
+    "tombstone": (Tombstone.deleted_at, Tombstone.id),
+}
+
+# SQLite stores now() as text without fractional seconds and compares it as text,
+# so positions are bound in that format too: every changed_at comes from now().
+_CHANGED_AT = DateTime().with_variant(
+    sqlite.DATETIME(truncate_microseconds=True), "sqlite"
+)
+
+
+def _at(value: datetime):
+    return literal(value, _CHANGED_AT)
+
+
+def _after(source: str, position: ChangePosition):
+    """
+    WHERE clause for the rows of `source` that sort after `position`, written per
+    source so each stays a range scan of its (changed_at, id) index.
+    """
+    changed_at, row_id = SOURCES[source]
+    after_at, after_source, after_id = position
+    after_at = _at(after_at)
+    if source > after_source:
+        return changed_at >= after_at
+    if source < after_source:
+        return changed_at > after_at
+    return or_(changed_at > after_at, and_(changed_at == after_at, row_id > after_id))
+
+
+class ChangeRepository:
+    """
+    Tombstones for deleted rows, and the rows of each source changed after a
+    position, for the change feed.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_deletes(
+        self, entity: ChangeEntity, deleted: Iterable[tuple[int, Optional[int]]]
+    ) -> None:
+        """
+        Add a tombstone per deleted (id, project_id) to the current transaction; the
+        caller commits, so the tombstones appear exactly when the deletes do.
+        """
+        rows = [
+            {"entity": entity.value, "entity_id": row_id, "project_id": project_id}
+            for row_id, project_id in deleted
+        ]
+        if rows:
+            self.db.execute(insert(Tombstone), rows)
+
+    def prune_tombstones(self, before: datetime) -> int:
+        """
+        Delete and commit the tombstones of deletes made before `before`. Returns the
+        number of tombstones deleted.
+        """
+        result = self.db.execute(
+            delete(Tombstone).where(Tombstone.deleted_at < _at(before))
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def changed_rows(
+        self,
+        source: str,
+        columns: Sequence[Column],
+        after: Optional[ChangePosition],
+        until: datetime,
+        limit: int,
+    ) -> list[Row]:
+        """
+        (changed_at, id, *columns) of the first `limit` rows of `source` changed
+        after `after` (from the start when None) and before `until`, in feed order.
+        """
+        return self.db.execute(
+            self.changed_query(source, columns, after, until, limit)
+        ).all()
+
+    @staticmethod
+    def changed_query(
+        source: str,
+        columns: Sequence[Column],
+        after: Optional[ChangePosition],
+        until: datetime,
+        limit: int,
+    ) -> Select:
+        changed_at, row_id = SOURCES[source]
+        query = select(changed_at, row_id, *columns).where(changed_at < _at(until))
+        if after is not None:
+            query = query.where(_after(source, after))
+        return query.order_by(changed_at, row_id).limit(limit)
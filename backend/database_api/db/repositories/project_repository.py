@@ -1,22 +1,62 @@
-from typing import Optional
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterator, Optional, Sequence
 
-from backend.database_api.db.models import Project
+from sqlalchemy import Column, Row, and_, func, literal_column, select
+from sqlalchemy.orm import Query, Session, noload, selectinload
+
+from backend.database_api.db.bulk_load import load_rows
+from backend.database_api.db.models import Project, ProjectStats, Task
+from backend.database_api.db.repositories.change_repository import ChangeRepository
+from backend.database_api.db.repositories.project_stats_repository import (
+    STATUS_COLUMNS,
+    ProjectStatsRepository,
+    missing_project_ids,
+)
+from backend.database_api.enum.change import ChangeEntity
+
+# Written as a literal so the planner can match the WHERE clause of the partial
+# index ix_tasks_open_project_id_due_date (a bound parameter cannot be).
+_IS_OPEN = Task.status != literal_column("'complete'")
+
+
+def _tasks_loader(include_tasks: bool):
+    """
+    Loading strategy for Project.tasks: one batched SELECT ... WHERE project_id IN (...)
+    for the whole result, or no load at all when the caller does not need tasks.
+    """
+    return selectinload(Project.tasks) if include_tasks else noload(Project.tasks)
 
 
 class ProjectRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.stats = ProjectStatsRepository(db)
+        self.changes = ChangeRepository(db)
 
     def create(self, obj_in: dict) -> Project:
         db_project = Project(**obj_in)
         self.db.add(db_project)
+        self.db.flush()
+        # Computed rather than inserted as zeros: replaces a row left behind for a
+        # reused id (SQLite) by a delete that bypassed the API.
+        self.stats.rebuild([db_project.id])
         self.db.commit()
         self.db.refresh(db_project)
         return db_project
 
     def get(self, project_id: int) -> Project:
-        return self.db.query(Project).filter(Project.id == project_id).first()
+        return (
+            self.db.query(Project)
+            .options(_tasks_loader(include_tasks=True))
+            .filter(Project.id == project_id)
+            .first()
+        )
+
+    def get_row(self, project_id: int, columns: Sequence[Column]) -> Optional[Row]:
+        """
+        Only `columns` of one project (without its tasks), as a plain row.
+        """
+        return self.db.query(*columns).filter(Project.id == project_id).first()
 
     def update(self, db_project: Project, obj_in: dict) -> Project:
         for key, value in obj_in.items():
@@ -25,14 +65,148 @@ class ProjectRepository:
         self.db.refresh(db_project)
         return db_project
 
-    def delete(self, db_project: Project) -> None:
+    def delete(self, db_project: Project) -> list[int]:
+        """
+        Delete the project and its tasks; returns the ids of the deleted tasks.
+        """
+        # Tombstones for the project and for the tasks deleted with it.
+        tasks = self.db.execute(
+            select(Task.id, Task.project_id).where(Task.project_id == db_project.id)
+        ).all()
+        self.changes.record_deletes(ChangeEntity.TASK, tasks)
+        self.changes.record_deletes(ChangeEntity.PROJECT, [(db_project.id, None)])
+        self.stats.remove(db_project.id)
         self.db.delete(db_project)
         self.db.commit()
+        return [task.id for task in tasks]
+
+    def import_rows(self, rows: list[dict]) -> list[int]:
+        """
+        Insert and commit a chunk of imported rows (COPY on Postgres, see load_rows)
+        with their stats rows. Returns the ids of the new projects.
+        """
+        last_id = self.db.scalar(select(func.max(Project.id))) or 0
+        load_rows(self.db, Project.__table__, rows)
+        # New ids come after the largest one, so only that range can lack stats
+        # rows; searching every project per chunk would make imports quadratic.
+        new_ids = missing_project_ids().where(Project.id > last_id)
+        project_ids = list(self.db.scalars(new_ids))
+        self.stats.rebuild(new_ids)
+        self.db.commit()
+        return project_ids
+
+    def list_rows(
+        self,
+        columns: Sequence[Column],
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[Row]:
+        """
+        Same as list() without tasks, but selects only `columns` and returns plain
+        rows, so no ORM objects are built for large pages.
+        """
+        query = self.db.query(*columns)
+        return self._filtered(query, name, status, after_id, limit).all()
+
+    def export_batches(
+        self,
+        columns: Sequence[Column],
+        batch_size: int,
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        modified_since: Optional[datetime] = None,
+    ) -> Iterator[Sequence[Row]]:
+        """
+        `columns` of every matching project, ordered by id, in batches of batch_size
+        rows read through a server-side cursor (yield_per).
+        """
+        query = self._filtered(self.db.query(*columns), name, status, None, None)
+        if modified_since is not None:
+            query = query.filter(Project.last_modified >= modified_since)
+        statement = query.statement.execution_options(yield_per=batch_size)
+        yield from self.db.execute(statement).partitions()
+
+    def summary_rows(self, now: datetime, **filters) -> list[Row]:
+        return self.summary_query(now, **filters).all()
+
+    def summary_query(
+        self,
+        now: datetime,
+        project_id: Optional[int] = None,
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Query:
+        """
+        Query for one row per matching project, ordered by id: id, name, status,
+        task count and one count per TaskStatus (in enum order) from project_stats,
+        count of open tasks due before now, earliest due date of open tasks at or
+        after now, and last activity. The counters are O(1) per project; the two
+        due-date columns depend on the clock, so they are read from the partial
+        index over open tasks (one range of it per project).
+        """
+        open_tasks = and_(Task.project_id == Project.id, _IS_OPEN)
+        overdue = select(func.count(Task.id)).where(open_tasks, Task.due_date < now)
+        next_due = select(func.min(Task.due_date)).where(
+            open_tasks, Task.due_date >= now
+        )
+        columns = [
+            Project.id,
+            Project.name,
+            Project.status,
+            ProjectStats.task_count,
+            *STATUS_COLUMNS.values(),
+            overdue.scalar_subquery(),
+            next_due.scalar_subquery(),
+            ProjectStats.last_activity,
+        ]
+        query = self.db.query(*columns).outerjoin(
+            ProjectStats, ProjectStats.project_id == Project.id
+        )
+        if project_id is not None:
+            query = query.filter(Project.id == project_id)
+        return self._filtered(query, name, status, after_id, limit)
+
+    def task_rows(self, columns: Sequence[Column], project_ids: list[int]) -> list[Row]:
+        """
+        `columns` of the tasks of the given projects, as plain rows ordered by id:
+        the rows-only counterpart of loading Project.tasks.
+        """
+        if not project_ids:
+            return []
+        return self.db.execute(
+            select(*columns).where(Task.project_id.in_(project_ids)).order_by(Task.id)
+        ).all()
+
+    def list(
+        self,
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        include_tasks: bool = True,
+    ) -> list[Project]:
+        query = self.db.query(Project).options(_tasks_loader(include_tasks))
+        return self._filtered(query, name, status, after_id, limit).all()
 
-    def list(self, name: Optional[str] = None, status: Optional[str] = None) -> list[Project]:
-        query = self.db.query(Project)
+    @staticmethod
+    def _filtered(
+        query: Query,
+        name: Optional[str],
+        status: Optional[str],
+        after_id: Optional[int],
+        limit: Optional[int],
+    ) -> Query:
         if name:
             query = query.filter(Project.name.ilike(f"%{name}%"))
         if status:
             query = query.filter(Project.status == status)
-        return query.all()
+        if after_id is not None:
+            query = query.filter(Project.id > after_id)
+        query = query.order_by(Project.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
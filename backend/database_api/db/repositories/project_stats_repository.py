@@ -0,0 +1,143 @@
+from collections import Counter
+from typing import Iterable, Optional, Union
+
+from sqlalchemy import (
+    Delete,
+    Insert,
+    Select,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from backend.database_api.db.models import Project, ProjectStats, Task
+from backend.database_api.enum.status import TaskStatus
+
+_stats = ProjectStats.__table__
+
+# Counter column of each TaskStatus.
+STATUS_COLUMNS = {status: _stats.c[status.name.lower()] for status in TaskStatus}
+
+# (project_id, status) of a task before or after a write.
+TaskKey = tuple[Optional[int], str]
+
+# INSERT constructs with ON CONFLICT support, by dialect name.
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def task_deltas(
+    removed: Iterable[TaskKey] = (), added: Iterable[TaskKey] = ()
+) -> dict[int, Counter]:
+    """
+    Change of each project's per-status counts when the `removed` tasks leave their
+    (project_id, status) and the `added` ones enter theirs. An update is both.
+    """
+    deltas: dict[int, Counter] = {}
+    for sign, keys in ((-1, removed), (1, added)):
+        for project_id, status in keys:
+            if project_id is not None:
+                deltas.setdefault(project_id, Counter())[TaskStatus(status)] += sign
+    return deltas
+
+
+def rebuild_statements(
+    project_ids: Union[list[int], Select, None] = None, insert=insert
+) -> tuple[Delete, Insert]:
+    """
+    DELETE and INSERT ... SELECT recomputing the stats rows of the given projects
+    (a list or a SELECT of ids; every project when None) from their tasks.
+    `insert` may be a dialect's insert(), for an INSERT that takes ON CONFLICT.
+    """
+    counts = [
+        func.count(Task.id),
+        *(func.count(case((Task.status == s.value, Task.id))) for s in TaskStatus),
+        func.coalesce(func.max(Task.last_modified), Project.last_modified),
+    ]
+    computed = (
+        select(Project.id, *counts)
+        .outerjoin(Task, Task.project_id == Project.id)
+        .group_by(Project.id, Project.last_modified)
+    )
+    remove = delete(_stats)
+    if project_ids is not None:
+        computed = computed.where(Project.id.in_(project_ids))
+        remove = remove.where(_stats.c.project_id.in_(project_ids))
+    columns = [
+        "project_id",
+        "task_count",
+        *(column.name for column in STATUS_COLUMNS.values()),
+        "last_activity",
+    ]
+    return remove, insert(_stats).from_select(columns, computed)
+
+
+def missing_project_ids() -> Select:
+    """
+    Ids of the projects that have no stats row.
+    """
+    has_stats = select(_stats.c.project_id).where(_stats.c.project_id == Project.id)
+    return select(Project.id).where(~has_stats.exists())
+
+
+class ProjectStatsRepository:
+    """
+    Maintains project_stats within the caller's transaction: the task repository
+    flushes its write, applies the deltas here, then commits both together.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(self, deltas: dict[int, Counter]) -> None:
+        """
+        Add deltas to each project's counters and move its last_activity to now.
+        Projects are updated in id order, so concurrent writers touching several
+        projects lock their rows in the same order. A project without a stats row
+        gets one computed from its (already flushed) tasks instead.
+        """
+        for project_id in sorted(deltas):
+            changes = deltas[project_id]
+            values = {
+                STATUS_COLUMNS[status].name: STATUS_COLUMNS[status] + delta
+                for status, delta in changes.items()
+                if delta
+            }
+            total = sum(changes.values())
+            if total:
+                values["task_count"] = _stats.c.task_count + total
+            values["last_activity"] = func.now()
+            result = self.db.execute(
+                update(_stats).where(_stats.c.project_id == project_id).values(values)
+            )
+            if result.rowcount == 0:
+                self._create_or_add(project_id, values)
+
+    def _create_or_add(self, project_id: int, values: dict) -> None:
+        """
+        Insert the missing stats row of a project, computed from its tasks, or, when
+        a concurrent writer inserted it first, apply `values` (the deltas) to that
+        row: its count came from a snapshot without this transaction's tasks.
+        One INSERT ... ON CONFLICT DO UPDATE, so neither writer gets a key violation.
+        """
+        dialect_insert = _UPSERT_INSERTS[self.db.get_bind().dialect.name]
+        _, recompute = rebuild_statements([project_id], insert=dialect_insert)
+        self.db.execute(
+            recompute.on_conflict_do_update(index_elements=["project_id"], set_=values)
+        )
+
+    def rebuild(self, project_ids: Union[list[int], Select, None] = None) -> int:
+        """
+        Recompute the stats rows of the given projects (all when None) from their
+        tasks. Returns the number of rows written.
+        """
+        remove, recompute = rebuild_statements(project_ids)
+        self.db.execute(remove)
+        return self.db.execute(recompute).rowcount
+
+    def remove(self, project_id: int) -> None:
+        self.db.execute(delete(_stats).where(_stats.c.project_id == project_id))
@@ -1,18 +1,46 @@
-from typing import Optional
+from datetime import datetime
+from typing import Iterator, Optional, Sequence
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Column, Row, delete, insert, select, update
+from sqlalchemy.orm import Query, Session
 
+from backend.database_api.db.bulk_load import load_rows
 from backend.database_api.db.models import Project, Task
+from backend.database_api.db.repositories.change_repository import ChangeRepository
+from backend.database_api.db.repositories.project_stats_repository import (
+    ProjectStatsRepository,
+    task_deltas,
+)
+from backend.database_api.enum.change import ChangeEntity
 from backend.database_api.enum.status import TaskStatus
 
 
+def _paged(query: Query, after_id: Optional[int], limit: Optional[int]) -> Query:
+    if after_id is not None:
+        query = query.filter(Task.id > after_id)
+    query = query.order_by(Task.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
 class TaskRepository:
+    """
+    Every write also updates project_stats (see ProjectStatsRepository) before it
+    commits, so the counters change in the same transaction as the tasks. Deletes
+    leave tombstones for the change feed (see ChangeRepository) the same way.
+    """
+
     def __init__(self, db: Session):
         self.db = db
+        self.stats = ProjectStatsRepository(db)
+        self.changes = ChangeRepository(db)
 
     def create(self, obj_in: dict) -> Task:
         db_task = Task(**obj_in)
         self.db.add(db_task)
+        self.db.flush()
+        self.stats.apply(task_deltas(added=[(db_task.project_id, db_task.status)]))
         self.db.commit()
         self.db.refresh(db_task)
         return db_task
@@ -20,26 +48,124 @@ class TaskRepository:
     def get(self, task_id: int) -> Optional[Task]:
         return self.db.query(Task).filter(Task.id == task_id).first()
 
+    def get_row(self, task_id: int, columns: Sequence[Column]) -> Optional[Row]:
+        """
+        Only `columns` of one task, as a plain row.
+        """
+        return self.db.query(*columns).filter(Task.id == task_id).first()
+
     def update(self, db_task: Task, obj_in: dict) -> Task:
+        before = (db_task.project_id, db_task.status)
         for key, value in obj_in.items():
             setattr(db_task, key, value)
+        self.db.flush()
+        after = (db_task.project_id, db_task.status)
+        self.stats.apply(task_deltas(removed=[before], added=[after]))
         self.db.commit()
         self.db.refresh(db_task)
         return db_task
 
     def delete(self, db_task: Task) -> None:
         self.db.delete(db_task)
+        self.db.flush()
+        self.stats.apply(task_deltas(removed=[(db_task.project_id, db_task.status)]))
+        self.changes.record_deletes(
+            ChangeEntity.TASK, [(db_task.id, db_task.project_id)]
+        )
         self.db.commit()
 
-    def list(
+    def existing_ids(self, task_ids: list[int]) -> set[int]:
+        return set(self.db.scalars(select(Task.id).where(Task.id.in_(task_ids))))
+
+    def project_ids_by_task(self, task_ids: list[int]) -> dict[int, int]:
+        """
+        Current project_id of each of the given tasks that exists.
+        """
+        rows = self.db.execute(
+            select(Task.id, Task.project_id).where(Task.id.in_(task_ids))
+        )
+        return dict(rows.all())
+
+    def existing_project_ids(self, project_ids: list[int]) -> set[int]:
+        return set(
+            self.db.scalars(select(Project.id).where(Project.id.in_(project_ids)))
+        )
+
+    def bulk_create(self, rows: list[dict]) -> list[Row]:
+        """
+        Insert all rows in one transaction with batched INSERT ... RETURNING.
+        Returns plain rows in input order, so no per-object refresh is needed.
+        """
+        created = self.db.execute(
+            insert(Task).returning(*Task.__table__.c, sort_by_parameter_order=True),
+            rows,
+        ).all()
+        added = [(row.project_id, row.status) for row in created]
+        self.stats.apply(task_deltas(added=added))
+        self.db.commit()
+        return created
+
+    def bulk_update(self, rows: list[dict]) -> list[Row]:
+        """
+        Apply partial updates keyed by "id" in one transaction (executemany UPDATE),
+        then read the updated rows back with a single SELECT.
+        """
+        task_ids = [row["id"] for row in rows]
+        before = self.db.execute(
+            select(Task.project_id, Task.status).where(Task.id.in_(task_ids))
+        ).all()
+        changes = [row for row in rows if len(row) > 1]
+        if changes:
+            self.db.execute(update(Task), changes)
+        updated = self.db.execute(
+            select(*Task.__table__.c).where(Task.id.in_(task_ids)).order_by(Task.id)
+        ).all()
+        after = [(row.project_id, row.status) for row in updated]
+        self.stats.apply(task_deltas(removed=before, added=after))
+        self.db.commit()
+        return updated
+
+    def bulk_delete(self, task_ids: list[int]) -> list[Row]:
+        """
+        Delete all given tasks with one DELETE ... RETURNING.
+        """
+        deleted = self.db.execute(
+            delete(Task)
+            .where(Task.id.in_(task_ids))
+            .returning(*Task.__table__.c)
+            .execution_options(synchronize_session=False)
+        ).all()
+        removed = [(row.project_id, row.status) for row in deleted]
+        self.stats.apply(task_deltas(removed=removed))
+        self.changes.record_deletes(
+            ChangeEntity.TASK, [(row.id, row.project_id) for row in deleted]
+        )
+        self.db.commit()
+        return deleted
+
+    def import_rows(self, rows: list[dict]) -> None:
+        """
+        Insert and commit a chunk of imported rows (COPY on Postgres, see load_rows).
+        """
+        load_rows(self.db, Task.__table__, rows)
+        added = [(row["project_id"], row["status"]) for row in rows]
+        self.stats.apply(task_deltas(added=added))
+        self.db.commit()
+
+    def filtered_query(
         self,
         project_id: Optional[int] = None,
         project_name: Optional[str] = None,
         assigned_to: Optional[str] = None,
         status: Optional[TaskStatus] = None,
         title: Optional[str] = None,
-    ) -> list[Task]:
-        query = self.db.query(Task).options(joinedload(Task.project))
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+    ) -> Query:
+        """
+        Query for tasks matching the given filters, without ordering or paging.
+        """
+        query = self.db.query(Task)
         if project_id is not None:
             query = query.filter(Task.project_id == project_id)
         if project_name is not None:
@@ -52,4 +178,78 @@ class TaskRepository:
             query = query.filter(Task.status == status)
         if title is not None:
             query = query.filter(Task.title.ilike(f"%{title}%"))
-        return query.all()
+        if due_after is not None:
+            query = query.filter(Task.due_date >= due_after)
+        if due_before is not None:
+            query = query.filter(Task.due_date < due_before)
+        return query
+
+    def export_batches(
+        self,
+        columns: Sequence[Column],
+        batch_size: int,
+        modified_since: Optional[datetime] = None,
+        **filters,
+    ) -> Iterator[Sequence[Row]]:
+        """
+        `columns` of every task matching the filtered_query() filters, ordered by
+        id, in batches of batch_size rows read through a server-side cursor
+        (yield_per), so memory does not grow with the number of rows.
+        """
+        query = self.filtered_query(**filters).with_entities(*columns)
+        if modified_since is not None:
+            query = query.filter(Task.last_modified >= modified_since)
+        statement = query.order_by(Task.id).statement
+        result = self.db.execute(statement.execution_options(yield_per=batch_size))
+        yield from result.partitions()
+
+    def list_rows(
+        self,
+        columns: Sequence[Column],
+        project_id: Optional[int] = None,
+        project_name: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        title: Optional[str] = None,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[Row]:
+        """
+        Same as list(), but selects only `columns` and returns plain rows, so no ORM
+        objects are built for large pages.
+        """
+        query = self.filtered_query(
+            project_id=project_id,
+            project_name=project_name,
+            assigned_to=assigned_to,
+            status=status,
+            title=title,
+            due_after=due_after,
+            due_before=due_before,
+        ).with_entities(*columns)
+        return _paged(query, after_id, limit).all()
+
+    def list(
+        self,
+        project_id: Optional[int] = None,
+        project_name: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        title: Optional[str] = None,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[Task]:
+        query = self.filtered_query(
+            project_id=project_id,
+            project_name=project_name,
+            assigned_to=assigned_to,
+            status=status,
+            title=title,
+            due_after=due_after,
+            due_before=due_before,
+        )
+        return _paged(query, after_id, limit).all()
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class ChangeEntity(str, Enum):
+    PROJECT = "project"
+    TASK = "task"
+
+
+class ChangeOp(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
@@ -1,16 +1,31 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from backend.database_api.core.config import settings
 from backend.database_api.db.connection import database
-from backend.database_api.routers import projects, tasks
+from backend.database_api.routers import changes, internal, metrics, projects, tasks
+from backend.database_api.services.change_service import prune_periodically
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Tombstones older than CHANGES_RETENTION_SECONDS are pruned in the background.
+    pruner = asyncio.create_task(
+        prune_periodically(settings.CHANGES_PRUNE_INTERVAL_SECONDS)
+    )
+    yield
+    pruner.cancel()
+
+
 def create_app() -> FastAPI:
     """
         Factory function to create and configure the FastAPI app instance.
@@ -22,6 +37,7 @@ def create_app() -> FastAPI:
         title=settings.PROJECT_NAME,
         description=settings.DESCRIPTION,
         version=settings.VERSION,
+        lifespan=lifespan,
     )
 
     @app.exception_handler(Exception)
@@ -38,6 +54,9 @@ def create_app() -> FastAPI:
     # Include routers
     app.include_router(projects.router)
     app.include_router(tasks.router)
+    app.include_router(changes.router)
+    app.include_router(internal.router)
+    app.include_router(metrics.router)
 
     return app
 
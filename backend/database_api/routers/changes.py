@@ -0,0 +1,86 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+
+from backend.database_api.core.config import settings
+from backend.database_api.core.events import change_events, sse_stream
+from backend.database_api.core.pagination import InvalidCursorError
+from backend.database_api.db.connection import SessionRunner, database
+from backend.database_api.schemas.change import ChangePage
+from backend.database_api.services.change_service import (
+    AsyncChangeService,
+    ResyncRequiredError,
+)
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+
+def get_change_service(
+    runner: SessionRunner = Depends(database.get_runner),
+) -> AsyncChangeService:
+    return AsyncChangeService(runner)
+
+
+@router.get(
+    "/",
+    response_model=ChangePage,
+    responses={410: {"description": "The cursor is too old; resync without since"}},
+)
+async def list_changes(
+    since: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    service: AsyncChangeService = Depends(get_change_service),
+):
+    """
+        Endpoint for incremental sync: projects and tasks created, updated or deleted
+        after the `since` cursor (everything when omitted), ordered by change time.
+        Each change carries the current row, or for deletes its id (and a task's
+        project_id). A row changed several times appears once, at its last change.
+        next_cursor is always set: pass it as since= to continue, at once while
+        has_more is true, later to pick up new changes. The last
+        CHANGES_SETTLE_SECONDS of changes are only returned once they are settled.
+        Deletes are kept for CHANGES_RETENTION_SECONDS: an older cursor gets 410
+        Gone, and the client must resync by reading the feed without since.
+    """
+    try:
+        body = await service.changes_json(since=since, limit=limit)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    except ResyncRequiredError:
+        raise HTTPException(
+            status_code=410, detail="Cursor too old; resync without since"
+        )
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/stream")
+async def stream_changes(
+    request: Request,
+    project_id: Optional[int] = None,
+    assigned_to: Optional[str] = None,
+):
+    """
+        Server-Sent Events stream of project and task creates, updates and deletes,
+        pushed as they are committed: a "change" event per write, with the row as
+        the API returns it. project_id / assigned_to keep the writes that concern
+        that project / assignee (before or after the change).
+        Events are buffered per subscriber up to EVENTS_QUEUE_SIZE; a subscriber
+        that falls further behind is sent an "overflow" event and disconnected,
+        and should catch up with GET /changes before reconnecting.
+        Bulk imports do not send events (see GET /changes).
+    """
+    subscription = change_events.subscribe(
+        project_id=project_id, assigned_to=assigned_to
+    )
+    return StreamingResponse(
+        sse_stream(
+            change_events,
+            subscription,
+            request.is_disconnected,
+            settings.EVENTS_HEARTBEAT_SECONDS,
+        ),
+        media_type="text/event-stream",
+        # Stop proxies from buffering (and caching) the stream.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+
+from backend.database_api.db.connection import database
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/pool")
+async def get_pool_status():
+    """
+        Endpoint exposing live connection pool statistics: connections checked
+        in/out, overflow in use, checkout count, timeouts and a histogram of
+        how long requests waited for a connection (cumulative ms buckets).
+    """
+    return database.pool_status()
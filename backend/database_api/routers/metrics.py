@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.database_api.core.cache import global_cache
+from backend.database_api.core.cache_metrics import render_prometheus
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+        Prometheus scrape endpoint: cache hits, misses, sets, evictions and
+        expirations, plus current entries and approximate memory, per key namespace.
+        Each worker process reports its own cache.
+    """
+    return PlainTextResponse(
+        render_prometheus(global_cache.stats()),
+        media_type="text/plain; version=0.0.4",
+    )
@@ -1,90 +1,235 @@
 import logging
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
 
-from backend.database_api.db.connection import database
-from backend.database_api.db.repositories.project_repository import ProjectRepository
+from backend.database_api.core.bulk_import import spool_body
+from backend.database_api.core.conditional import conditional_json_response
+from backend.database_api.core.config import settings
+from backend.database_api.core.export import ExportFormat, export_response
+from backend.database_api.core.pagination import (
+    PAGE_RESPONSES,
+    InvalidCursorError,
+    page_headers,
+)
+from backend.database_api.core.serialization import UnknownFieldError
+from backend.database_api.db.connection import SessionRunner, database
 from backend.database_api.enum.status import ProjectStatus
-from backend.database_api.schemas.project import Project, ProjectCreate, ProjectUpdate
-from backend.database_api.services.project_service import ProjectService
+from backend.database_api.schemas.project import (
+    Project,
+    ProjectCreate,
+    ProjectSummary,
+    ProjectUpdate,
+)
+from backend.database_api.schemas.task import ImportReport
+from backend.database_api.services.project_service import AsyncProjectService
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-def get_project_service(db: Session = Depends(database.get_db)) -> ProjectService:
-    repo = ProjectRepository(db)
-    return ProjectService(repo)
+def get_project_service(
+    runner: SessionRunner = Depends(database.get_runner),
+) -> AsyncProjectService:
+    return AsyncProjectService(runner)
 
 
 @router.post("/", response_model=Project)
-def create_project(
+async def create_project(
     project: ProjectCreate,
-    service: ProjectService = Depends(get_project_service),
+    service: AsyncProjectService = Depends(get_project_service),
 ):
     """
         Endpoint to create a new Project.
     """
     logging.info(f"Creating project with data: {project}")
-    new_project = service.create(project=project)
+    new_project = await service.create(project=project)
     return new_project
 
 
+@router.get("/export")
+async def export_projects(
+    name: Optional[str] = None,
+    status: Optional[ProjectStatus] = None,
+    modified_since: Optional[datetime] = None,
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    service: AsyncProjectService = Depends(get_project_service),
+):
+    """
+        Endpoint to download every project matching the filters, ordered by id, as
+        NDJSON (one object per line) or CSV, without their tasks (see /tasks/export).
+        modified_since keeps projects with last_modified >= modified_since. Rows are
+        streamed from a server-side cursor, so memory use does not depend on the
+        number of projects.
+    """
+    logging.info(f"Export projects as {fmt.value}")
+    chunks = service.export(
+        fmt=fmt, name=name, status=status, modified_since=modified_since
+    )
+    return export_response(chunks, fmt, "projects")
+
+
+@router.post("/import", response_model=ImportReport)
+async def import_projects(
+    request: Request,
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+):
+    """
+        Endpoint to load a large NDJSON or CSV body of projects (without tasks, e.g. a
+        /projects/export file) in chunks of IMPORT_CHUNK_SIZE records, each validated
+        as a ProjectCreate and committed on its own. Invalid records are skipped and
+        reported; the rest are loaded.
+    """
+    with await spool_body(request) as upload:
+        report = await run_in_threadpool(
+            AsyncProjectService.import_records, upload, fmt
+        )
+    logging.info(
+        f"Imported {report.imported} projects, rejected {report.rejected} "
+        f"in {report.seconds:.1f}s"
+    )
+    return report
+
+
+@router.get(
+    "/summary", response_model=list[ProjectSummary], responses=PAGE_RESPONSES
+)
+async def get_project_summaries(
+    request: Request,
+    name: Optional[str] = None,
+    status: Optional[ProjectStatus] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    service: AsyncProjectService = Depends(get_project_service),
+):
+    """
+        Endpoint to summarize the projects matching the same filters as listing
+        projects: task counts per status (kept in project_stats), overdue count, next
+        due date and last activity, in one query. Paged like the project list
+        (X-Next-Cursor and Link headers).
+    """
+    logging.info(f"Summarize projects limit={limit} cursor={cursor}")
+    try:
+        body, next_cursor = await service.summaries_json(
+            name=name, status=status, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return conditional_json_response(request, body, page_headers(request, next_cursor))
+
+
+@router.get("/{project_id}/summary", response_model=ProjectSummary)
+async def get_project_summary(
+    project_id: int,
+    request: Request,
+    service: AsyncProjectService = Depends(get_project_service),
+):
+    """
+        Endpoint to summarize one project's tasks without returning them: counts per
+        status, how many are overdue and the next due date.
+    """
+    logging.info(f"Summarize project with id={project_id}")
+    body = await service.summary_json(project_id=project_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return conditional_json_response(request, body)
+
+
 @router.get("/{project_id}", response_model=Project)
-def get_project(
+async def get_project(
     project_id: int,
-    service: ProjectService = Depends(get_project_service),
+    request: Request,
+    fields: Optional[str] = None,
+    service: AsyncProjectService = Depends(get_project_service),
 ):
     """
-        Endpoint to retrieve a project by its ID
+        Endpoint to retrieve a project by its ID.
+        The body is pre-encoded JSON, cached until the project or its tasks change.
+        fields (comma-separated, e.g. "name,status") selects only those columns;
+        id is always included, and tasks only when fields names "tasks".
+        Sends an ETag and answers a matching If-None-Match with 304. There is no
+        Last-Modified: removing a task changes the body without moving any timestamp.
     """
     logging.info(f"Reading project with id={project_id}")
-    project_obj = service.get(project_id=project_id)
-    if not project_obj:
+    try:
+        body = await service.get_json(project_id=project_id, fields=fields)
+    except UnknownFieldError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if body is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project_obj
+    return conditional_json_response(request, body)
 
 
-@router.get("/", response_model=list[Project])
-def get_projects(
+@router.get("/", response_model=list[Project], responses=PAGE_RESPONSES)
+async def get_projects(
+    request: Request,
     name: Optional[str] = None,
     status: Optional[ProjectStatus] = None,
-    service: ProjectService = Depends(get_project_service),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_tasks: bool = True,
+    fields: Optional[str] = None,
+    service: AsyncProjectService = Depends(get_project_service),
 ):
     """
         Endpoint to list projects filtered by optional query parameters.
+        Results are ordered by id and returned one page of at most `limit` rows
+        (DEFAULT_PAGE_SIZE, 100, when omitted) at a time. When more rows exist, the
+        X-Next-Cursor header carries the cursor for the next page and the Link
+        header its URL (rel="next"): follow them until absent to read every row.
+        With include_tasks=false the tasks are not loaded and `tasks` is returned empty.
+        fields (comma-separated, e.g. "name,status") selects only those columns;
+        id is always included, and tasks are neither loaded nor returned unless
+        fields names "tasks".
+        Pages are cached per normalized filter set until a project or task write.
+        Sends an ETag and answers a matching If-None-Match with 304.
     """
-    logging.info("List all Projects")
-    return service.list(name=name, status=status)
+    logging.info(f"List Projects limit={limit} cursor={cursor}")
+    try:
+        body, next_cursor = await service.list_json(
+            name=name,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+            include_tasks=include_tasks,
+            fields=fields,
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    except UnknownFieldError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return conditional_json_response(request, body, page_headers(request, next_cursor))
 
 
 @router.patch("/{project_id}", response_model=Project)
-def update_project(
+async def update_project(
     project_id: int,
     project_update: ProjectUpdate,
-    service: ProjectService = Depends(get_project_service),
+    service: AsyncProjectService = Depends(get_project_service),
 ):
     """
         Endpoint to update an existing project partially.
     """
     logging.info(f"Updating project id={project_id} with data: {project_update}")
-    updated = service.update(project_id=project_id, project_update=project_update)
+    updated = await service.update(
+        project_id=project_id, project_update=project_update
+    )
     if not updated:
         raise HTTPException(status_code=404, detail="Project not found")
     return updated
 
 
 @router.delete("/{project_id}", response_model=Project)
-def delete_project(
+async def delete_project(
     project_id: int,
-    service: ProjectService = Depends(get_project_service),
+    service: AsyncProjectService = Depends(get_project_service),
 ):
     """
        Endpoint to delete a project by its ID.
     """
     logging.info(f"Deleting project id={project_id}")
-    deleted = service.delete(project_id=project_id)
+    deleted = await service.delete(project_id=project_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Project not found")
     return deleted
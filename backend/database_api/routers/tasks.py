@@ -1,97 +1,268 @@
 import logging
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
 
-from backend.database_api.db.connection import database
-from backend.database_api.db.repositories.task_repository import TaskRepository
+from backend.database_api.core.bulk_import import spool_body
+from backend.database_api.core.conditional import conditional_json_response
+from backend.database_api.core.config import settings
+from backend.database_api.core.export import ExportFormat, export_response
+from backend.database_api.core.pagination import (
+    PAGE_RESPONSES,
+    InvalidCursorError,
+    page_headers,
+)
+from backend.database_api.core.serialization import UnknownFieldError
+from backend.database_api.db.connection import SessionRunner, database
 from backend.database_api.enum.status import TaskStatus
-from backend.database_api.schemas.task import Task, TaskCreate, TaskUpdate
-from backend.database_api.services.task_service import TaskService
+from backend.database_api.schemas.task import (
+    ImportReport,
+    Task,
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskUpdate,
+)
+from backend.database_api.services.task_service import (
+    AsyncTaskService,
+    BulkValidationError,
+    ProjectNotFoundError,
+)
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
-def get_task_service(db: Session = Depends(database.get_db)) -> TaskService:
-    repo = TaskRepository(db)
-    return TaskService(repo)
+def get_task_service(
+    runner: SessionRunner = Depends(database.get_runner),
+) -> AsyncTaskService:
+    return AsyncTaskService(runner)
 
 
 @router.post("/", response_model=Task)
-def create_task(
+async def create_task(
     task: TaskCreate,
-    service: TaskService = Depends(get_task_service),
+    service: AsyncTaskService = Depends(get_task_service),
 ):
     """
         Endpoint to create a new task.
     """
-    return service.create(task=task)
+    return await service.create(task=task)
+
+
+# Bulk routes are declared before the /{task_id} routes so "bulk" is not parsed as an id.
+@router.post("/bulk", response_model=list[Task])
+async def create_tasks_bulk(
+    payload: TaskBulkCreate,
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    """
+        Endpoint to create many tasks in one transaction.
+        All items are validated first; if any is invalid nothing is written and
+        the 422 response lists the error for each failing item by index.
+    """
+    logging.info(f"Bulk creating {len(payload.items)} tasks")
+    try:
+        return await service.bulk_create(payload.items)
+    except BulkValidationError as exc:
+        raise HTTPException(
+            status_code=422, detail=[error.model_dump() for error in exc.errors]
+        )
+
+
+@router.patch("/bulk", response_model=list[Task])
+async def update_tasks_bulk(
+    payload: TaskBulkUpdate,
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    """
+        Endpoint to partially update many tasks (each item carries its id) in one transaction.
+    """
+    logging.info(f"Bulk updating {len(payload.items)} tasks")
+    try:
+        return await service.bulk_update(payload.items)
+    except BulkValidationError as exc:
+        raise HTTPException(
+            status_code=422, detail=[error.model_dump() for error in exc.errors]
+        )
+
+
+@router.delete("/bulk", response_model=list[Task])
+async def delete_tasks_bulk(
+    payload: TaskBulkDelete,
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    """
+        Endpoint to delete many tasks by id in one transaction.
+    """
+    logging.info(f"Bulk deleting {len(payload.ids)} tasks")
+    try:
+        return await service.bulk_delete(payload.ids)
+    except BulkValidationError as exc:
+        raise HTTPException(
+            status_code=422, detail=[error.model_dump() for error in exc.errors]
+        )
+
+
+@router.get("/export")
+async def export_tasks(
+    project_id: Optional[int] = None,
+    project_name: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    status: Optional[TaskStatus] = None,
+    title: Optional[str] = None,
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    modified_since: Optional[datetime] = None,
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    service: AsyncTaskService = Depends(get_task_service),
+):
+    """
+        Endpoint to download every task matching the filters, ordered by id, as
+        NDJSON (one object per line) or CSV. Same filters as listing tasks, plus
+        modified_since (last_modified >= modified_since). Rows are streamed from a
+        server-side cursor, so memory use does not depend on the number of tasks.
+    """
+    logging.info(f"Export tasks as {fmt.value}")
+    chunks = service.export(
+        fmt=fmt,
+        project_id=project_id,
+        project_name=project_name,
+        assigned_to=assigned_to,
+        status=status,
+        title=title,
+        due_after=due_after,
+        due_before=due_before,
+        modified_since=modified_since,
+    )
+    return export_response(chunks, fmt, "tasks")
+
+
+@router.post("/import", response_model=ImportReport)
+async def import_tasks(
+    request: Request,
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+):
+    """
+        Endpoint to load a large NDJSON or CSV body of tasks (e.g. a /tasks/export
+        file) in chunks of IMPORT_CHUNK_SIZE records, each validated as a TaskCreate
+        and committed on its own. Invalid records and records referencing a missing
+        project are skipped and reported; the rest are loaded.
+    """
+    with await spool_body(request) as upload:
+        report = await run_in_threadpool(AsyncTaskService.import_records, upload, fmt)
+    logging.info(
+        f"Imported {report.imported} tasks, rejected {report.rejected} "
+        f"in {report.seconds:.1f}s"
+    )
+    return report
 
 
 @router.get("/{task_id}", response_model=Task)
-def get_task(
+async def get_task(
     task_id: int,
-    service: TaskService = Depends(get_task_service),
+    request: Request,
+    fields: Optional[str] = None,
+    service: AsyncTaskService = Depends(get_task_service),
 ):
     """
         Endpoint to retrieve a task by its ID.
+        The body is pre-encoded JSON, cached until the task changes.
+        fields (comma-separated, e.g. "title,status") selects only those columns;
+        id is always included.
+        Sends ETag and Last-Modified, and answers If-None-Match /
+        If-Modified-Since with 304 when the task is unchanged.
     """
-    task_obj = service.get(task_id=task_id)
-    if not task_obj:
+    try:
+        body = await service.get_json(task_id=task_id, fields=fields)
+    except UnknownFieldError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if body is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task_obj
+    return conditional_json_response(request, body)
 
 
-@router.get("/", response_model=list[Task])
-def list_tasks(
+@router.get("/", response_model=list[Task], responses=PAGE_RESPONSES)
+async def list_tasks(
+    request: Request,
     project_id: Optional[int] = None,
     project_name: Optional[str] = None,
     assigned_to: Optional[str] = None,
     status: Optional[TaskStatus] = None,
     title: Optional[str] = None,
-    service: TaskService = Depends(get_task_service),
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    service: AsyncTaskService = Depends(get_task_service),
 ):
     """
         Endpoint to list tasks with optional filters.
+        due_after / due_before bound due_date as a half-open range [due_after, due_before).
+        fields (comma-separated, e.g. "title,status") selects only those columns;
+        id is always included.
+        Results are ordered by id and returned one page of at most `limit` rows
+        (DEFAULT_PAGE_SIZE, 100, when omitted) at a time. When more rows exist, the
+        X-Next-Cursor header carries the cursor for the next page and the Link
+        header its URL (rel="next"): follow them until absent to read every row.
+        Pages are cached per normalized filter set until a task write touches them.
+        Sends an ETag and answers a matching If-None-Match with 304.
     """
     logging.info(
         f"GET: Tasks assigned to {assigned_to} with status {status} for project_id {project_id}/ "
-        f"project_name {project_name}"
-    )
-    return service.list(
-        project_id=project_id,
-        project_name=project_name,
-        assigned_to=assigned_to,
-        status=status,
-        title=title,
+        f"project_name {project_name} limit {limit} cursor {cursor}"
     )
+    try:
+        body, next_cursor = await service.list_json(
+            project_id=project_id,
+            project_name=project_name,
+            assigned_to=assigned_to,
+            status=status,
+            title=title,
+            due_after=due_after,
+            due_before=due_before,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    except UnknownFieldError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return conditional_json_response(request, body, page_headers(request, next_cursor))
 
 
 @router.patch("/{task_id}", response_model=Task)
-def update_task(
+async def update_task(
     task_id: int,
     task_update: TaskUpdate,
-    service: TaskService = Depends(get_task_service),
+    service: AsyncTaskService = Depends(get_task_service),
 ):
     """
        Endpoint to partially update a task.
+       Moving it to a project that does not exist returns 422 and writes nothing.
     """
-    updated = service.update(task_id=task_id, task_update=task_update)
+    try:
+        updated = await service.update(task_id=task_id, task_update=task_update)
+    except ProjectNotFoundError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
     if not updated:
         raise HTTPException(status_code=404, detail="Task not found")
     return updated
 
 
 @router.delete("/{task_id}", response_model=Task)
-def delete_task(
+async def delete_task(
     task_id: int,
-    service: TaskService = Depends(get_task_service),
+    service: AsyncTaskService = Depends(get_task_service),
 ):
     """
         Endpoint to delete a task by ID.
     """
-    deleted = service.delete(task_id)
+    deleted = await service.delete(task_id=task_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Task not found")
     return deleted
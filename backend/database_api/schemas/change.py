@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from backend.database_api.enum.change import ChangeEntity, ChangeOp
+
+
+class Change(BaseModel):
+    entity: ChangeEntity
+    id: int
+    op: ChangeOp
+    changed_at: datetime
+    # The row as GET /projects/{id} (without tasks) or GET /tasks/{id} returns it;
+    # for deletes only the id and, for tasks, the project_id.
+    data: dict[str, Any]
+
+
+class ChangePage(BaseModel):
+    changes: list[Change]
+    # Pass back as since= to read what changed after this page. Always set: at the
+    # end of the feed it resumes from the point the page was read up to.
+    next_cursor: str
+    # More changes are ready now; otherwise poll again later with next_cursor.
+    has_more: bool
@@ -3,7 +3,7 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
 
-from backend.database_api.enum.status import ProjectStatus
+from backend.database_api.enum.status import ProjectStatus, TaskStatus
 from backend.database_api.schemas.task import Task
 
 # --- Input Schemas ---
@@ -39,3 +39,18 @@ class Project(BaseModel):
     last_modified: datetime
     tasks: list[Task] = []
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectSummary(BaseModel):
+    id: int
+    name: str
+    status: ProjectStatus
+    task_count: int
+    # Every TaskStatus, with 0 for statuses no task has.
+    status_counts: dict[TaskStatus, int]
+    # Tasks not complete whose due date has passed.
+    overdue_count: int
+    # Earliest due date of the tasks not complete and not yet overdue.
+    next_due_date: Optional[datetime] = None
+    # Time of the last task write in the project (its creation before that).
+    last_activity: datetime
@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from backend.database_api.core.config import settings
 from backend.database_api.enum.status import TaskStatus
 
 # --- Input Schemas ---
@@ -28,6 +29,16 @@ class TaskUpdate(BaseModel):
     assigned_to: Optional[str] = None
     status: Optional[TaskStatus] = None
     due_date: Optional[datetime] = None
+    # Moves the task to another project.
+    project_id: Optional[int] = None
+
+    @field_validator("title", "assigned_to", "status", "due_date", "project_id")
+    @classmethod
+    def reject_null(cls, v):
+        # Fields are optional so they can be omitted; every column is NOT NULL.
+        if v is None:
+            raise ValueError("may be omitted but not null")
+        return v
 
     @field_validator("assigned_to")
     @classmethod
@@ -37,6 +48,24 @@ class TaskUpdate(BaseModel):
         return v
 
 
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+
+class TaskBulkCreate(BaseModel):
+    items: list[TaskCreate] = Field(min_length=1, max_length=settings.MAX_BULK_ITEMS)
+
+
+class TaskBulkUpdate(BaseModel):
+    items: list[TaskBulkUpdateItem] = Field(
+        min_length=1, max_length=settings.MAX_BULK_ITEMS
+    )
+
+
+class TaskBulkDelete(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=settings.MAX_BULK_ITEMS)
+
+
 # --- Output Schema ---
 
 
@@ -50,3 +79,18 @@ class Task(BaseModel):
     created_time: datetime
     last_modified: datetime
     model_config = ConfigDict(from_attributes=True)
+
+
+class BulkItemError(BaseModel):
+    index: int
+    error: str
+
+
+class ImportReport(BaseModel):
+    # Records read so far, and how many of them were loaded or rejected.
+    records: int = 0
+    imported: int = 0
+    rejected: int = 0
+    # The first rejected records (index = 0-based record number in the upload).
+    errors: list[BulkItemError] = []
+    seconds: float = 0.0
@@ -0,0 +1,192 @@
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Iterator, Optional
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from backend.database_api.core.config import settings
+from backend.database_api.core.pagination import (
+    ChangePosition,
+    decode_change_cursor,
+    encode_change_cursor,
+)
+from backend.database_api.core.serialization import dumps, schema_columns
+from backend.database_api.db.connection import SessionRunner, database
+from backend.database_api.db.models import Project, Task, Tombstone
+from backend.database_api.db.repositories.change_repository import (
+    SOURCES,
+    ChangeRepository,
+)
+from backend.database_api.enum.change import ChangeEntity, ChangeOp
+from backend.database_api.schemas.project import Project as ProjectSchema
+from backend.database_api.schemas.task import Task as TaskSchema
+
+_PROJECT_FIELDS, _PROJECT_COLUMNS = schema_columns(
+    ProjectSchema, Project, exclude=("tasks",)
+)
+_TASK_FIELDS, _TASK_COLUMNS = schema_columns(TaskSchema, Task)
+
+# Columns selected from each source of the feed.
+_COLUMNS = {
+    "project": _PROJECT_COLUMNS,
+    "task": _TASK_COLUMNS,
+    "tombstone": [Tombstone.entity, Tombstone.entity_id, Tombstone.project_id],
+}
+# Entity and response fields of the sources whose rows are upserts.
+_UPSERTS = {
+    "project": (ChangeEntity.PROJECT, _PROJECT_FIELDS),
+    "task": (ChangeEntity.TASK, _TASK_FIELDS),
+}
+
+
+class ResyncRequiredError(Exception):
+    """
+    The cursor is older than CHANGES_RETENTION_SECONDS, so tombstones of deletes
+    after it may have been pruned: the client must read the feed from the start.
+    """
+
+
+def _horizon(now: datetime) -> datetime:
+    return now - timedelta(seconds=settings.CHANGES_RETENTION_SECONDS)
+
+
+def _utcnow() -> datetime:
+    # Timestamps are stored without a zone, in UTC.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _change(source: str, row: Row) -> dict:
+    """
+    A Change as a plain dict from a ChangeRepository.changed_rows() row.
+    """
+    changed_at, _, *values = row
+    if source == "tombstone":
+        entity, entity_id, project_id = values
+        data = {"id": entity_id}
+        if entity == ChangeEntity.TASK.value:
+            data["project_id"] = project_id
+        op = ChangeOp.DELETED
+    else:
+        entity, fields = _UPSERTS[source]
+        data = dict(zip(fields, values))
+        entity_id = data["id"]
+        # Never written since it was created; clients can treat both as an upsert.
+        same = data["created_time"] == data["last_modified"]
+        op = ChangeOp.CREATED if same else ChangeOp.UPDATED
+    return {
+        "entity": entity,
+        "id": entity_id,
+        "op": op,
+        "changed_at": changed_at,
+        "data": data,
+    }
+
+
+class ChangeService:
+    """
+    The change feed: projects and tasks created, updated or deleted since a cursor,
+    read from the (last_modified, id) indexes and the tombstones table. The cost of a
+    page depends on how many changes it returns, not on the size of the tables.
+    """
+    def __init__(self, repo: ChangeRepository):
+        self.repo = repo
+
+    def changes_json(
+        self,
+        since: Optional[str] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        now: Optional[datetime] = None,
+    ) -> bytes:
+        """
+        One ChangePage as encoded JSON: the first `limit` changes after the `since`
+        cursor (from the start when None), ordered by change time. Changes of the
+        last CHANGES_SETTLE_SECONDS are held back until they can no longer be
+        overtaken by a write committing later with an earlier timestamp.
+        Raises ResyncRequiredError for a cursor older than the retained tombstones.
+        """
+        after = decode_change_cursor(since) if since else None
+        now = now or _utcnow()
+        if after is not None and after[0] < _horizon(now):
+            raise ResyncRequiredError()
+        until = now - timedelta(seconds=settings.CHANGES_SETTLE_SECONDS)
+        page = list(islice(self._merged(after, until, limit + 1), limit + 1))
+        has_more = len(page) > limit
+        page = page[:limit]
+        if has_more:
+            position = page[-1][0]
+        else:
+            # Everything before `until` has been read: resume from there (sorting
+            # before every source at that time), unless the cursor is already later.
+            position = max(p for p in ((until, "", 0), after) if p is not None)
+        return dumps(
+            {
+                "changes": [change for _, change in page],
+                "next_cursor": encode_change_cursor(position),
+                "has_more": has_more,
+            }
+        )
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """
+        Delete the tombstones older than CHANGES_RETENTION_SECONDS; changes_json
+        refuses the cursors that could still need them.
+        """
+        return self.repo.prune_tombstones(_horizon(now or _utcnow()))
+
+    def _merged(
+        self, after: Optional[ChangePosition], until: datetime, limit: int
+    ) -> Iterator[tuple[ChangePosition, dict]]:
+        """
+        (position, change) of up to `limit` changes of each source, merged in feed
+        order: (changed_at, source, id).
+        """
+        streams = []
+        for source in SOURCES:
+            rows = self.repo.changed_rows(source, _COLUMNS[source], after, until, limit)
+            streams.append([((r[0], source, r[1]), _change(source, r)) for r in rows])
+        return heapq.merge(*streams, key=lambda item: item[0])
+
+
+class AsyncChangeService:
+    """
+    Awaitable facade over ChangeService used by the async route handlers.
+    """
+    def __init__(self, runner: SessionRunner):
+        self.runner = runner
+
+    @staticmethod
+    def _service(db: Session) -> ChangeService:
+        return ChangeService(ChangeRepository(db))
+
+    async def changes_json(self, **kwargs) -> bytes:
+        """
+        Same arguments as ChangeService.changes_json.
+        """
+        return await self.runner.run(
+            lambda db: self._service(db).changes_json(**kwargs)
+        )
+
+
+def _prune() -> int:
+    with database.SessionLocal() as db:
+        return ChangeService(ChangeRepository(db)).prune()
+
+
+async def prune_periodically(interval: float) -> None:
+    """
+    Prune tombstones every `interval` seconds until cancelled, off the event loop.
+    A failed prune is logged and retried at the next interval.
+    """
+    while True:
+        try:
+            pruned = await run_in_threadpool(_prune)
+            if pruned:
+                logging.info(f"Pruned {pruned} tombstones")
+        except Exception as exc:
+            logging.warning(f"Tombstone prune failed: {exc}")
+        await asyncio.sleep(interval)
@@ -1,9 +1,44 @@
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, Optional
 
-from backend.database_api.core.cache import global_cache
-from backend.database_api.db.models import Project
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from backend.database_api.core.bulk_import import Record, read_records, run_import
+from backend.database_api.core.cache import global_cache, make_key
+from backend.database_api.core.config import settings
+from backend.database_api.core.events import ChangeEvent, change_events
+from backend.database_api.core.export import ExportFormat, as_naive_utc, encode_batches
+from backend.database_api.core.pagination import decode_cursor, paginate
+from backend.database_api.core.serialization import (
+    dumps,
+    parse_fields,
+    row_dicts,
+    schema_columns,
+)
+from backend.database_api.db.connection import SessionRunner, database
+from backend.database_api.db.models import Project, Task
 from backend.database_api.db.repositories.project_repository import ProjectRepository
+from backend.database_api.enum.change import ChangeEntity, ChangeOp
+from backend.database_api.enum.status import TaskStatus
+from backend.database_api.schemas.project import Project as ProjectSchema
 from backend.database_api.schemas.project import ProjectCreate, ProjectUpdate
+from backend.database_api.schemas.task import BulkItemError, ImportReport
+from backend.database_api.schemas.task import Task as TaskSchema
+
+_PROJECT_FIELDS, _PROJECT_COLUMNS = schema_columns(
+    ProjectSchema, Project, exclude=("tasks",)
+)
+_PROJECT_COLUMN = dict(zip(_PROJECT_FIELDS, _PROJECT_COLUMNS))
+_TASK_FIELDS, _TASK_COLUMNS = schema_columns(TaskSchema, Task)
+
+
+def _project_fields(fields: Optional[str]) -> tuple[str, ...]:
+    """
+    A parsed sparse fieldset: the project columns plus "tasks" for the embedded
+    tasks (which keep all their fields).
+    """
+    return parse_fields(fields, _PROJECT_FIELDS + ("tasks",))
 
 
 class ProjectService:
@@ -16,15 +51,41 @@ class ProjectService:
 
     def create(self, project: ProjectCreate) -> Project:
         db_project = self.repo.create(project.model_dump())
+        # Drop a cached "not found" for this id (SQLite can reuse deleted ids).
+        global_cache.delete(f"project:{db_project.id}")
+        global_cache.invalidate_tags("projects:*")
+        _publish(ChangeOp.CREATED, db_project)
         return db_project
 
     def get(self, project_id: int) -> Optional[Project]:
+        return self.repo.get(project_id)
+
+    def get_json(
+        self, project_id: int, fields: Optional[str] = None
+    ) -> Optional[bytes]:
+        """
+        The project as encoded response JSON, served from global_cache when present.
+        It embeds the project's tasks, so it depends on them too: task writes
+        invalidate its tag. With a sparse fieldset (`fields`), only those columns
+        are selected, and tasks only when "tasks" is among them, uncached.
+        """
+        if fields:
+            names = _project_fields(fields)
+            columns = [_PROJECT_COLUMN[n] for n in names if n != "tasks"]
+            row = self.repo.get_row(project_id, columns)
+            if row is None:
+                return None
+            project = dict(zip((n for n in names if n != "tasks"), row))
+            if "tasks" in names:
+                task_rows = self.repo.task_rows(_TASK_COLUMNS, [project_id])
+                project["tasks"] = row_dicts(task_rows, _TASK_FIELDS)
+            return dumps(project)
         key = f"project:{project_id}"
 
-        def _fetch():
-            return self.repo.get(project_id)
+        def _fetch(service: ProjectService):
+            return _to_json(service.repo.get(project_id))
 
-        return self._cached(key, _fetch)
+        return self._cached(key, _fetch, _dependencies(project_id))
 
     def update(
         self, project_id: int, project_update: ProjectUpdate
@@ -36,25 +97,373 @@ class ProjectService:
             db_project, project_update.model_dump(exclude_unset=True)
         )
         global_cache.delete(f"project:{project_id}")
+        global_cache.invalidate_tags("projects:*")
+        _publish(ChangeOp.UPDATED, db_project)
         return db_project
 
     def delete(self, project_id: int) -> Optional[Project]:
         db_project = self.repo.get(project_id)
         if not db_project:
             return None
-        self.repo.delete(db_project)
+        task_ids = self.repo.delete(db_project)
         global_cache.delete(f"project:{project_id}")
+        # The project's tasks are deleted with it; their bodies are cached untagged.
+        for task_id in task_ids:
+            global_cache.delete(f"task:{task_id}")
+        global_cache.invalidate_tags("projects:*", "tasks:*", f"project:{project_id}")
+        # Subscribers of the project get this one event for it and its tasks.
+        _publish(ChangeOp.DELETED, db_project)
         return db_project
 
     def list(
-        self, name: Optional[str] = None, status: Optional[str] = None
-    ) -> list[Project]:
-        return self.repo.list(name=name, status=status)
-
-    def _cached(self, key: str, fetch_fn) -> Optional[Project]:
-        cached = global_cache.get(key)
-        if cached is not None:
-            return cached
-        value = fetch_fn()
-        global_cache.set(key, value)
-        return value
+        self,
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        include_tasks: bool = True,
+    ) -> tuple[list[Project], Optional[str]]:
+        """
+        Return one page of projects ordered by id, plus the cursor for the next page.
+        """
+        after_id = decode_cursor(cursor) if cursor else None
+        rows = self.repo.list(
+            name=name,
+            status=status,
+            after_id=after_id,
+            limit=limit + 1,
+            include_tasks=include_tasks,
+        )
+        return paginate(rows, limit)
+
+    @staticmethod
+    def list_cache_key(
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        include_tasks: bool = True,
+        fields: Optional[str] = None,
+    ) -> tuple[str, tuple[str, ...]]:
+        """
+        Cache key and invalidation tags for one list() page.
+        The name filter is an ILIKE, so it is lowercased into the key, and a sparse
+        fieldset is keyed by its normalized field list (raising UnknownFieldError
+        for fields the schema lacks).
+        """
+        names = _project_fields(fields)
+        include_tasks = include_tasks and "tasks" in names
+        key = make_key(
+            "projects:list",
+            {
+                "name": name.lower() if name else None,
+                "status": status,
+                "limit": limit,
+                "cursor": cursor,
+                "include_tasks": include_tasks,
+                "fields": ",".join(names) if fields else None,
+            },
+        )
+        tags = ("projects:*", "tasks:*") if include_tasks else ("projects:*",)
+        return key, tags
+
+    def list_json(self, **filters) -> tuple[bytes, Optional[str]]:
+        """
+        One list() page as encoded response JSON plus the next cursor, served from
+        global_cache until a write invalidates one of its tags.
+        """
+        key, tags = self.list_cache_key(**filters)
+
+        def _fetch(service: ProjectService):
+            return _list_page_json(service.repo, **filters)
+
+        return self._cached(key, _fetch, tags)
+
+    def summary_json(
+        self, project_id: int, now: Optional[datetime] = None
+    ) -> Optional[bytes]:
+        """
+        The project's ProjectSummary as encoded JSON, or None when it does not exist.
+        Not cached: the overdue count and next due date move with the clock.
+        """
+        rows = self.repo.summary_rows(now or _utcnow(), project_id=project_id)
+        return dumps(_summary_dict(rows[0])) if rows else None
+
+    def summaries_json(
+        self,
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> tuple[bytes, Optional[str]]:
+        """
+        One page of ProjectSummary JSON for the projects matching the list()
+        filters, ordered by id, plus the cursor for the next page.
+        """
+        after_id = decode_cursor(cursor) if cursor else None
+        rows = self.repo.summary_rows(
+            now or _utcnow(),
+            name=name,
+            status=status,
+            after_id=after_id,
+            limit=limit + 1,
+        )
+        rows, next_cursor = paginate(rows, limit)
+        return dumps([_summary_dict(row) for row in rows]), next_cursor
+
+    def export(
+        self,
+        fmt: ExportFormat = ExportFormat.NDJSON,
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        modified_since: Optional[datetime] = None,
+        batch_size: int = settings.EXPORT_BATCH_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Every project matching the list() filters (and modified_since, inclusive),
+        ordered by id and without tasks, encoded one batch of rows at a time.
+        """
+        batches = self.repo.export_batches(
+            _PROJECT_COLUMNS,
+            batch_size,
+            name=name,
+            status=status,
+            modified_since=as_naive_utc(modified_since),
+        )
+        return encode_batches(batches, _PROJECT_FIELDS, fmt)
+
+    def import_records(
+        self,
+        records: Iterable[Record],
+        chunk_size: int = settings.IMPORT_CHUNK_SIZE,
+        on_progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        """
+        Validate records as ProjectCreate and insert the valid ones, committing one
+        chunk at a time (see run_import). Invalid records are reported, not loaded.
+        """
+
+        def _load(items: list[tuple[int, ProjectCreate]]) -> list[BulkItemError]:
+            project_ids = self.repo.import_rows(
+                [project.model_dump() for _, project in items]
+            )
+            # Drop cached "not found" entries for the new ids, as create() does.
+            for project_id in project_ids:
+                global_cache.delete(f"project:{project_id}")
+            global_cache.invalidate_tags("projects:*")
+            return []
+
+        return run_import(records, ProjectCreate, _load, chunk_size, on_progress)
+
+    def _cached(self, key: str, fetch_fn, tags: tuple[str, ...] = ()):
+        """
+        global_cache.get_or_load with fetch_fn(service) run on this service, or, to
+        refresh a stale entry in the background, on one with its own session.
+        Concurrent misses on one key share a single fetch_fn call.
+        """
+
+        def _refresh():
+            with database.SessionLocal() as db:
+                return fetch_fn(ProjectService(ProjectRepository(db)))
+
+        return global_cache.get_or_load(
+            key, lambda: fetch_fn(self), tags=tags, refresh_fn=_refresh
+        )
+
+
+def _dependencies(project_id: int) -> tuple[str, ...]:
+    """
+    Invalidation tags of a cached project view: its tasks (see task_service).
+    """
+    return (f"project:{project_id}",)
+
+
+def _publish(op: ChangeOp, db_project: Project) -> None:
+    """
+    Push a change event for a committed project to the /changes/stream subscribers.
+    """
+    data = {name: getattr(db_project, name) for name in _PROJECT_FIELDS}
+    event = ChangeEvent(
+        ChangeEntity.PROJECT, op, data, project_ids=frozenset([db_project.id])
+    )
+    change_events.publish([event])
+
+
+def _to_schema(db_project: Optional[Project]) -> Optional[ProjectSchema]:
+    if db_project is None:
+        return None
+    return ProjectSchema.model_validate(db_project)
+
+
+def _to_json(db_project: Optional[Project]) -> Optional[bytes]:
+    """
+    Validate and encode once, so cached reads skip both the DB and serialization.
+    Bytes are also safe to share: unlike ORM instances they are not tied to a Session.
+    """
+    if db_project is None:
+        return None
+    return _to_schema(db_project).model_dump_json().encode()
+
+
+def _utcnow() -> datetime:
+    # Timestamps are stored without a zone, in UTC.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _summary_dict(row: Row) -> dict:
+    """
+    A ProjectSummary as a plain dict from a ProjectRepository.summary_rows() row.
+    """
+    project_id, name, status, task_count, *counts, overdue, next_due, activity = row
+    return {
+        "id": project_id,
+        "name": name,
+        "status": status,
+        "task_count": task_count,
+        "status_counts": {s.value: n for s, n in zip(TaskStatus, counts)},
+        "overdue_count": overdue,
+        "next_due_date": next_due,
+        "last_activity": activity,
+    }
+
+
+def _list_page_json(
+    repo: ProjectRepository,
+    name: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = settings.DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_tasks: bool = True,
+    fields: Optional[str] = None,
+) -> tuple[bytes, Optional[str]]:
+    """
+    Encoded JSON of one list() page, selected as rows of the schemas' columns (the
+    tasks with one more SELECT for the whole page) and encoded directly: the same
+    body as validating each Project into the schema, without ORM objects or models.
+    A sparse fieldset (`fields`) narrows the SELECT to those columns (plus id), and
+    leaves out tasks, along with their SELECT, unless it names "tasks".
+    """
+    names = _project_fields(fields)
+    project_fields = [name for name in names if name != "tasks"]
+    after_id = decode_cursor(cursor) if cursor else None
+    rows = repo.list_rows(
+        [_PROJECT_COLUMN[name] for name in project_fields],
+        name=name,
+        status=status,
+        after_id=after_id,
+        limit=limit + 1,
+    )
+    rows, next_cursor = paginate(rows, limit)
+    projects = row_dicts(rows, project_fields)
+    if "tasks" not in names:
+        return dumps(projects), next_cursor
+    tasks_by_project: dict[int, list[dict]] = {p["id"]: [] for p in projects}
+    if include_tasks:
+        task_rows = repo.task_rows(_TASK_COLUMNS, list(tasks_by_project))
+        for task in row_dicts(task_rows, _TASK_FIELDS):
+            tasks_by_project[task["project_id"]].append(task)
+    for project in projects:
+        project["tasks"] = tasks_by_project[project["id"]]
+    return dumps(projects), next_cursor
+
+
+class AsyncProjectService:
+    """
+    Awaitable facade over ProjectService used by the async route handlers.
+    Each call runs ProjectService on the request's SessionRunner and converts the
+    result to the response schema inside that call, so nothing lazy-loads afterwards.
+    """
+    def __init__(self, runner: SessionRunner):
+        self.runner = runner
+
+    @staticmethod
+    def _service(db: Session) -> ProjectService:
+        return ProjectService(ProjectRepository(db))
+
+    async def create(self, project: ProjectCreate) -> ProjectSchema:
+        return await self.runner.run(
+            lambda db: _to_schema(self._service(db).create(project=project))
+        )
+
+    async def get_json(
+        self, project_id: int, fields: Optional[str] = None
+    ) -> Optional[bytes]:
+        """
+        Cache hits are answered here without touching the session or the threadpool,
+        and concurrent misses for one project wait for a single load. Sparse
+        fieldsets are not cached.
+        """
+        if fields:
+            return await self.runner.run(
+                lambda db: self._service(db).get_json(
+                    project_id=project_id, fields=fields
+                )
+            )
+        return await global_cache.get_or_load_async(
+            f"project:{project_id}",
+            lambda: self.runner.run(
+                lambda db: self._service(db).get_json(project_id=project_id)
+            ),
+            tags=_dependencies(project_id),
+        )
+
+    async def update(
+        self, project_id: int, project_update: ProjectUpdate
+    ) -> Optional[ProjectSchema]:
+        return await self.runner.run(
+            lambda db: _to_schema(
+                self._service(db).update(
+                    project_id=project_id, project_update=project_update
+                )
+            )
+        )
+
+    async def delete(self, project_id: int) -> Optional[ProjectSchema]:
+        return await self.runner.run(
+            lambda db: _to_schema(self._service(db).delete(project_id=project_id))
+        )
+
+    async def list_json(self, **filters) -> tuple[bytes, Optional[str]]:
+        """
+        Same arguments as ProjectService.list; cached like get_json.
+        """
+        key, tags = ProjectService.list_cache_key(**filters)
+        return await global_cache.get_or_load_async(
+            key,
+            lambda: self.runner.run(lambda db: self._service(db).list_json(**filters)),
+            tags=tags,
+        )
+
+    async def summary_json(self, project_id: int) -> Optional[bytes]:
+        return await self.runner.run(
+            lambda db: self._service(db).summary_json(project_id=project_id)
+        )
+
+    async def summaries_json(self, **filters) -> tuple[bytes, Optional[str]]:
+        """
+        Same arguments as ProjectService.summaries_json.
+        """
+        return await self.runner.run(
+            lambda db: self._service(db).summaries_json(**filters)
+        )
+
+    @staticmethod
+    def export(**kwargs) -> Iterator[bytes]:
+        """
+        ProjectService.export on a session of its own, for a StreamingResponse: it is
+        consumed (in the threadpool) after the request's session has been closed.
+        """
+        with database.SessionLocal() as db:
+            yield from ProjectService(ProjectRepository(db)).export(**kwargs)
+
+    @staticmethod
+    def import_records(stream, fmt: ExportFormat, **kwargs) -> ImportReport:
+        """
+        ProjectService.import_records for an uploaded file, on a session of its own
+        from the sync engine (COPY needs the psycopg2 connection). Blocking: run it in
+        the threadpool.
+        """
+        with database.SessionLocal() as db:
+            service = ProjectService(ProjectRepository(db))
+            return service.import_records(read_records(stream, fmt), **kwargs)
@@ -1,10 +1,77 @@
-from typing import Optional
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Optional
 
-from backend.database_api.core.cache import global_cache
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from backend.database_api.core.bulk_import import Record, read_records, run_import
+from backend.database_api.core.cache import global_cache, make_key
+from backend.database_api.core.conditional import ValidatedBody
+from backend.database_api.core.config import settings
+from backend.database_api.core.events import ChangeEvent, change_events
+from backend.database_api.core.export import ExportFormat, as_naive_utc, encode_batches
+from backend.database_api.core.pagination import decode_cursor, paginate
+from backend.database_api.core.serialization import (
+    dumps,
+    parse_fields,
+    row_dicts,
+    schema_columns,
+)
+from backend.database_api.db.connection import SessionRunner, database
 from backend.database_api.db.models import Task
 from backend.database_api.db.repositories.task_repository import TaskRepository
+from backend.database_api.enum.change import ChangeEntity, ChangeOp
 from backend.database_api.enum.status import TaskStatus
-from backend.database_api.schemas.task import TaskCreate, TaskUpdate
+from backend.database_api.schemas.task import Task as TaskSchema
+from backend.database_api.schemas.task import (
+    BulkItemError,
+    ImportReport,
+    TaskBulkUpdateItem,
+    TaskCreate,
+    TaskUpdate,
+)
+
+
+_TASK_FIELDS, _TASK_COLUMNS = schema_columns(TaskSchema, Task)
+_TASK_COLUMN = dict(zip(_TASK_FIELDS, _TASK_COLUMNS))
+
+
+def _task_fields(fields: Optional[str]) -> tuple[str, ...]:
+    return parse_fields(fields, _TASK_FIELDS)
+
+
+class BulkValidationError(Exception):
+    """
+    Raised before any write when one or more items of a bulk request are invalid.
+    Carries one BulkItemError per failing item.
+    """
+
+    def __init__(self, errors: list[BulkItemError]):
+        super().__init__(f"{len(errors)} invalid item(s)")
+        self.errors = errors
+
+
+class ProjectNotFoundError(Exception):
+    """
+    Raised before any write when an update moves a task to a project that does not
+    exist.
+    """
+
+    def __init__(self, project_id: int):
+        super().__init__(f"Project {project_id} not found")
+        self.project_id = project_id
+
+
+def _duplicate_errors(task_ids: list[int]) -> list[BulkItemError]:
+    seen: set[int] = set()
+    errors = []
+    for index, task_id in enumerate(task_ids):
+        if task_id in seen:
+            errors.append(
+                BulkItemError(index=index, error=f"Duplicate task id {task_id}")
+            )
+        seen.add(task_id)
+    return errors
 
 
 class TaskService:
@@ -17,13 +84,34 @@ class TaskService:
 
     def create(self, task: TaskCreate) -> Task:
         db_task = self.repo.create({**task.model_dump()})
+        # Drop a cached "not found" for this id (SQLite can reuse deleted ids).
+        global_cache.delete(f"task:{db_task.id}")
+        _invalidate_lists([db_task.project_id])
+        _publish(ChangeOp.CREATED, [db_task])
         return db_task
 
     def get(self, task_id: int) -> Optional[Task]:
+        return self.repo.get(task_id)
+
+    def get_json(
+        self, task_id: int, fields: Optional[str] = None
+    ) -> Optional[ValidatedBody]:
+        """
+        The task as encoded response JSON with its validators, served from
+        global_cache when present.
+        With a sparse fieldset (`fields`), only those columns are selected, uncached.
+        """
+        if fields:
+            names = _task_fields(fields)
+            row = self.repo.get_row(task_id, [_TASK_COLUMN[n] for n in names])
+            if row is None:
+                return None
+            values = dict(zip(names, row))
+            return ValidatedBody.build(dumps(values), values.get("last_modified"))
         key = f"task:{task_id}"
 
-        def _fetch():
-            return self.repo.get(task_id)
+        def _fetch(service: TaskService):
+            return _to_json(service.repo.get(task_id))
 
         return self._cached(key, _fetch)
 
@@ -31,8 +119,18 @@ class TaskService:
         db_task = self.repo.get(task_id)
         if not db_task:
             return None
-        db_task = self.repo.update(db_task, task_update.model_dump(exclude_unset=True))
+        old_project_id = db_task.project_id
+        changes = task_update.model_dump(exclude_unset=True)
+        new_project_id = changes.get("project_id", old_project_id)
+        if new_project_id != old_project_id:
+            if not self.repo.existing_project_ids([new_project_id]):
+                raise ProjectNotFoundError(new_project_id)
+        before = {task_id: (old_project_id, db_task.assigned_to)}
+        db_task = self.repo.update(db_task, changes)
         global_cache.delete(f"task:{task_id}")
+        # A task moved to another project leaves its old project too.
+        _invalidate_lists([old_project_id, db_task.project_id])
+        _publish(ChangeOp.UPDATED, [db_task], before)
         return db_task
 
     def delete(self, task_id: int) -> Optional[Task]:
@@ -41,8 +139,85 @@ class TaskService:
             return None
         self.repo.delete(db_task)
         global_cache.delete(f"task:{task_id}")
+        _invalidate_lists([db_task.project_id])
+        _publish(ChangeOp.DELETED, [db_task])
         return db_task
 
+    def bulk_create(self, tasks: list[TaskCreate]) -> list[Row]:
+        """
+        Validate every item, then insert them all in one transaction.
+        """
+        project_ids = {task.project_id for task in tasks}
+        existing = self.repo.existing_project_ids(list(project_ids))
+        errors = [
+            BulkItemError(index=index, error=f"Project {task.project_id} not found")
+            for index, task in enumerate(tasks)
+            if task.project_id not in existing
+        ]
+        if errors:
+            raise BulkValidationError(errors)
+        created = self.repo.bulk_create([task.model_dump() for task in tasks])
+        for row in created:
+            global_cache.delete(f"task:{row.id}")
+        _invalidate_lists(row.project_id for row in created)
+        _publish(ChangeOp.CREATED, created)
+        return created
+
+    def bulk_update(self, items: list[TaskBulkUpdateItem]) -> list[Row]:
+        """
+        Validate every item, then apply all partial updates in one transaction.
+        """
+        task_ids = [item.id for item in items]
+        old_project_ids = self.repo.project_ids_by_task(task_ids)
+        target_ids = [item.project_id for item in items if item.project_id is not None]
+        existing_projects = self.repo.existing_project_ids(target_ids)
+        errors = _duplicate_errors(task_ids) + [
+            BulkItemError(index=index, error=f"Task {item.id} not found")
+            for index, item in enumerate(items)
+            if item.id not in old_project_ids
+        ]
+        errors += [
+            BulkItemError(index=index, error=f"Project {item.project_id} not found")
+            for index, item in enumerate(items)
+            if item.project_id is not None and item.project_id not in existing_projects
+        ]
+        if errors:
+            raise BulkValidationError(sorted(errors, key=lambda e: e.index))
+        updated = self.repo.bulk_update(
+            [item.model_dump(exclude_unset=True) for item in items]
+        )
+        for task_id in task_ids:
+            global_cache.delete(f"task:{task_id}")
+        _invalidate_lists(
+            [*old_project_ids.values(), *(row.project_id for row in updated)]
+        )
+        before = {
+            task_id: (project_id, None)
+            for task_id, project_id in old_project_ids.items()
+        }
+        _publish(ChangeOp.UPDATED, updated, before)
+        return updated
+
+    def bulk_delete(self, task_ids: list[int]) -> list[Row]:
+        """
+        Validate every id, then delete them all in one transaction.
+        """
+        existing = self.repo.existing_ids(task_ids)
+        errors = _duplicate_errors(task_ids) + [
+            BulkItemError(index=index, error=f"Task {task_id} not found")
+            for index, task_id in enumerate(task_ids)
+            if task_id not in existing
+        ]
+        if errors:
+            raise BulkValidationError(sorted(errors, key=lambda e: e.index))
+        deleted = self.repo.bulk_delete(task_ids)
+        for task_id in task_ids:
+            global_cache.delete(f"task:{task_id}")
+        _invalidate_lists(row.project_id for row in deleted)
+        deleted = sorted(deleted, key=lambda row: row.id)
+        _publish(ChangeOp.DELETED, deleted)
+        return deleted
+
     def list(
         self,
         project_id: Optional[int] = None,
@@ -50,19 +225,319 @@ class TaskService:
         assigned_to: Optional[str] = None,
         status: Optional[TaskStatus] = None,
         title: Optional[str] = None,
-    ) -> list[Task]:
-        return self.repo.list(
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[Task], Optional[str]]:
+        """
+        Return one page of tasks ordered by id, plus the cursor for the next page.
+        """
+        after_id = decode_cursor(cursor) if cursor else None
+        rows = self.repo.list(
             project_id=project_id,
             project_name=project_name,
             assigned_to=assigned_to,
             status=status,
             title=title,
+            due_after=due_after,
+            due_before=due_before,
+            after_id=after_id,
+            limit=limit + 1,
         )
+        return paginate(rows, limit)
+
+    @staticmethod
+    def list_cache_key(
+        project_id: Optional[int] = None,
+        project_name: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        title: Optional[str] = None,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> tuple[str, tuple[str, ...]]:
+        """
+        Cache key and invalidation tags for one list() page.
+        Text filters are ILIKEs, so they are lowercased into the key, and a sparse
+        fieldset is keyed by its normalized field list (raising UnknownFieldError
+        for fields the schema lacks). A page scoped
+        to one project only depends on that project's tasks (tag project:{id});
+        any other page depends on all tasks (tag tasks:*), and on project names too
+        when filtered by project_name.
+        """
+        key = make_key(
+            "tasks:list",
+            {
+                "project_id": project_id,
+                "project_name": project_name.lower() if project_name else None,
+                "assigned_to": assigned_to.lower() if assigned_to else None,
+                "status": status,
+                "title": title.lower() if title else None,
+                "due_after": due_after,
+                "due_before": due_before,
+                "limit": limit,
+                "cursor": cursor,
+                "fields": ",".join(_task_fields(fields)) if fields else None,
+            },
+        )
+        tags = (f"project:{project_id}",) if project_id is not None else ("tasks:*",)
+        if project_name is not None:
+            tags += ("projects:*",)
+        return key, tags
+
+    def list_json(self, **filters) -> tuple[bytes, Optional[str]]:
+        """
+        One list() page as encoded response JSON plus the next cursor, served from
+        global_cache until a write invalidates one of its tags.
+        """
+        key, tags = self.list_cache_key(**filters)
+
+        def _fetch(service: TaskService):
+            return _list_page_json(service.repo, **filters)
+
+        return self._cached(key, _fetch, tags)
+
+    def export(
+        self,
+        fmt: ExportFormat = ExportFormat.NDJSON,
+        modified_since: Optional[datetime] = None,
+        batch_size: int = settings.EXPORT_BATCH_SIZE,
+        **filters,
+    ) -> Iterator[bytes]:
+        """
+        Every task matching the list() filters (and modified_since, inclusive),
+        ordered by id, encoded one batch of rows at a time.
+        """
+        batches = self.repo.export_batches(
+            _TASK_COLUMNS,
+            batch_size,
+            modified_since=as_naive_utc(modified_since),
+            **filters,
+        )
+        return encode_batches(batches, _TASK_FIELDS, fmt)
+
+    def import_records(
+        self,
+        records: Iterable[Record],
+        chunk_size: int = settings.IMPORT_CHUNK_SIZE,
+        on_progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        """
+        Validate records as TaskCreate and insert the valid ones, committing one
+        chunk at a time (see run_import). Records that are invalid or reference a
+        missing project are reported, not loaded. A cached "not found" for a new id
+        (SQLite reuses deleted ids) is left to expire after CACHE_NEGATIVE_TTL.
+        """
+        known_projects: set[int] = set()
+
+        def _load(items: list[tuple[int, TaskCreate]]) -> list[BulkItemError]:
+            unseen = {task.project_id for _, task in items} - known_projects
+            if unseen:
+                known_projects.update(self.repo.existing_project_ids(list(unseen)))
+            errors = [
+                BulkItemError(index=index, error=f"Project {task.project_id} not found")
+                for index, task in items
+                if task.project_id not in known_projects
+            ]
+            rows = [
+                task.model_dump()
+                for _, task in items
+                if task.project_id in known_projects
+            ]
+            if rows:
+                self.repo.import_rows(rows)
+                _invalidate_lists({row["project_id"] for row in rows})
+            return errors
+
+        return run_import(records, TaskCreate, _load, chunk_size, on_progress)
+
+    def _cached(self, key: str, fetch_fn, tags: tuple[str, ...] = ()):
+        """
+        global_cache.get_or_load with fetch_fn(service) run on this service, or, to
+        refresh a stale entry in the background, on one with its own session.
+        Concurrent misses on one key share a single fetch_fn call.
+        """
+
+        def _refresh():
+            with database.SessionLocal() as db:
+                return fetch_fn(TaskService(TaskRepository(db)))
+
+        return global_cache.get_or_load(
+            key, lambda: fetch_fn(self), tags=tags, refresh_fn=_refresh
+        )
+
+
+def _invalidate_lists(project_ids) -> None:
+    """
+    Drop cached list pages that may contain tasks of the given projects, and the
+    cached views of those projects, which embed their tasks (tag project:{id}).
+    """
+    tags = {f"project:{project_id}" for project_id in project_ids}
+    global_cache.invalidate_tags("tasks:*", *tags)
+
+
+def _publish(
+    op: ChangeOp,
+    tasks: Iterable,
+    before: Optional[dict[int, tuple[Optional[int], Optional[str]]]] = None,
+) -> None:
+    """
+    Push a change event per committed task (a Task or a row of its columns) to the
+    /changes/stream subscribers. `before` maps task ids to the (project_id,
+    assigned_to) they had, so subscribers of the old project or assignee see a task
+    leave them.
+    """
+    events = []
+    for task in tasks:
+        data = {name: getattr(task, name) for name in _TASK_FIELDS}
+        project_ids = {data["project_id"]}
+        assignees = {data["assigned_to"]}
+        old_project_id, old_assignee = (before or {}).get(data["id"], (None, None))
+        project_ids.add(old_project_id)
+        assignees.add(old_assignee)
+        events.append(
+            ChangeEvent(
+                ChangeEntity.TASK,
+                op,
+                data,
+                project_ids=frozenset(p for p in project_ids if p is not None),
+                assignees=frozenset(a for a in assignees if a is not None),
+            )
+        )
+    change_events.publish(events)
+
+
+def _list_page_json(
+    repo: TaskRepository,
+    limit: int = settings.DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    **filters,
+) -> tuple[bytes, Optional[str]]:
+    """
+    Encoded JSON of one list() page, selected as rows of the schema's columns and
+    encoded directly: the same body as validating each Task into the schema,
+    without building ORM objects or pydantic models. A sparse fieldset (`fields`)
+    narrows the SELECT to those columns (plus id).
+    """
+    names = _task_fields(fields)
+    columns = [_TASK_COLUMN[name] for name in names]
+    after_id = decode_cursor(cursor) if cursor else None
+    rows = repo.list_rows(columns, after_id=after_id, limit=limit + 1, **filters)
+    rows, next_cursor = paginate(rows, limit)
+    return dumps(row_dicts(rows, names)), next_cursor
+
+
+def _to_schema(db_task) -> Optional[TaskSchema]:
+    if db_task is None:
+        return None
+    return TaskSchema.model_validate(db_task)
+
+
+def _to_json(db_task: Optional[Task]) -> Optional[ValidatedBody]:
+    if db_task is None:
+        return None
+    body = _to_schema(db_task).model_dump_json().encode()
+    return ValidatedBody.build(body, db_task.last_modified)
+
+
+class AsyncTaskService:
+    """
+    Awaitable facade over TaskService used by the async route handlers.
+    Each call runs TaskService on the request's SessionRunner and converts the
+    result to the response schema inside that call, so nothing lazy-loads afterwards.
+    """
+    def __init__(self, runner: SessionRunner):
+        self.runner = runner
+
+    @staticmethod
+    def _service(db: Session) -> TaskService:
+        return TaskService(TaskRepository(db))
+
+    async def create(self, task: TaskCreate) -> TaskSchema:
+        return await self.runner.run(
+            lambda db: _to_schema(self._service(db).create(task=task))
+        )
+
+    async def get_json(
+        self, task_id: int, fields: Optional[str] = None
+    ) -> Optional[ValidatedBody]:
+        """
+        Cache hits are answered here without touching the session or the threadpool,
+        and concurrent misses for one task wait for a single load. Sparse fieldsets
+        are not cached.
+        """
+        if fields:
+            return await self.runner.run(
+                lambda db: self._service(db).get_json(task_id=task_id, fields=fields)
+            )
+        return await global_cache.get_or_load_async(
+            f"task:{task_id}",
+            lambda: self.runner.run(
+                lambda db: self._service(db).get_json(task_id=task_id)
+            ),
+        )
+
+    async def update(
+        self, task_id: int, task_update: TaskUpdate
+    ) -> Optional[TaskSchema]:
+        return await self.runner.run(
+            lambda db: _to_schema(
+                self._service(db).update(task_id=task_id, task_update=task_update)
+            )
+        )
+
+    async def delete(self, task_id: int) -> Optional[TaskSchema]:
+        return await self.runner.run(
+            lambda db: _to_schema(self._service(db).delete(task_id=task_id))
+        )
+
+    async def bulk_create(self, tasks: list[TaskCreate]) -> list[TaskSchema]:
+        return await self.runner.run(
+            lambda db: [_to_schema(t) for t in self._service(db).bulk_create(tasks)]
+        )
+
+    async def bulk_update(self, items: list[TaskBulkUpdateItem]) -> list[TaskSchema]:
+        return await self.runner.run(
+            lambda db: [_to_schema(t) for t in self._service(db).bulk_update(items)]
+        )
+
+    async def bulk_delete(self, task_ids: list[int]) -> list[TaskSchema]:
+        return await self.runner.run(
+            lambda db: [_to_schema(t) for t in self._service(db).bulk_delete(task_ids)]
+        )
+
+    async def list_json(self, **filters) -> tuple[bytes, Optional[str]]:
+        """
+        Same arguments as TaskService.list; cached like get_json.
+        """
+        key, tags = TaskService.list_cache_key(**filters)
+        return await global_cache.get_or_load_async(
+            key,
+            lambda: self.runner.run(lambda db: self._service(db).list_json(**filters)),
+            tags=tags,
+        )
+
+    @staticmethod
+    def export(**kwargs) -> Iterator[bytes]:
+        """
+        TaskService.export on a session of its own, for a StreamingResponse: it is
+        consumed (in the threadpool) after the request's session has been closed.
+        """
+        with database.SessionLocal() as db:
+            yield from TaskService(TaskRepository(db)).export(**kwargs)
 
-    def _cached(self, key: str, fetch_fn) -> Optional[Task]:
-        cached = global_cache.get(key)
-        if cached is not None:
-            return cached
-        value = fetch_fn()
-        global_cache.set(key, value)
-        return value
+    @staticmethod
+    def import_records(stream, fmt: ExportFormat, **kwargs) -> ImportReport:
+        """
+        TaskService.import_records for an uploaded file, on a session of its own from
+        the sync engine (COPY needs the psycopg2 connection). Blocking: run it in the
+        threadpool.
+        """
+        with database.SessionLocal() as db:
+            service = TaskService(TaskRepository(db))
+            return service.import_records(read_records(stream, fmt), **kwargs)
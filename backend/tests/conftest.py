@@ -1,8 +1,41 @@
 import pytest
+from sqlalchemy import event
 
 from backend.database_api.core.cache import global_cache
+from backend.database_api.db.connection import database
+
+
+class QueryCounter:
+    """
+    Counts SQL statements sent to the database engine.
+    Call reset() right before the request under test, then read `count`.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.statements: list[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.statements = []
 
 
 @pytest.fixture(autouse=True)
 def clear_global_cache():
     global_cache.clear()
+    global_cache.metrics.reset()
+
+
+@pytest.fixture
+def query_counter():
+    """
+    Attach a QueryCounter to the engine serving requests for the duration of one test.
+    """
+    counter = QueryCounter()
+    event.listen(database.request_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(database.request_engine, "before_cursor_execute", counter)
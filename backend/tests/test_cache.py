@@ -1,6 +1,7 @@
 import time
 import pytest
 from backend.database_api.core.cache import Cache
+from backend.database_api.core.cache_metrics import entry_size
 
 
 @pytest.fixture
@@ -65,3 +66,79 @@ class TestCache:
         # Wait for TTL to expire
         time.sleep(1.2)
         assert cache.get(key) is None
+
+
+class TestCacheBudget:
+    def test_entries_are_weighed_by_size(self):
+        """
+        Test that a byte budget holds many small entries or few large ones:
+        - Fill the budget with small entries
+        - One large entry displaces as many of them as its size requires
+        """
+        small = entry_size("task:0", b"x" * 10)
+        cache = Cache(max_bytes=small * 10)
+        for i in range(10):
+            cache.set(f"task:{i}", b"x" * 10)
+        assert all(cache.get(f"task:{i}") is not None for i in range(10))
+
+        cache.set("task:big", b"x" * (small * 4))
+        assert cache.get("task:big") is not None
+        stats = cache.stats()["task"]
+        assert stats["evictions"] == 5
+        assert stats["memory_bytes"] <= small * 10
+
+    def test_entry_larger_than_budget_is_not_cached(self):
+        """
+        Test that a value bigger than the whole budget is skipped, and does not
+        leave an older value for the same key behind.
+        """
+        cache = Cache(max_bytes=1000)
+        cache.set("project:1", b"small")
+        cache.set("project:1", b"x" * 2000)
+        assert cache.get("project:1") is None
+        assert cache.get_or_load("project:1", lambda: b"x" * 2000) == b"x" * 2000
+
+    def test_lru_evicts_least_recently_used(self):
+        """
+        Test that with "lru" the entry not read for longest is evicted first.
+        """
+        cache = Cache(maxsize=2, eviction_policy="lru")
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+
+    def test_lfu_evicts_least_frequently_used(self):
+        """
+        Test that with "lfu" an often-read entry survives a newer, rarely read one.
+        """
+        cache = Cache(maxsize=2, eviction_policy="lfu")
+        cache.set("hot", "1")
+        cache.set("cold", "2")
+        for _ in range(3):
+            cache.get("hot")
+        cache.get("cold")
+        cache.set("new", "3")
+        assert cache.get("hot") == "1"
+        assert cache.get("cold") is None
+        assert cache.get("new") == "3"
+
+    def test_unknown_eviction_policy_is_rejected(self):
+        """
+        Test that a misspelled policy fails at construction.
+        """
+        with pytest.raises(ValueError):
+            Cache(eviction_policy="fifo")
+
+    def test_namespace_ttls_override_the_default(self):
+        """
+        Test that a namespace TTL applies to its keys only.
+        """
+        cache = Cache(ttl=10, namespace_ttls={"tasks:list": 0.1})
+        cache.set('tasks:list:{"limit":10}', (b"[]", None))
+        cache.set("task:1", b"{}")
+        time.sleep(0.2)
+        assert cache.get('tasks:list:{"limit":10}') is None
+        assert cache.get("task:1") == b"{}"
@@ -0,0 +1,72 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from backend.database_api.core.cache import Cache
+from backend.database_api.core.cache_metrics import ENTRY_OVERHEAD_BYTES, key_namespace
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+class TestCacheMetrics:
+    def test_key_namespace(self):
+        """
+        Test that keys are grouped by their leading name segments.
+        """
+        assert key_namespace("project:42") == "project"
+        assert key_namespace("task:7") == "task"
+        assert key_namespace('tasks:list:{"limit":100}') == "tasks:list"
+
+    def test_counts_hits_misses_sets_and_memory(self):
+        """
+        Test that lookups and fills are counted per namespace and memory is tracked.
+        """
+        cache = Cache()
+        cache.get_or_load("project:1", lambda: b"x" * 100)
+        cache.get_or_load("project:1", lambda: b"unused")
+        cache.get("task:1")
+
+        stats = cache.stats()
+        assert stats["project"]["misses"] == 1
+        assert stats["project"]["hits"] == 1
+        assert stats["project"]["sets"] == 1
+        assert stats["project"]["entries"] == 1
+        assert stats["project"]["memory_bytes"] == (
+            ENTRY_OVERHEAD_BYTES + len("project:1") + 100
+        )
+        assert stats["task"]["misses"] == 1
+
+    def test_counts_evictions_and_expirations(self):
+        """
+        Test that capacity evictions and TTL expirations are told apart, and that
+        clear() counts as neither.
+        """
+        cache = Cache(maxsize=2, ttl=0.05)
+        for i in range(3):
+            cache.set(f"task:{i}", b"v")
+        assert cache.stats()["task"]["evictions"] == 1
+
+        time.sleep(0.1)
+        cache.set("project:1", b"v")
+        assert cache.stats()["task"]["expirations"] == 2
+
+        cache.clear()
+        stats = cache.stats()
+        assert stats["project"]["evictions"] == 0
+        assert stats["project"]["expirations"] == 0
+
+    def test_metrics_endpoint_exposes_prometheus_text(self):
+        """
+        Test that /metrics serves the counters in Prometheus text format.
+        """
+        client.get("/projects/987654320")
+        client.get("/projects/987654320")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        lines = response.text.splitlines()
+        assert "# TYPE cache_hits_total counter" in lines
+        assert 'cache_hits_total{namespace="project"} 1' in lines
+        assert 'cache_misses_total{namespace="project"} 1' in lines
+        assert any(line.startswith("cache_memory_bytes{") for line in lines)
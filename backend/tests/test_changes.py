@@ -0,0 +1,227 @@
+import base64
+import json
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from backend.database_api.core.config import settings
+from backend.database_api.core.pagination import encode_change_cursor
+from backend.database_api.db.connection import database
+from backend.database_api.db.models import Tombstone
+from backend.database_api.db.repositories.change_repository import ChangeRepository
+from backend.database_api.main import app
+from backend.database_api.services.change_service import ChangeService, _utcnow
+
+client = TestClient(app)
+
+
+def read_changes(since: str, limit: int = 1000) -> dict:
+    """
+    One ChangePage as read once every change made so far has settled.
+    """
+    with database.SessionLocal() as db:
+        body = ChangeService(ChangeRepository(db)).changes_json(
+            since=since, limit=limit, now=_utcnow() + timedelta(minutes=1)
+        )
+    return json.loads(body)
+
+
+class TestChanges:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create a project with three tasks, then update one task and
+        delete another, after taking a cursor from just before the writes.
+        """
+        # Timestamps can have second resolution (SQLite): start a second earlier.
+        start = (_utcnow() - timedelta(seconds=1)).replace(microsecond=0)
+        cls.since = encode_change_cursor((start, "", 0))
+        project = {
+            "name": "Changes Project",
+            "description": "Project for change feed testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        cls.project_id = client.post("/projects/", json=project).json()["id"]
+        cls.task_ids = [
+            client.post(
+                "/tasks/",
+                json={
+                    "title": f"Changes task {i}",
+                    "assigned_to": "Sam",
+                    "status": "to do",
+                    "due_date": "2025-08-10",
+                    "project_id": cls.project_id,
+                },
+            ).json()["id"]
+            for i in range(3)
+        ]
+        client.patch(f"/tasks/{cls.task_ids[0]}", json={"status": "complete"})
+        client.delete(f"/tasks/{cls.task_ids[1]}")
+
+    def own(self, changes: list[dict]) -> list[dict]:
+        return [
+            c
+            for c in changes
+            if (c["entity"], c["id"]) == ("project", self.project_id)
+            or (c["entity"] == "task" and c["id"] in self.task_ids)
+        ]
+
+    def test_feed_reports_upserts_and_deletes(self):
+        """
+        Test that the feed has each project and task written since the cursor once,
+        with its current row, and a tombstone for the deleted task.
+        """
+        page = read_changes(self.since)
+        changes = {(c["entity"], c["id"]): c for c in self.own(page["changes"])}
+        assert len(changes) == 4
+
+        project = changes[("project", self.project_id)]
+        assert project["op"] == "created"
+        assert project["data"]["name"] == "Changes Project"
+        assert "tasks" not in project["data"]
+
+        updated = changes[("task", self.task_ids[0])]
+        assert updated["data"]["status"] == "complete"
+        # Created and updated within the same second on SQLite.
+        assert updated["op"] in ("created", "updated")
+
+        deleted = changes[("task", self.task_ids[1])]
+        assert deleted["op"] == "deleted"
+        assert deleted["data"] == {
+            "id": self.task_ids[1],
+            "project_id": self.project_id,
+        }
+
+        assert changes[("task", self.task_ids[2])]["op"] == "created"
+
+    def test_feed_is_ordered_and_pages(self):
+        """
+        Test that paging with limit=1 walks the same changes, in the same order, as a
+        single page, and that changes are ordered by change time.
+        """
+        whole = read_changes(self.since)
+        assert whole["has_more"] is False
+        times = [c["changed_at"] for c in whole["changes"]]
+        assert times == sorted(times)
+
+        walked, cursor = [], self.since
+        while True:
+            page = read_changes(cursor, limit=1)
+            walked += page["changes"]
+            cursor = page["next_cursor"]
+            if not page["has_more"]:
+                break
+        assert walked == whole["changes"]
+
+    def test_resume_after_end(self):
+        """
+        Test that resuming from the cursor returned at the end of the feed does not
+        return the changes already read.
+        """
+        settled = _utcnow() + timedelta(seconds=settings.CHANGES_SETTLE_SECONDS + 1)
+        with database.SessionLocal() as db:
+            body = ChangeService(ChangeRepository(db)).changes_json(
+                since=self.since, now=settled
+            )
+        cursor = json.loads(body)["next_cursor"]
+        assert self.own(read_changes(cursor)["changes"]) == []
+
+    def test_project_delete_leaves_task_tombstones(self):
+        """
+        Test that deleting a project reports it and the tasks deleted with it.
+        """
+        start = (_utcnow() - timedelta(seconds=1)).replace(microsecond=0)
+        since = encode_change_cursor((start, "", 0))
+        project = {
+            "name": "Changes Project (deleted)",
+            "description": "Project for change feed testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "to do",
+        }
+        project_id = client.post("/projects/", json=project).json()["id"]
+        task = {
+            "title": "Changes task (deleted with project)",
+            "assigned_to": "Sam",
+            "status": "to do",
+            "due_date": "2025-08-10",
+            "project_id": project_id,
+        }
+        task_id = client.post("/tasks/", json=task).json()["id"]
+        client.delete(f"/projects/{project_id}")
+
+        deletes = {
+            (c["entity"], c["id"])
+            for c in read_changes(since)["changes"]
+            if c["op"] == "deleted"
+        }
+        assert {("project", project_id), ("task", task_id)} <= deletes
+
+    def test_recent_changes_are_held_back(self):
+        """
+        Test that GET /changes does not yet return changes younger than
+        CHANGES_SETTLE_SECONDS, and always returns a cursor.
+        """
+        response = client.get("/changes/", params={"since": self.since})
+        assert response.status_code == 200
+        page = response.json()
+        assert self.own(page["changes"]) == []
+        assert page["next_cursor"] and page["has_more"] is False
+
+    def test_invalid_cursor(self):
+        """
+        Test that a malformed since cursor returns 400.
+        """
+        response = client.get("/changes/", params={"since": "not-a-cursor"})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    def test_cursor_with_offset_or_bool_id_is_invalid(self):
+        """
+        Test that a change cursor whose time carries a UTC offset, or whose id is a
+        boolean, returns 400 rather than failing on the retention check.
+        """
+        for payload in (
+            {"at": "2020-01-01T00:00:00+00:00", "src": "task", "id": 1},
+            {"at": "2020-01-01T00:00:00", "src": "task", "id": True},
+        ):
+            raw = json.dumps(payload).encode()
+            since = base64.urlsafe_b64encode(raw).decode()
+            response = client.get("/changes/", params={"since": since})
+            assert response.status_code == 400
+
+    def test_cursor_past_retention_requires_resync(self):
+        """
+        Test that a since cursor older than CHANGES_RETENTION_SECONDS gets 410 Gone,
+        as the tombstones after it may have been pruned.
+        """
+        retention = timedelta(seconds=settings.CHANGES_RETENTION_SECONDS)
+        old = (_utcnow() - retention - timedelta(minutes=1)).replace(microsecond=0)
+        response = client.get(
+            "/changes/", params={"since": encode_change_cursor((old, "", 0))}
+        )
+        assert response.status_code == 410
+        assert "resync" in response.json()["detail"]
+
+    def test_prune_drops_tombstones_past_retention(self):
+        """
+        Test that pruning keeps tombstones within CHANGES_RETENTION_SECONDS and
+        deletes those past it.
+        """
+        with database.SessionLocal() as db:
+            service = ChangeService(ChangeRepository(db))
+            assert service.prune() == 0
+            retention = timedelta(seconds=settings.CHANGES_RETENTION_SECONDS)
+            later = _utcnow() + retention + timedelta(minutes=1)
+            assert service.prune(now=later) >= 1
+            assert db.scalar(select(func.count()).select_from(Tombstone)) == 0
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the project (and its tasks) after tests complete.
+        """
+        client.delete(f"/projects/{cls.project_id}")
@@ -0,0 +1,148 @@
+from fastapi.testclient import TestClient
+
+from backend.database_api.core import conditional
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+class TestConditionalGet:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create a project with one task.
+        """
+        payload = {
+            "name": "Conditional Project",
+            "description": "Project for conditional GET testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        cls.project_id = client.post("/projects/", json=payload).json()["id"]
+        task = {
+            "title": "Conditional task",
+            "assigned_to": "Odette",
+            "status": "to do",
+            "due_date": "2025-08-10",
+            "project_id": cls.project_id,
+        }
+        cls.task_id = client.post("/tasks/", json=task).json()["id"]
+
+    def test_matching_etag_gets_304_without_sql(self, query_counter):
+        """
+        Test that revalidating an unchanged project returns 304 with no body,
+        answered from the cache.
+        """
+        first = client.get(f"/projects/{self.project_id}")
+        etag = first.headers["ETag"]
+        assert etag.startswith('"') and etag.endswith('"')
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        query_counter.reset()
+        response = client.get(
+            f"/projects/{self.project_id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert query_counter.count == 0, query_counter.statements
+
+        weak_list = f'W/"stale", W/{etag}'
+        response = client.get(
+            f"/projects/{self.project_id}", headers={"If-None-Match": weak_list}
+        )
+        assert response.status_code == 304
+
+    def test_etag_changes_when_embedded_task_changes(self):
+        """
+        Test that a task write gives its project a new ETag, so the old one
+        gets the full body again.
+        """
+        etag = client.get(f"/projects/{self.project_id}").headers["ETag"]
+        client.patch(f"/tasks/{self.task_id}", json={"title": "Renamed task"})
+
+        response = client.get(
+            f"/projects/{self.project_id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["tasks"][0]["title"] == "Renamed task"
+
+    def test_task_last_modified_and_if_modified_since(self):
+        """
+        Test that a task carries Last-Modified, honoured by If-Modified-Since
+        unless If-None-Match is also sent.
+        """
+        response = client.get(f"/tasks/{self.task_id}")
+        last_modified = response.headers["Last-Modified"]
+        assert last_modified.endswith(" GMT")
+
+        response = client.get(
+            f"/tasks/{self.task_id}", headers={"If-Modified-Since": last_modified}
+        )
+        assert response.status_code == 304
+
+        earlier = "Mon, 01 Jan 2001 00:00:00 GMT"
+        response = client.get(
+            f"/tasks/{self.task_id}", headers={"If-Modified-Since": earlier}
+        )
+        assert response.status_code == 200
+
+        response = client.get(
+            f"/tasks/{self.task_id}",
+            headers={"If-Modified-Since": last_modified, "If-None-Match": '"other"'},
+        )
+        assert response.status_code == 200
+
+    def test_cached_task_is_not_rehashed(self, monkeypatch):
+        """
+        Test that a task served from the cache reuses the ETag and Last-Modified
+        worked out when its body was built, instead of hashing it again.
+        """
+        first = client.get(f"/tasks/{self.task_id}")
+        calls = []
+        monkeypatch.setattr(
+            conditional, "make_etag", lambda body: calls.append(body) or '"x"'
+        )
+        second = client.get(f"/tasks/{self.task_id}")
+        assert calls == []
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert second.headers["Last-Modified"] == first.headers["Last-Modified"]
+
+    def test_list_pages_are_revalidated(self):
+        """
+        Test that list pages get ETags and keep X-Next-Cursor on a 304.
+        """
+        params = {"project_id": self.project_id, "limit": 1}
+        client.post(
+            "/tasks/",
+            json={
+                "title": "Second conditional task",
+                "assigned_to": "Odette",
+                "status": "to do",
+                "due_date": "2025-08-11",
+                "project_id": self.project_id,
+            },
+        )
+        first = client.get("/tasks", params=params)
+        response = client.get(
+            "/tasks", params=params, headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert response.status_code == 304
+        assert response.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+        projects = client.get("/projects", params={"name": "Conditional Project"})
+        response = client.get(
+            "/projects",
+            params={"name": "Conditional Project"},
+            headers={"If-None-Match": projects.headers["ETag"]},
+        )
+        assert response.status_code == 304
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the project (and its tasks) after tests complete.
+        """
+        client.delete(f"/projects/{cls.project_id}")
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from backend.database_api.db.connection import (
+    AsyncSessionRunner,
+    SessionRunner,
+    ThreadpoolSessionRunner,
+    database,
+    to_async_url,
+)
+
+
+class TestSessionRunners:
+    def test_to_async_url(self):
+        """
+        Test that sync URLs map to their async drivers and unknown backends are rejected.
+        """
+        assert (
+            to_async_url("postgresql://postgres:postgres@db:5432/project_tracker")
+            == "postgresql+asyncpg://postgres:postgres@db:5432/project_tracker"
+        )
+        assert to_async_url("sqlite:////tmp/tracker.db") == "sqlite+aiosqlite:////tmp/tracker.db"
+        with pytest.raises(RuntimeError):
+            to_async_url("mysql://localhost/tracker")
+
+    def test_runner_must_implement_run(self):
+        """
+        Test that a runner without run() fails when it is created, not per request.
+        """
+
+        class IncompleteRunner(SessionRunner):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteRunner()
+
+    def test_threadpool_runner(self):
+        """
+        Test that the sync engine runner executes session work and returns its result.
+        """
+        with database.SessionLocal() as db:
+            runner = ThreadpoolSessionRunner(db)
+            result = asyncio.run(
+                runner.run(lambda session: session.execute(text("SELECT 1")).scalar())
+            )
+        assert result == 1
+
+    def test_async_runner(self):
+        """
+        Test that the async engine runner drives the same sync session code via run_sync.
+        """
+        async_url = to_async_url(database.database_url)
+        driver = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}[
+            database.engine.dialect.name
+        ]
+        pytest.importorskip(driver)
+
+        async def _run():
+            engine = create_async_engine(async_url)
+            try:
+                async with AsyncSession(engine) as session:
+                    runner = AsyncSessionRunner(session)
+                    return await runner.run(
+                        lambda s: s.execute(text("SELECT 1")).scalar()
+                    )
+            finally:
+                await engine.dispose()
+
+        assert asyncio.run(_run()) == 1
@@ -1,17 +1,47 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from unittest.mock import MagicMock
+
 import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.util.concurrency import greenlet_spawn
 
-from backend.database_api.core.cache import global_cache
+from backend.database_api.core.cache import NOT_FOUND, Cache, global_cache
+from backend.database_api.db.connection import database
 from backend.database_api.db.models import Project
+from backend.database_api.main import app
 from backend.database_api.services.project_service import ProjectService
 
+client = TestClient(app)
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    """Poll until condition() is true; background refreshes run on another thread."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
 
 @pytest.fixture
 def fake_project():
-    # Create a fake Project instance with predefined id and name
+    # Create a fake Project instance with every field the response schema needs
     project = Project()
     project.id = 42
     project.name = "Cached Project"
+    project.description = "Project served from the cache"
+    project.start_date = datetime(2025, 8, 1)
+    project.end_date = datetime(2025, 8, 15)
+    project.status = "in progress"
+    project.created_time = datetime(2025, 8, 1)
+    project.last_modified = datetime(2025, 8, 1)
+    project.tasks = []
     return project
 
 
@@ -33,21 +63,31 @@ def service(mock_repo):
 class TestDatabaseCache:
     def test_get_project_uses_cache(self, service, mock_repo, fake_project):
         """
-        Test that repeated 'get' calls for the same project id hit the DB only once,
-        and subsequent calls return the cached project without querying the repo again.
+        Test that repeated 'get_json' calls for the same project id hit the DB only once,
+        and subsequent calls return the cached JSON without querying the repo again.
         """
         global_cache._cache.clear()  # Clear global cache before test
 
         # First call: repo.get() should be called and cache populated
-        p1 = service.get(42)
-        assert p1.id == 42
+        p1 = service.get_json(42)
+        assert json.loads(p1)["id"] == 42
         assert mock_repo.get.call_count == 1
 
         # Second call: should come from cache, repo.get() count stays the same
-        p2 = service.get(42)
-        assert p2.id == 42
+        p2 = service.get_json(42)
+        assert p2 is p1
         assert mock_repo.get.call_count == 1  # No additional call
 
+    def test_cache_holds_encoded_json_not_orm_objects(self, service):
+        """
+        Test that the cached value is the encoded response body, independent of any Session.
+        """
+        global_cache._cache.clear()
+        service.get_json(42)
+        cached = global_cache.get("project:42")
+        assert isinstance(cached, bytes)
+        assert json.loads(cached)["name"] == "Cached Project"
+
     def test_update_project_invalidates_cache(self, service, mock_repo, fake_project):
         """
         Test that updating a project invalidates its cache entry:
@@ -59,7 +99,7 @@ class TestDatabaseCache:
         assert global_cache.get("project:42") is None
 
         # First get: repo.get() called, cache populated
-        service.get(42)
+        service.get_json(42)
         assert mock_repo.get.call_count == 1
 
         # Update the project — this should invalidate the cache entry
@@ -70,9 +110,313 @@ class TestDatabaseCache:
         assert global_cache.get("project:42") is None
 
         # After update, get is called again — repo.get() should be called again due to cache miss
-        service.get(42)
+        service.get_json(42)
         assert mock_repo.get.call_count == 3  # Because update may internally call repo.get too
 
         # Another get call now hits the cache again — no new repo.get() call
-        service.get(42)
+        service.get_json(42)
         assert mock_repo.get.call_count == 3
+
+    def test_cached_get_project_skips_the_database(self, query_counter):
+        """
+        Test that a repeated GET /projects/{id} is served from the cache with no SQL
+        and an identical body.
+        """
+        payload = {
+            "name": "Cache Endpoint Project",
+            "description": "Project for cached read testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        project_id = client.post("/projects/", json=payload).json()["id"]
+
+        first = client.get(f"/projects/{project_id}")
+        query_counter.reset()
+        second = client.get(f"/projects/{project_id}")
+        assert second.status_code == 200
+        assert second.headers["content-type"] == "application/json"
+        assert second.content == first.content
+        assert query_counter.count == 0, query_counter.statements
+
+        client.delete(f"/projects/{project_id}")
+        assert client.get(f"/projects/{project_id}").status_code == 404
+
+
+class TestSingleFlight:
+    def test_concurrent_misses_across_threads_load_once(self, service, mock_repo):
+        """
+        Test that threads missing the same key at once share one repo.get call.
+        """
+        global_cache.clear()
+        release = threading.Event()
+        fake_project = mock_repo.get.return_value
+
+        def slow_get(project_id):
+            release.wait(timeout=5)
+            return fake_project
+
+        mock_repo.get.side_effect = slow_get
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            futures = [pool.submit(service.get_json, 42) for _ in range(20)]
+            time.sleep(0.1)  # let every thread reach the cache miss
+            release.set()
+            bodies = [f.result(timeout=5) for f in futures]
+
+        assert mock_repo.get.call_count == 1
+        assert len(set(bodies)) == 1
+
+    def test_loader_error_reaches_waiters_and_is_not_cached(self):
+        """
+        Test that a failing load is raised to every waiting caller and the next call retries.
+        """
+        cache = Cache()
+        release = threading.Event()
+        calls = []
+
+        def failing_load():
+            calls.append(1)
+            release.wait(timeout=5)
+            raise RuntimeError("db down")
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [
+                pool.submit(cache.get_or_load, "k", failing_load) for _ in range(5)
+            ]
+            time.sleep(0.1)
+            release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError):
+                    future.result(timeout=5)
+
+        assert len(calls) == 1
+        assert cache.get_or_load("k", lambda: b"ok") == b"ok"
+
+    def test_run_sync_caller_waits_on_thread_flight(self):
+        """
+        Test that a caller on the event loop inside run_sync (a greenlet) joins a
+        flight led by a thread without loading itself or blocking the loop, and that
+        a plain caller on the loop, which cannot wait, counts as a miss.
+        """
+        cache = Cache()
+        release = threading.Event()
+        calls = []
+
+        def slow_load():
+            calls.append("leader")
+            release.wait(timeout=5)
+            return b"value"
+
+        def own_load():
+            calls.append("follower")
+            return b"own"
+
+        async def main():
+            leader = asyncio.create_task(
+                asyncio.to_thread(cache.get_or_load, "k", slow_load)
+            )
+            while not calls:
+                await asyncio.sleep(0.01)
+            follower = asyncio.create_task(
+                greenlet_spawn(cache.get_or_load, "k", own_load)
+            )
+            await asyncio.sleep(0.05)  # the loop keeps running meanwhile
+            assert not follower.done()
+            assert cache.get_or_load("k", own_load) == b"own"
+            release.set()
+            return await leader, await follower
+
+        assert asyncio.run(main()) == (b"value", b"value")
+        assert calls == ["leader", "follower"]
+        counts = cache.metrics.snapshot()["k"]
+        assert (counts["misses"], counts["hits"]) == (2, 1)
+
+    def test_concurrent_async_misses_load_once(self):
+        """
+        Test that coroutines missing the same key at once share one load.
+        """
+        cache = Cache()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return b"value"
+
+        async def main():
+            return await asyncio.gather(
+                *(cache.get_or_load_async("k", load) for _ in range(20))
+            )
+
+        assert asyncio.run(main()) == [b"value"] * 20
+        assert len(calls) == 1
+
+    def test_cancelled_async_leader_hands_over_to_waiter(self):
+        """
+        Test that when the loading coroutine is cancelled a waiting caller loads instead.
+        """
+        cache = Cache()
+
+        async def load():
+            await asyncio.sleep(0.05)
+            return b"value"
+
+        async def main():
+            leader = asyncio.create_task(cache.get_or_load_async("k", load))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(cache.get_or_load_async("k", load))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await waiter
+
+        assert asyncio.run(main()) == b"value"
+
+
+class TestNegativeCache:
+    def test_missing_id_is_cached_as_not_found(self, query_counter):
+        """
+        Test that repeated reads of a nonexistent id reach the database only once.
+        """
+        response = client.get("/projects/987654321")
+        assert response.status_code == 404
+        assert global_cache.get("project:987654321") is NOT_FOUND
+
+        query_counter.reset()
+        for _ in range(10):
+            assert client.get("/projects/987654321").status_code == 404
+        assert query_counter.count == 0, query_counter.statements
+
+    def test_negative_entries_use_their_own_ttl(self):
+        """
+        Test that a cached miss expires after negative_ttl while real values stay.
+        """
+        cache = Cache(ttl=30, negative_ttl=0.05)
+        assert cache.get_or_load("missing", lambda: None) is None
+        assert cache.get_or_load("present", lambda: b"value") == b"value"
+        assert cache.get("missing") is NOT_FOUND
+
+        time.sleep(0.1)
+        assert cache.get("missing") is None
+        assert cache.get("present") == b"value"
+
+    def test_create_invalidates_negative_entry(self):
+        """
+        Test that creating a row drops a cached "not found" for its id.
+        """
+        payload = {
+            "name": "Negative Cache Project",
+            "description": "Project for negative cache testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        project_id = client.post("/projects/", json=payload).json()["id"]
+        next_id = project_id + 1
+        assert client.get(f"/projects/{next_id}").status_code == 404
+
+        created = client.post("/projects/", json=payload).json()
+        assert created["id"] == next_id
+        assert client.get(f"/projects/{next_id}").status_code == 200
+
+        client.delete(f"/projects/{project_id}")
+        client.delete(f"/projects/{next_id}")
+
+
+class TestStaleWhileRevalidate:
+    def test_stale_entry_is_served_while_refreshed_in_background(self):
+        """
+        Test that past its TTL an entry is returned at once, reloaded once in the
+        background, and that the reloaded value is served afterwards.
+        """
+        cache = Cache(ttl=0.05, stale_ttl=10)
+        loads = []
+        release = threading.Event()
+
+        def slow_refresh():
+            loads.append(1)
+            release.wait(5)
+            return b"new"
+
+        cache.get_or_load("k", lambda: b"old", refresh_fn=slow_refresh)
+        time.sleep(0.1)
+        started = time.monotonic()
+        for _ in range(5):
+            assert cache.get_or_load("k", lambda: b"unused") == b"old"
+        assert time.monotonic() - started < 0.5
+
+        release.set()
+        assert _wait_for(lambda: cache.get("k") == b"new")
+        assert len(loads) == 1
+        assert cache.stats()["k"]["refreshes"] == 1
+
+    def test_entry_past_grace_window_is_loaded_again(self):
+        """
+        Test that an entry nobody read during its grace window lapses.
+        """
+        cache = Cache(ttl=0.05, stale_ttl=0.05)
+        cache.get_or_load("k", lambda: b"old", refresh_fn=lambda: b"refreshed")
+        time.sleep(0.15)
+        assert cache.get_or_load("k", lambda: b"loaded") == b"loaded"
+
+    def test_invalidated_entry_is_never_served_stale(self):
+        """
+        Test that tag invalidation and delete() drop an entry for good, even
+        within its grace window.
+        """
+        cache = Cache(ttl=0.05, stale_ttl=10)
+        cache.get_or_load("page", lambda: b"old", ("tasks:*",), lambda: b"new")
+        cache.get_or_load("task:1", lambda: b"old", refresh_fn=lambda: b"new")
+        time.sleep(0.1)
+        cache.invalidate_tags("tasks:*")
+        cache.delete("task:1")
+        assert cache.get_or_load("page", lambda: b"loaded", ("tasks:*",)) == b"loaded"
+        assert cache.get_or_load("task:1", lambda: b"loaded") == b"loaded"
+
+    def test_delete_during_refresh_discards_its_result(self):
+        """
+        Test that a refresh that read the old row does not store it after a delete.
+        """
+        cache = Cache(ttl=0.05, stale_ttl=10)
+        release = threading.Event()
+
+        def slow_refresh():
+            release.wait(5)
+            return b"read before the write"
+
+        cache.get_or_load("task:1", lambda: b"old", refresh_fn=slow_refresh)
+        time.sleep(0.1)
+        assert cache.get_or_load("task:1", lambda: b"unused") == b"old"
+        cache.delete("task:1")
+        release.set()
+        time.sleep(0.1)
+        assert cache.get("task:1") is None
+
+    def test_get_project_serves_stale_body_then_refreshed_one(self, monkeypatch):
+        """
+        Test that GET /projects/{id} keeps answering from the cache across the TTL
+        boundary, and picks up a change made behind the cache's back once the
+        background refresh has run.
+        """
+        monkeypatch.setattr(global_cache, "ttl", 0.1)
+        monkeypatch.setattr(global_cache, "stale_ttl", 10)
+        payload = {
+            "name": "Stale Project",
+            "description": "Project for stale-while-revalidate testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        project_id = client.post("/projects/", json=payload).json()["id"]
+        assert client.get(f"/projects/{project_id}").json()["name"] == "Stale Project"
+
+        with database.SessionLocal() as db:
+            db.get(Project, project_id).name = "Renamed Elsewhere"
+            db.commit()
+        time.sleep(0.2)
+        assert client.get(f"/projects/{project_id}").json()["name"] == "Stale Project"
+        assert _wait_for(
+            lambda: client.get(f"/projects/{project_id}").json()["name"]
+            == "Renamed Elsewhere"
+        )
+
+        client.delete(f"/projects/{project_id}")
@@ -0,0 +1,230 @@
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.database_api.core.events import (
+    ChangeEvent,
+    EventBridge,
+    EventBroker,
+    PostgresBridge,
+    change_events,
+    sse_stream,
+)
+from backend.database_api.enum.change import ChangeEntity, ChangeOp
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+def task_event(task_id: int, project_id: int = 1) -> ChangeEvent:
+    return ChangeEvent(
+        ChangeEntity.TASK,
+        ChangeOp.UPDATED,
+        {"id": task_id, "project_id": project_id},
+        project_ids=frozenset([project_id]),
+        assignees=frozenset(["sam"]),
+    )
+
+
+async def next_event(subscription, timeout: float = 5.0):
+    return await asyncio.wait_for(subscription.queue.get(), timeout)
+
+
+class TestEvents:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create two projects with one task each.
+        """
+        project = {
+            "description": "Project for change event testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        cls.project_ids, cls.task_ids = [], []
+        for i in range(2):
+            project_id = client.post(
+                "/projects/", json={**project, "name": f"Events Project {i}"}
+            ).json()["id"]
+            task = {
+                "title": f"Events task {i}",
+                "assigned_to": "Sam",
+                "status": "to do",
+                "due_date": "2025-08-10",
+                "project_id": project_id,
+            }
+            cls.project_ids.append(project_id)
+            cls.task_ids.append(client.post("/tasks/", json=task).json()["id"])
+
+    def test_service_writes_are_pushed(self):
+        """
+        Test that a committed task update reaches the subscribers of its project,
+        with the updated row, and not those of other projects.
+        """
+
+        async def scenario():
+            mine = change_events.subscribe(project_id=self.project_ids[0])
+            other = change_events.subscribe(project_id=self.project_ids[1])
+            try:
+                # The API runs the write on its own thread and event loop.
+                await asyncio.to_thread(
+                    client.patch,
+                    f"/tasks/{self.task_ids[0]}",
+                    json={"status": "complete"},
+                )
+                event = await next_event(mine)
+                assert other.queue.empty()
+            finally:
+                change_events.unsubscribe(mine)
+                change_events.unsubscribe(other)
+            return event
+
+        event = asyncio.run(scenario())
+        assert (event.entity, event.op) == (ChangeEntity.TASK, ChangeOp.UPDATED)
+        assert event.data["id"] == self.task_ids[0]
+        assert event.data["status"] == "complete"
+
+    def test_assignee_filter_sees_reassignment(self):
+        """
+        Test that subscribers of an assignee (matched case-insensitively) see a task
+        reassigned away from them.
+        """
+
+        async def scenario():
+            subscription = change_events.subscribe(assigned_to="SAM")
+            try:
+                await asyncio.to_thread(
+                    client.patch,
+                    f"/tasks/{self.task_ids[1]}",
+                    json={"assigned_to": "Bob"},
+                )
+                return await next_event(subscription)
+            finally:
+                change_events.unsubscribe(subscription)
+
+        event = asyncio.run(scenario())
+        assert event.data["id"] == self.task_ids[1]
+        assert event.data["assigned_to"] == "bob"
+
+    def test_slow_subscriber_overflows(self):
+        """
+        Test that a subscriber whose queue is full gets OVERFLOW instead of more
+        buffered events, and that its stream then ends and unsubscribes.
+        """
+        broker = EventBroker(queue_size=2)
+
+        async def scenario():
+            subscription = broker.subscribe()
+            # Published from another thread, as the threadpool services do.
+            publisher = threading.Thread(
+                target=broker.publish, args=([task_event(i) for i in range(3)],)
+            )
+            publisher.start()
+            await asyncio.to_thread(publisher.join)
+            await asyncio.sleep(0)
+
+            async def connected():
+                return False
+
+            chunks = [
+                chunk
+                async for chunk in sse_stream(broker, subscription, connected, 5.0)
+            ]
+            return subscription, chunks
+
+        subscription, chunks = asyncio.run(scenario())
+        assert subscription.overflowed
+        assert chunks == [
+            b"event: overflow\n"
+            b'data: {"detail":"Too far behind; resync with GET /changes"}\n\n'
+        ]
+        assert broker.subscriber_count() == 0
+
+    def test_sse_stream_format(self):
+        """
+        Test that events are framed as SSE "change" events, that an idle stream
+        sends keep-alive comments, and that it ends once the client disconnects.
+        """
+        broker = EventBroker(queue_size=10)
+        disconnected = []
+
+        async def scenario():
+            subscription = broker.subscribe(project_id=7)
+            broker.publish([task_event(1, project_id=7), task_event(2, project_id=8)])
+            await asyncio.sleep(0)
+
+            async def is_disconnected():
+                return bool(disconnected)
+
+            chunks = []
+            async for chunk in sse_stream(broker, subscription, is_disconnected, 0.01):
+                chunks.append(chunk)
+                if chunk.startswith(b":"):
+                    disconnected.append(True)
+            return chunks
+
+        change, keepalive = asyncio.run(scenario())
+        event_line, data_line, *_ = change.decode().split("\n")
+        assert event_line == "event: change"
+        assert json.loads(data_line.removeprefix("data: ")) == {
+            "entity": "task",
+            "op": "updated",
+            "id": 1,
+            "data": {"id": 1, "project_id": 7},
+        }
+        assert keepalive == b": keepalive\n\n"
+        assert broker.subscriber_count() == 0
+
+    def test_bridge_message_round_trip(self):
+        """
+        Test that an event survives the message form used by the Postgres bridge.
+        """
+        event = task_event(3)
+        message = json.loads(json.dumps(event.to_message()))
+        assert ChangeEvent.from_message(message) == event
+
+    def test_bridge_publish_does_not_wait_for_postgres(self):
+        """
+        Test that PostgresBridge.publish returns while the notify is still blocked,
+        and that the sender thread then sends the messages in publish order.
+        """
+        bridge = PostgresBridge("postgresql://unused")
+        release = threading.Event()
+        conn = MagicMock(closed=False)
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.executemany.side_effect = lambda sql, payloads: release.wait(5)
+        bridge._connect = lambda: conn
+
+        bridge.publish([task_event(1).to_message()])
+        bridge.publish([task_event(2).to_message()])
+        assert not release.is_set()
+        release.set()
+        bridge._sender.shutdown(wait=True)
+
+        sent = [call.args[1] for call in cursor.executemany.call_args_list]
+        assert [json.loads(p[0][1])["data"]["id"] for p in sent] == [1, 2]
+
+    def test_incomplete_bridge_is_rejected(self):
+        """
+        Test that a bridge without subscribe() fails when it is created.
+        """
+
+        class PublishOnlyBridge(EventBridge):
+            def publish(self, messages):
+                pass
+
+        with pytest.raises(TypeError):
+            PublishOnlyBridge()
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the projects (and their tasks) after tests complete.
+        """
+        for project_id in cls.project_ids:
+            client.delete(f"/projects/{project_id}")
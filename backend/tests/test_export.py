@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from backend.database_api.core.export import ExportFormat
+from backend.database_api.db.connection import database
+from backend.database_api.db.repositories.task_repository import TaskRepository
+from backend.database_api.main import app
+from backend.database_api.services.task_service import TaskService
+
+client = TestClient(app)
+
+
+class TestExport:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create a project with three tasks, two assigned to Export.
+        """
+        payload = {
+            "name": "Export Project",
+            "description": "Project for export testing",
+            "start_date": "2025-09-01",
+            "end_date": "2025-09-30",
+            "status": "in progress",
+        }
+        cls.project_id = client.post("/projects/", json=payload).json()["id"]
+        cls.task_ids = []
+        for i, assignee in enumerate(["Export", "Export", "Someone"]):
+            task = {
+                "title": f"Export task {i}",
+                "assigned_to": assignee,
+                "status": "to do",
+                "due_date": "2025-09-10",
+                "project_id": cls.project_id,
+            }
+            cls.task_ids.append(client.post("/tasks/", json=task).json()["id"])
+
+    def test_tasks_ndjson_matches_filters(self):
+        """
+        Test that /tasks/export streams one JSON object per matching task, by id,
+        with the same fields as GET /tasks/{id}.
+        """
+        response = client.get(
+            "/tasks/export",
+            params={"project_id": self.project_id, "assigned_to": "Export"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="tasks.ndjson"' in response.headers["content-disposition"]
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["id"] for row in rows] == self.task_ids[:2]
+        assert rows[0] == client.get(f"/tasks/{self.task_ids[0]}").json()
+
+    def test_tasks_csv_has_header(self):
+        """
+        Test that format=csv returns a header row followed by one record per task.
+        """
+        response = client.get(
+            "/tasks/export", params={"project_id": self.project_id, "format": "csv"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+
+        records = list(csv.DictReader(io.StringIO(response.text)))
+        assert [int(r["id"]) for r in records] == self.task_ids
+        assert records[2]["assigned_to"] == "someone"
+
+    def test_modified_since(self):
+        """
+        Test that modified_since keeps only rows changed at or after the given time.
+        """
+        future = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        params = {"project_id": self.project_id, "modified_since": future}
+        assert client.get("/tasks/export", params=params).text == ""
+
+        past = "2001-01-01T00:00:00Z"
+        params = {"project_id": self.project_id, "modified_since": past}
+        assert len(client.get("/tasks/export", params=params).text.splitlines()) == 3
+
+        params = {"name": "Export Project", "modified_since": past}
+        rows = client.get("/projects/export", params=params).text.splitlines()
+        assert [json.loads(row)["id"] for row in rows] == [self.project_id]
+        assert "tasks" not in json.loads(rows[0])
+
+    def test_one_chunk_per_batch(self):
+        """
+        Test that the service encodes one chunk per batch read from the cursor.
+        """
+        with database.SessionLocal() as db:
+            service = TaskService(TaskRepository(db))
+            chunks = list(
+                service.export(
+                    fmt=ExportFormat.NDJSON, batch_size=2, project_id=self.project_id
+                )
+            )
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 1]
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the project (and its tasks) after tests complete.
+        """
+        client.delete(f"/projects/{cls.project_id}")
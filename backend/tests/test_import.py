@@ -0,0 +1,180 @@
+import io
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from backend.database_api.core.bulk_import import read_records
+from backend.database_api.core.export import ExportFormat
+from backend.database_api.db.connection import database
+from backend.database_api.db.models import Project
+from backend.database_api.db.repositories.project_repository import ProjectRepository
+from backend.database_api.db.repositories.project_stats_repository import (
+    missing_project_ids,
+)
+from backend.database_api.db.repositories.task_repository import TaskRepository
+from backend.database_api.main import app
+from backend.database_api.services.project_service import ProjectService
+from backend.database_api.services.task_service import TaskService
+
+client = TestClient(app)
+
+
+def _task(title: str, project_id: int, status: str = "to do") -> dict:
+    return {
+        "title": title,
+        "assigned_to": "Importer",
+        "status": status,
+        "due_date": "2025-10-10T00:00:00",
+        "project_id": project_id,
+    }
+
+
+class TestImport:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create a project to import tasks into.
+        """
+        payload = {
+            "name": "Import Project",
+            "description": "Project for import testing",
+            "start_date": "2025-10-01",
+            "end_date": "2025-10-31",
+            "status": "in progress",
+        }
+        cls.project_id = client.post("/projects/", json=payload).json()["id"]
+
+    def _titles(self) -> list[str]:
+        tasks = client.get("/tasks", params={"project_id": self.project_id}).json()
+        return [task["title"] for task in tasks]
+
+    def test_ndjson_loads_valid_records_and_reports_the_rest(self):
+        """
+        Test that valid records are loaded, and invalid JSON, invalid fields and
+        missing projects are reported by record index without stopping the import.
+        """
+        assert self._titles() == []
+        lines = [
+            json.dumps(_task("Imported 0", self.project_id)),
+            "{not json",
+            "",
+            json.dumps(_task("Imported 1", self.project_id, status="unknown")),
+            json.dumps(_task("Imported 2", 999_999)),
+            json.dumps(_task("Imported 3", self.project_id)),
+        ]
+        response = client.post("/tasks/import", content="\n".join(lines) + "\n")
+        assert response.status_code == 200
+        report = response.json()
+        assert report["records"] == 5
+        assert report["imported"] == 2
+        assert report["rejected"] == 3
+        assert [error["index"] for error in report["errors"]] == [1, 2, 3]
+        assert report["errors"][1]["error"].startswith("status:")
+        assert report["errors"][2]["error"] == "Project 999999 not found"
+
+        assert self._titles() == ["Imported 0", "Imported 3"]
+
+    def test_csv_export_round_trip(self):
+        """
+        Test that a CSV export can be imported back: the extra columns are ignored.
+        """
+        before = self._titles()
+        exported = client.get(
+            "/tasks/export", params={"project_id": self.project_id, "format": "csv"}
+        )
+        response = client.post(
+            "/tasks/import", params={"format": "csv"}, content=exported.content
+        )
+        assert response.json()["imported"] == len(before)
+        assert self._titles() == before * 2
+
+    def test_projects_import(self):
+        """
+        Test that projects are imported with their counters, show up in the (cached)
+        project list, and replace a cached "not found" for their ids.
+        """
+        params = {"name": "Imported project"}
+        assert client.get("/projects", params=params).json() == []
+        with database.SessionLocal() as db:
+            next_id = db.scalar(select(func.max(Project.id))) + 1
+        assert client.get(f"/projects/{next_id}").status_code == 404
+        lines = [
+            json.dumps(
+                {
+                    "name": f"Imported project {i}",
+                    "description": "from the legacy tracker",
+                    "start_date": "2025-10-01",
+                    "end_date": "2025-10-31",
+                    "status": "to do",
+                }
+            )
+            for i in range(3)
+        ]
+        response = client.post("/projects/import", content="\n".join(lines))
+        assert response.json()["imported"] == 3
+
+        projects = client.get("/projects", params=params).json()
+        assert len(projects) == 3
+        assert next_id in {project["id"] for project in projects}
+        assert client.get(f"/projects/{next_id}").status_code == 200
+        for project in projects:
+            summary = client.get(f"/projects/{project['id']}/summary").json()
+            assert summary["task_count"] == 0
+            client.delete(f"/projects/{project['id']}")
+
+    def test_project_import_chunks_get_stats_rows(self):
+        """
+        Test that each committed chunk of a project import brings the stats rows of
+        its own projects, and that the service reports every new project.
+        """
+        ndjson = "".join(
+            json.dumps(
+                {
+                    "name": f"Chunked project {i}",
+                    "description": "from the legacy tracker",
+                    "start_date": "2025-10-01",
+                    "end_date": "2025-10-31",
+                    "status": "to do",
+                }
+            )
+            + "\n"
+            for i in range(5)
+        )
+        with database.SessionLocal() as db:
+            report = ProjectService(ProjectRepository(db)).import_records(
+                read_records(io.BytesIO(ndjson.encode()), ExportFormat.NDJSON),
+                chunk_size=2,
+            )
+            assert report.imported == 5
+            project_ids = db.scalars(
+                select(Project.id).where(Project.name.like("Chunked project %"))
+            ).all()
+            assert len(project_ids) == 5
+            assert db.scalars(missing_project_ids()).all() == []
+        for project_id in project_ids:
+            client.delete(f"/projects/{project_id}")
+
+    def test_progress_per_chunk(self):
+        """
+        Test that the service commits and reports progress once per chunk.
+        """
+        ndjson = "".join(
+            json.dumps(_task(f"Chunked {i}", self.project_id)) + "\n" for i in range(5)
+        )
+        progress = []
+        with database.SessionLocal() as db:
+            report = TaskService(TaskRepository(db)).import_records(
+                read_records(io.BytesIO(ndjson.encode()), ExportFormat.NDJSON),
+                chunk_size=2,
+                on_progress=lambda r: progress.append((r.records, r.imported)),
+            )
+        assert progress == [(2, 2), (4, 4), (5, 5)]
+        assert report.imported == 5 and report.errors == []
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the project (and its tasks) after tests complete.
+        """
+        client.delete(f"/projects/{cls.project_id}")
@@ -0,0 +1,157 @@
+import re
+from datetime import datetime
+
+import pytest
+
+from backend.database_api.db.connection import database
+from backend.database_api.db.repositories.change_repository import ChangeRepository
+from backend.database_api.db.repositories.project_repository import ProjectRepository
+from backend.database_api.db.repositories.task_repository import TaskRepository
+from backend.database_api.enum.status import TaskStatus
+
+# Filter combinations issued by TaskRepository.list, with the index expected to
+# serve each.
+FILTER_COMBINATIONS = [
+    ({"project_id": 1}, "ix_tasks_project_id_id"),
+    (
+        {"project_id": 1, "status": TaskStatus.IN_PROGRESS},
+        "ix_tasks_project_id_status_id",
+    ),
+    ({"status": TaskStatus.TO_DO}, "ix_tasks_status_id"),
+    (
+        {"due_after": datetime(2025, 8, 1), "due_before": datetime(2025, 9, 1)},
+        "ix_tasks_due_date",
+    ),
+]
+
+# Sources of the change feed, with their table and the index expected to serve each.
+CHANGE_SOURCES = [
+    ("project", "projects", "ix_projects_last_modified_id"),
+    ("task", "tasks", "ix_tasks_last_modified_id"),
+    ("tombstone", "tombstones", "ix_tombstones_deleted_at_id"),
+]
+
+# Unanchored ILIKE can only use an index through pg_trgm, which SQLite lacks.
+POSTGRES_ONLY_COMBINATIONS = [
+    ({"title": "review"}, "ix_tasks_title_trgm"),
+    ({"assigned_to": "penelope"}, "ix_tasks_assigned_to_trgm"),
+    (
+        {"assigned_to": "penelope", "status": TaskStatus.TO_DO},
+        "ix_tasks_status_assigned_to_trgm",
+    ),
+]
+
+
+def assert_searches(plan: str, table: str, index_name: str) -> None:
+    """
+    Assert, in the dialect's own EXPLAIN wording, that `plan` looks rows of `table`
+    up through `index_name` and never reads the whole table.
+    """
+    if database.engine.dialect.name == "postgresql":
+        uses = (
+            f"Index Scan using {index_name} on {table}",
+            f"Index Only Scan using {index_name} on {table}",
+            f"Bitmap Index Scan on {index_name}",
+        )
+        assert any(use in plan for use in uses), plan
+        assert f"Seq Scan on {table}" not in plan, plan
+        return
+    # SQLite: SEARCH uses a key of the index; SCAN reads every row (of the table,
+    # or of an index in its order).
+    search = rf"^SEARCH {table} USING (COVERING )?INDEX {index_name} \("
+    assert re.search(search, plan, re.MULTILINE), plan
+    assert not re.search(rf"^SCAN {table}\b", plan, re.MULTILINE), plan
+
+
+def explain(filters: dict) -> str:
+    """
+    Return the query plan of TaskRepository.list for the given filters as one string.
+    """
+    def build_query(db):
+        return TaskRepository(db).filtered_query(**filters).order_by("id").limit(101)
+
+    return explain_query(build_query)
+
+
+def explain_query(build_query) -> str:
+    """
+    Return the plan of the Query (or Select) built by build_query(session) as one
+    string.
+    On Postgres sequential scans are disabled so the plan shows whether an index
+    *can* serve the query, independent of how few rows the test database holds.
+    """
+    with database.SessionLocal() as db:
+        query = build_query(db)
+        # A Query, or a Core Select.
+        statement = getattr(query, "statement", query)
+        compiled = statement.compile(dialect=database.engine.dialect)
+        if compiled.positional:
+            params = tuple(compiled.params[name] for name in compiled.positiontup)
+        else:
+            params = compiled.params
+        conn = db.connection()
+        if database.engine.dialect.name == "postgresql":
+            conn.exec_driver_sql("SET enable_seqscan = off")
+            rows = conn.exec_driver_sql(f"EXPLAIN {compiled}", params).all()
+            return "\n".join(row[0] for row in rows)
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+        return "\n".join(row[-1] for row in rows)
+
+
+class TestIndexUsage:
+    @classmethod
+    def setup_class(cls):
+        """
+        Make sure the tables and migration-managed indexes exist before explaining.
+        """
+        database.init_db()
+        # SQLite: a pooled connection opened before the migrations keeps planning
+        # EXPLAIN QUERY PLAN (which never reads the table, so never notices the
+        # schema change) without the new indexes. Explain on fresh connections.
+        database.engine.dispose()
+
+    @pytest.mark.parametrize("filters,index_name", FILTER_COMBINATIONS)
+    def test_filter_combination_uses_index(self, filters, index_name):
+        """
+        Test that every hot filter combination is answered through its index,
+        not a full scan of the tasks table.
+        """
+        assert_searches(explain(filters), "tasks", index_name)
+
+    @pytest.mark.parametrize("filters,index_name", POSTGRES_ONLY_COMBINATIONS)
+    def test_substring_filter_uses_trigram_index(self, filters, index_name):
+        """
+        Test that substring filters, alone or with status, use the pg_trgm GIN
+        indexes on Postgres.
+        """
+        if database.engine.dialect.name != "postgresql":
+            pytest.skip("pg_trgm indexes are Postgres only")
+        assert_searches(explain(filters), "tasks", index_name)
+
+    def test_summary_reads_open_tasks_through_partial_index(self):
+        """
+        Test that the overdue count and next due date of a project summary scan
+        only the open tasks of that project, through the partial index.
+        """
+        plan = explain_query(
+            lambda db: ProjectRepository(db).summary_query(
+                datetime(2025, 8, 1), project_id=1
+            )
+        )
+        assert_searches(plan, "tasks", "ix_tasks_open_project_id_due_date")
+
+    @pytest.mark.parametrize("source,table,index_name", CHANGE_SOURCES)
+    def test_change_feed_reads_through_last_modified_index(
+        self, source, table, index_name
+    ):
+        """
+        Test that a change feed page is a range scan of each source's
+        (changed_at, id) index, whose cost depends on the changes it returns.
+        """
+        after = (datetime(2025, 8, 1), "task", 10)
+        plan = explain_query(
+            lambda db: ChangeRepository.changed_query(
+                source, [], after, datetime(2025, 9, 1), 101
+            )
+        )
+        assert_searches(plan, table, index_name)
@@ -0,0 +1,179 @@
+from fastapi.testclient import TestClient
+
+from backend.database_api.core.cache import Cache
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+def _project_payload(name: str) -> dict:
+    return {
+        "name": name,
+        "description": "Project for list cache testing",
+        "start_date": "2025-08-01",
+        "end_date": "2025-08-15",
+        "status": "in progress",
+    }
+
+
+def _task_payload(project_id: int, title: str) -> dict:
+    return {
+        "title": title,
+        "assigned_to": "Ulysses",
+        "status": "to do",
+        "due_date": "2025-08-10",
+        "project_id": project_id,
+    }
+
+
+class TestListCache:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create two projects with one task each.
+        """
+        cls.project_ids = []
+        for name in ("List Cache A", "List Cache B"):
+            response = client.post("/projects/", json=_project_payload(name))
+            project_id = response.json()["id"]
+            client.post("/tasks/", json=_task_payload(project_id, f"{name} task"))
+            cls.project_ids.append(project_id)
+
+    def test_repeated_list_is_served_from_cache(self, query_counter):
+        """
+        Test that the same filters, spelled differently, are answered without SQL
+        after the first request.
+        """
+        first = client.get(
+            "/tasks", params={"assigned_to": "ulysses", "status": "to do"}
+        )
+        assert first.status_code == 200
+        query_counter.reset()
+        second = client.get(
+            "/tasks", params={"status": "to do", "assigned_to": "ULYSSES"}
+        )
+        assert second.content == first.content
+        assert query_counter.count == 0, query_counter.statements
+
+    def test_task_write_invalidates_only_affected_project(self, query_counter):
+        """
+        Test that creating a task in project A refreshes A's task list but leaves
+        the cached list of project B untouched.
+        """
+        project_a, project_b = self.project_ids
+        client.get("/tasks", params={"project_id": project_a})
+        client.get("/tasks", params={"project_id": project_b})
+
+        client.post("/tasks/", json=_task_payload(project_a, "Second task"))
+
+        query_counter.reset()
+        listed_b = client.get("/tasks", params={"project_id": project_b}).json()
+        assert len(listed_b) == 1
+        assert query_counter.count == 0, query_counter.statements
+
+        listed_a = client.get("/tasks", params={"project_id": project_a}).json()
+        assert [t["title"] for t in listed_a][-1] == "Second task"
+        assert query_counter.count > 0
+
+    def test_task_write_invalidates_cached_project_view(self, query_counter):
+        """
+        Test that GET /projects/{id}, which embeds the tasks, reflects a task write
+        in that project while other projects stay cached.
+        """
+        project_a, project_b = self.project_ids
+        client.get(f"/projects/{project_a}")
+        client.get(f"/projects/{project_b}")
+
+        task = client.post("/tasks/", json=_task_payload(project_a, "Embedded")).json()
+        client.patch(f"/tasks/{task['id']}", json={"status": "complete"})
+
+        query_counter.reset()
+        client.get(f"/projects/{project_b}")
+        assert query_counter.count == 0, query_counter.statements
+        tasks = client.get(f"/projects/{project_a}").json()["tasks"]
+        assert {"id": task["id"], "status": "complete"}.items() <= next(
+            t for t in tasks if t["id"] == task["id"]
+        ).items()
+        client.delete(f"/tasks/{task['id']}")
+
+    def test_moving_a_task_invalidates_both_projects(self):
+        """
+        Test that moving a task between projects updates the cached views and task
+        lists of the project it left and of the one it joined.
+        """
+        project_a, project_b = self.project_ids
+        response = client.post("/tasks/", json=_task_payload(project_a, "Mover"))
+        task_id = response.json()["id"]
+
+        def listed_in(project_id) -> tuple[bool, bool]:
+            view = client.get(f"/projects/{project_id}").json()["tasks"]
+            page = client.get("/tasks", params={"project_id": project_id}).json()
+            return (
+                task_id in {t["id"] for t in view},
+                task_id in {t["id"] for t in page},
+            )
+
+        assert listed_in(project_a) == (True, True)
+        assert listed_in(project_b) == (False, False)
+
+        client.patch(f"/tasks/{task_id}", json={"project_id": project_b})
+        assert listed_in(project_a) == (False, False)
+        assert listed_in(project_b) == (True, True)
+
+        items = [{"id": task_id, "project_id": project_a}]
+        client.patch("/tasks/bulk", json={"items": items})
+        assert listed_in(project_a) == (True, True)
+        assert listed_in(project_b) == (False, False)
+        client.delete(f"/tasks/{task_id}")
+
+    def test_project_update_invalidates_project_lists(self):
+        """
+        Test that renaming a project is visible in a previously cached project list.
+        """
+        project_id = self.project_ids[1]
+        params = {"name": "List Cache", "include_tasks": "false"}
+        before = client.get("/projects", params=params).json()
+        assert project_id in [p["id"] for p in before]
+
+        client.patch(f"/projects/{project_id}", json={"name": "Renamed Elsewhere"})
+        after = client.get("/projects", params=params).json()
+        assert project_id not in [p["id"] for p in after]
+        client.patch(f"/projects/{project_id}", json={"name": "List Cache B"})
+
+    def test_next_cursor_is_cached_with_the_page(self):
+        """
+        Test that a cached page keeps its X-Next-Cursor header.
+        """
+        params = {"name": "List Cache", "limit": 1}
+        first = client.get("/projects", params=params)
+        second = client.get("/projects", params=params)
+        assert first.headers["X-Next-Cursor"]
+        assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    def test_tag_invalidation_during_load_leaves_entry_stale(self):
+        """
+        Test that a value loaded while one of its tags is invalidated is not served.
+        """
+        cache = Cache()
+
+        def load_racing_a_write():
+            cache.invalidate_tags("tasks:*")
+            return b"old"
+
+        assert cache.get_or_load("k", load_racing_a_write, tags=("tasks:*",)) == b"old"
+        assert cache.get("k") is None
+
+        cache.set("k", b"new", tags=("tasks:*",))
+        cache.set("other", b"kept", tags=("project:1",))
+        assert cache.get("k") == b"new"
+        cache.invalidate_tags("tasks:*")
+        assert cache.get("k") is None
+        assert cache.get("other") == b"kept"
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the projects (and their tasks) after tests complete.
+        """
+        for project_id in cls.project_ids:
+            client.delete(f"/projects/{project_id}")
@@ -0,0 +1,45 @@
+from sqlalchemy import inspect
+
+from backend.database_api.db.connection import database
+from backend.database_api.db.migrations import (
+    MIGRATIONS,
+    applied_versions,
+    run_migrations,
+)
+
+
+class TestMigrations:
+    def test_all_migrations_recorded(self):
+        """
+        Test that init_db (run when the app is imported) applied and recorded every migration.
+        """
+        database.init_db()
+        with database.engine.connect() as conn:
+            assert applied_versions(conn) == {m.version for m in MIGRATIONS}
+
+    def test_run_migrations_is_idempotent(self):
+        """
+        Test that a second run finds nothing left to apply.
+        """
+        run_migrations(database.engine)
+        assert run_migrations(database.engine) == []
+
+    def test_trigram_indexes_on_postgres(self):
+        """
+        Test that the pg_trgm indexes exist on Postgres.
+        Other dialects have no trigram support and simply skip them.
+        """
+        indexes = {
+            ix["name"]
+            for table in ("projects", "tasks")
+            for ix in inspect(database.engine).get_indexes(table)
+        }
+        trigram_indexes = {
+            "ix_projects_name_trgm",
+            "ix_tasks_title_trgm",
+            "ix_tasks_assigned_to_trgm",
+        }
+        if database.engine.dialect.name == "postgresql":
+            assert trigram_indexes <= indexes
+        else:
+            assert not trigram_indexes & indexes
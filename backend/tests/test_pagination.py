@@ -0,0 +1,151 @@
+from fastapi.testclient import TestClient
+
+from backend.database_api.core.config import settings
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+class TestPagination:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create a project with five tasks,
+        which are paged through in the tests below.
+        """
+        payload = {
+            "name": "Pagination Test Project",
+            "description": "Project for pagination testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        response = client.post("/projects/", json=payload)
+        assert response.status_code == 200
+        cls.project_id = response.json()["id"]
+
+        cls.task_ids = []
+        for i in range(5):
+            task_payload = {
+                "title": f"Paged Task {i}",
+                "assigned_to": "Penelope",
+                "status": "to do",
+                "due_date": "2025-08-10",
+                "project_id": cls.project_id,
+            }
+            response = client.post("/tasks", json=task_payload)
+            assert response.status_code == 200
+            cls.task_ids.append(response.json()["id"])
+
+    def test_list_tasks_follows_cursor_until_exhausted(self):
+        """
+        Test walking every page of a filtered task list with limit=2.
+        Each page should hold at most two tasks, pages should not overlap,
+        and the last page should come back without an X-Next-Cursor header.
+        """
+        seen = []
+        params = {"project_id": self.project_id, "limit": 2}
+        pages = 0
+        while True:
+            response = client.get("/tasks", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) <= 2
+            seen.extend(t["id"] for t in data)
+            pages += 1
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            params["cursor"] = next_cursor
+
+        assert pages == 3
+        assert seen == sorted(self.task_ids)
+
+    def test_list_tasks_limit(self):
+        """
+        Test that limit caps the page size and signals more rows with a cursor.
+        """
+        response = client.get(
+            "/tasks", params={"project_id": self.project_id, "limit": 1}
+        )
+        assert response.status_code == 200
+        assert [t["id"] for t in response.json()] == [min(self.task_ids)]
+        assert response.headers.get("X-Next-Cursor")
+
+    def test_list_limit_above_maximum_is_rejected(self):
+        """
+        Test that a limit above the configured maximum fails validation.
+        """
+        response = client.get("/tasks", params={"limit": 10**6})
+        assert response.status_code == 422
+
+    def test_list_invalid_cursor(self):
+        """
+        Test that a malformed cursor returns 400 instead of a server error.
+        """
+        response = client.get("/tasks", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+        response = client.get("/projects", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_list_projects_cursor(self):
+        """
+        Test that project listing pages by id and resumes after the cursor.
+        """
+        response = client.get(
+            "/projects", params={"name": "Pagination Test Project", "limit": 1}
+        )
+        assert response.status_code == 200
+        first_page = response.json()
+        assert len(first_page) == 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor:
+            response = client.get(
+                "/projects",
+                params={"name": "Pagination Test Project", "cursor": cursor},
+            )
+            assert all(p["id"] > first_page[0]["id"] for p in response.json())
+
+    def test_default_limit_is_signalled(self):
+        """
+        Test that a list request without limit stops at DEFAULT_PAGE_SIZE rows and
+        says so with X-Next-Cursor and a rel="next" Link, which leads to the rest,
+        and that the OpenAPI schema documents both headers.
+        """
+        extra = [
+            {
+                "title": f"Paged Task extra {i}",
+                "assigned_to": "Penelope",
+                "status": "to do",
+                "due_date": "2025-08-10",
+                "project_id": self.project_id,
+            }
+            for i in range(settings.DEFAULT_PAGE_SIZE)
+        ]
+        created = client.post("/tasks/bulk", json={"items": extra}).json()
+        total = len(self.task_ids) + len(created)
+
+        response = client.get("/tasks", params={"project_id": self.project_id})
+        assert len(response.json()) == settings.DEFAULT_PAGE_SIZE
+        cursor = response.headers["X-Next-Cursor"]
+        link = response.headers["Link"]
+        assert link.endswith('>; rel="next"') and f"cursor={cursor}" in link
+
+        rest = client.get(link[1 : link.index(">")])
+        assert len(rest.json()) == total - settings.DEFAULT_PAGE_SIZE
+        assert "X-Next-Cursor" not in rest.headers and "Link" not in rest.headers
+
+        ids = [t["id"] for t in created]
+        client.request("DELETE", "/tasks/bulk", json={"ids": ids})
+
+        headers = app.openapi()["paths"]["/tasks/"]["get"]["responses"]["200"]
+        assert {"X-Next-Cursor", "Link"} <= set(headers["headers"])
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the project (and its tasks) after tests complete.
+        """
+        client.delete(f"/projects/{cls.project_id}")
@@ -0,0 +1,39 @@
+from fastapi.testclient import TestClient
+
+from backend.database_api.db.pool_metrics import PoolMetrics
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+class TestPoolMetrics:
+    def test_histogram_buckets_are_cumulative(self):
+        """
+        Test that a wait lands in its own bucket and every larger one.
+        """
+        metrics = PoolMetrics()
+        metrics.observe(3.0)
+        metrics.observe(40.0)
+        metrics.observe(20000.0, timed_out=True)
+        snapshot = metrics.snapshot()
+        buckets = snapshot["wait_ms"]["buckets"]
+        assert snapshot["checkouts"] == 2
+        assert snapshot["timeouts"] == 1
+        assert buckets["1"] == 0
+        assert buckets["5"] == 1
+        assert buckets["50"] == 2
+        assert buckets["10000"] == 2
+        assert buckets["+Inf"] == 3
+
+    def test_pool_endpoint_reports_checkouts(self):
+        """
+        Test that /internal/pool exposes the configuration and counts checkouts
+        made by ordinary requests.
+        """
+        before = client.get("/internal/pool").json()
+        assert client.get("/tasks", params={"limit": 1}).status_code == 200
+        after = client.get("/internal/pool").json()
+
+        assert after["checkouts"] > before["checkouts"]
+        assert after["config"]["pool_size"] >= 1
+        assert "checked_out" in after and "overflow" in after
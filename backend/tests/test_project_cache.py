@@ -75,6 +75,32 @@ class TestProjectCache:
         assert r_after.status_code == 200
         assert r_after.json()["status"] == "complete"
 
+    def test_delete_project_drops_cached_tasks(self):
+        """
+        Test that deleting a project drops the cached bodies of the tasks deleted
+        with it, so reading one afterwards returns 404.
+        """
+        payload = {
+            "name": "Cache Test Project (deleted)",
+            "description": "Project deleted with a cached task",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        project_id = client.post("/projects/", json=payload).json()["id"]
+        task = {
+            "title": "Cached task",
+            "assigned_to": "Penelope",
+            "status": "to do",
+            "due_date": "2025-08-10",
+            "project_id": project_id,
+        }
+        task_id = client.post("/tasks/", json=task).json()["id"]
+        assert client.get(f"/tasks/{task_id}").status_code == 200
+
+        client.delete(f"/projects/{project_id}")
+        assert client.get(f"/tasks/{task_id}").status_code == 404
+
     @classmethod
     def teardown_class(cls):
         """
@@ -0,0 +1,84 @@
+from fastapi.testclient import TestClient
+
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+PROJECT_NAME = "Loading Strategy Project"
+
+
+class TestProjectLoading:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create three projects with three tasks each,
+        so an N+1 lazy load would show up as extra statements per project.
+        """
+        cls.project_ids = []
+        for i in range(3):
+            payload = {
+                "name": f"{PROJECT_NAME} {i}",
+                "description": "Project for loading strategy testing",
+                "start_date": "2025-08-01",
+                "end_date": "2025-08-15",
+                "status": "to do",
+            }
+            response = client.post("/projects/", json=payload)
+            assert response.status_code == 200
+            project_id = response.json()["id"]
+            cls.project_ids.append(project_id)
+            for j in range(3):
+                task_payload = {
+                    "title": f"Loading Task {j}",
+                    "assigned_to": "Penelope",
+                    "status": "to do",
+                    "due_date": "2025-08-10",
+                    "project_id": project_id,
+                }
+                response = client.post("/tasks", json=task_payload)
+                assert response.status_code == 200
+
+    def test_list_projects_batches_task_loading(self, query_counter):
+        """
+        Test that listing projects loads all their tasks in one batched query:
+        one SELECT for the projects and one for the tasks, regardless of project count.
+        """
+        query_counter.reset()
+        response = client.get("/projects", params={"name": PROJECT_NAME})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        assert all(len(p["tasks"]) == 3 for p in data)
+        assert query_counter.count == 2, query_counter.statements
+
+    def test_list_projects_without_tasks(self, query_counter):
+        """
+        Test that include_tasks=false skips the relationship entirely.
+        """
+        query_counter.reset()
+        response = client.get(
+            "/projects", params={"name": PROJECT_NAME, "include_tasks": "false"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        assert all(p["tasks"] == [] for p in data)
+        assert query_counter.count == 1, query_counter.statements
+
+    def test_get_project_loads_tasks_eagerly(self, query_counter):
+        """
+        Test that reading one project issues a fixed number of statements.
+        """
+        query_counter.reset()
+        response = client.get(f"/projects/{self.project_ids[0]}")
+        assert response.status_code == 200
+        assert len(response.json()["tasks"]) == 3
+        assert query_counter.count == 2, query_counter.statements
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the projects (and their tasks) after tests complete.
+        """
+        for project_id in cls.project_ids:
+            client.delete(f"/projects/{project_id}")
@@ -0,0 +1,147 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, select, update
+
+from backend.database_api.db.connection import database
+from backend.database_api.db.models import ProjectStats, Task
+from backend.database_api.db.repositories.project_stats_repository import (
+    ProjectStatsRepository,
+)
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+def _counts(project_id: int) -> dict:
+    with database.SessionLocal() as db:
+        stats = db.scalars(
+            select(ProjectStats).where(ProjectStats.project_id == project_id)
+        ).one()
+        return {
+            "task_count": stats.task_count,
+            "to_do": stats.to_do,
+            "in_progress": stats.in_progress,
+            "complete": stats.complete,
+        }
+
+
+def _task(title: str, project_id: int, status: str = "to do") -> dict:
+    return {
+        "title": title,
+        "assigned_to": "Stats",
+        "status": status,
+        "due_date": "2025-09-10",
+        "project_id": project_id,
+    }
+
+
+class TestProjectStats:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create two projects.
+        """
+        payload = {
+            "description": "Project for stats testing",
+            "start_date": "2025-09-01",
+            "end_date": "2025-09-30",
+            "status": "in progress",
+        }
+        cls.project_a = client.post(
+            "/projects/", json={**payload, "name": "Stats A"}
+        ).json()["id"]
+        cls.project_b = client.post(
+            "/projects/", json={**payload, "name": "Stats B"}
+        ).json()["id"]
+
+    def test_counters_follow_task_writes(self):
+        """
+        Test that creating, updating, moving and deleting tasks, one at a time and in
+        bulk, keeps both projects' counters exact.
+        """
+        empty = {"task_count": 0, "to_do": 0, "in_progress": 0, "complete": 0}
+        assert _counts(self.project_a) == empty
+
+        task_id = client.post("/tasks/", json=_task("One", self.project_a)).json()["id"]
+        client.patch(f"/tasks/{task_id}", json={"status": "in progress"})
+        assert _counts(self.project_a) == {**empty, "task_count": 1, "in_progress": 1}
+
+        client.patch(f"/tasks/{task_id}", json={"project_id": self.project_b})
+        assert _counts(self.project_a) == empty
+        assert _counts(self.project_b) == {**empty, "task_count": 1, "in_progress": 1}
+
+        items = [_task(f"Bulk {i}", self.project_a) for i in range(3)]
+        created = client.post("/tasks/bulk", json={"items": items}).json()
+        client.patch(
+            "/tasks/bulk",
+            json={
+                "items": [
+                    {"id": created[0]["id"], "status": "complete"},
+                    {"id": task_id, "project_id": self.project_a},
+                ]
+            },
+        )
+        assert _counts(self.project_a) == {
+            "task_count": 4,
+            "to_do": 2,
+            "in_progress": 1,
+            "complete": 1,
+        }
+        assert _counts(self.project_b) == empty
+
+        client.request(
+            "DELETE", "/tasks/bulk", json={"ids": [t["id"] for t in created]}
+        )
+        client.delete(f"/tasks/{task_id}")
+        assert _counts(self.project_a) == empty
+
+    def test_rebuild_repairs_drift(self):
+        """
+        Test that a write made outside the API leaves the counters stale until
+        rebuild() recomputes them from the tasks.
+        """
+        response = client.post("/tasks/", json=_task("Drift", self.project_b))
+        task_id = response.json()["id"]
+        with database.SessionLocal() as db:
+            db.execute(update(Task).where(Task.id == task_id).values(status="complete"))
+            db.commit()
+        assert _counts(self.project_b)["to_do"] == 1
+
+        with database.SessionLocal() as db:
+            ProjectStatsRepository(db).rebuild([self.project_a, self.project_b])
+            db.commit()
+        assert _counts(self.project_b) == {
+            "task_count": 1,
+            "to_do": 0,
+            "in_progress": 0,
+            "complete": 1,
+        }
+
+    def test_missing_stats_row_is_created_or_added_to(self):
+        """
+        Test that a task write for a project without a stats row inserts one from its
+        tasks, and that when the row already exists (a concurrent writer inserted it)
+        the same upsert adds the deltas to it instead of failing.
+        """
+        with database.SessionLocal() as db:
+            db.execute(
+                delete(ProjectStats).where(ProjectStats.project_id == self.project_a)
+            )
+            db.commit()
+        client.post("/tasks/", json=_task("Upsert", self.project_a))
+        expected = {"task_count": 1, "to_do": 1, "in_progress": 0, "complete": 0}
+        assert _counts(self.project_a) == expected
+
+        with database.SessionLocal() as db:
+            stats = ProjectStatsRepository(db)
+            values = {"to_do": ProjectStats.to_do + 1}
+            stats._create_or_add(self.project_a, values)
+            db.commit()
+        assert _counts(self.project_a) == {**expected, "to_do": 2}
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the projects (and their tasks) after tests complete.
+        """
+        client.delete(f"/projects/{cls.project_a}")
+        client.delete(f"/projects/{cls.project_b}")
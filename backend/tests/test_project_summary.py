@@ -0,0 +1,101 @@
+from fastapi.testclient import TestClient
+
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+class TestProjectSummary:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create a project with an overdue, a complete (past due) and
+        two upcoming tasks, and an empty project.
+        """
+        project = {
+            "description": "Project for summary testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        cls.project_id = client.post(
+            "/projects/", json={**project, "name": "Summary Project"}
+        ).json()["id"]
+        cls.empty_id = client.post(
+            "/projects/", json={**project, "name": "Summary Project (empty)"}
+        ).json()["id"]
+        for status, due_date in [
+            ("to do", "2001-01-01"),
+            ("complete", "2001-01-01"),
+            ("block", "2999-06-01"),
+            ("to do", "2999-01-01"),
+        ]:
+            task = {
+                "title": f"Summary task {status} {due_date}",
+                "assigned_to": "Sam",
+                "status": status,
+                "due_date": due_date,
+                "project_id": cls.project_id,
+            }
+            client.post("/tasks/", json=task)
+
+    def test_project_summary(self, query_counter):
+        """
+        Test that one project's counts, overdue count and next due date come from a
+        single query.
+        """
+        query_counter.reset()
+        response = client.get(f"/projects/{self.project_id}/summary")
+        assert response.status_code == 200
+        assert query_counter.count == 1, query_counter.statements
+        summary = response.json()
+        assert summary.pop("last_activity")
+        assert summary == {
+            "id": self.project_id,
+            "name": "Summary Project",
+            "status": "in progress",
+            "task_count": 4,
+            "status_counts": {
+                "to do": 2,
+                "in progress": 0,
+                "pending approval": 0,
+                "block": 1,
+                "complete": 1,
+            },
+            "overdue_count": 1,
+            "next_due_date": "2999-01-01T00:00:00",
+        }
+
+    def test_missing_project(self):
+        """
+        Test that summarizing a missing project returns 404.
+        """
+        response = client.get("/projects/999999/summary")
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Project not found"
+
+    def test_summaries_filter_and_page(self):
+        """
+        Test that /projects/summary takes the project list filters, includes
+        projects without tasks and pages with X-Next-Cursor.
+        """
+        params = {"name": "Summary Project", "limit": 1}
+        first = client.get("/projects/summary", params=params)
+        assert [s["id"] for s in first.json()] == [self.project_id]
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = client.get("/projects/summary", params={**params, "cursor": cursor})
+        [empty] = second.json()
+        assert empty["id"] == self.empty_id
+        assert empty["task_count"] == 0 and empty["overdue_count"] == 0
+        assert set(empty["status_counts"].values()) == {0}
+        assert empty["next_due_date"] is None
+        assert "X-Next-Cursor" not in second.headers
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the projects (and their tasks) after tests complete.
+        """
+        client.delete(f"/projects/{cls.project_id}")
+        client.delete(f"/projects/{cls.empty_id}")
@@ -0,0 +1,79 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.database_api.core import serialization
+from backend.database_api.main import app
+from backend.database_api.schemas.task import Task as TaskSchema
+
+client = TestClient(app)
+
+
+class TestSerialization:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps_matches_pydantic(self, monkeypatch, use_orjson):
+        """
+        Test that the fast encoder (and its standard library fallback) produces
+        the same bytes as model_dump_json() for a schema's field values.
+        """
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+        values = {
+            "id": 1,
+            "title": 'Déjà "vu" ✓',
+            "assigned_to": "zoë",
+            "status": "in progress",
+            "due_date": datetime(2025, 8, 10, 1, 2, 3, 500000),
+            "project_id": 2,
+            "created_time": datetime(2025, 8, 1),
+            "last_modified": datetime(2025, 8, 1, 12, 30),
+        }
+        expected = TaskSchema(**values).model_dump_json().encode()
+        assert serialization.dumps(values) == expected
+
+    def test_parse_fields(self):
+        """
+        Test that a sparse fieldset is normalized to the schema's field order with
+        id added, and that blank or unknown fields are handled.
+        """
+        available = ("id", "title", "status", "due_date")
+        assert serialization.parse_fields(" status,title ,", available) == (
+            "id",
+            "title",
+            "status",
+        )
+        assert serialization.parse_fields(None, available) == available
+        assert serialization.parse_fields(" ", available) == available
+        with pytest.raises(serialization.UnknownFieldError):
+            serialization.parse_fields("title,owner", available)
+
+    def test_list_page_matches_single_reads(self):
+        """
+        Test that a list page built from rows has the same task bodies as
+        GET /tasks/{id}, which goes through the schema.
+        """
+        project = {
+            "name": "Serialization Project",
+            "description": "Project for serialization testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        project_id = client.post("/projects/", json=project).json()["id"]
+        for i in range(3):
+            task = {
+                "title": f"Serialized ✓ {i}",
+                "assigned_to": "Zoë",
+                "status": "to do",
+                "due_date": "2025-08-10T08:30:00.25",
+                "project_id": project_id,
+            }
+            client.post("/tasks/", json=task)
+
+        page = client.get("/tasks", params={"project_id": project_id}).content
+        ids = [t["id"] for t in client.get(f"/projects/{project_id}").json()["tasks"]]
+        singles = [client.get(f"/tasks/{task_id}").content for task_id in ids]
+        assert page == b"[" + b",".join(singles) + b"]"
+
+        client.delete(f"/projects/{project_id}")
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+import fakeredis
+import pytest
+import redis
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+from backend.database_api.core.cache import NOT_FOUND, Cache
+from backend.database_api.core.cache_backends import CacheBackend, RedisBackend
+from backend.database_api.core.conditional import ValidatedBody
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    """Poll until condition() is true; invalidations arrive on a listener thread."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestSharedCache:
+    def setup_method(self):
+        """
+        Two Cache instances on one fake Redis server stand in for two uvicorn workers.
+        """
+        server = fakeredis.FakeServer()
+        self.worker_a = Cache(
+            backend=RedisBackend(fakeredis.FakeRedis(server=server)), l1_ttl=5
+        )
+        self.worker_b = Cache(
+            backend=RedisBackend(fakeredis.FakeRedis(server=server)), l1_ttl=5
+        )
+
+    def test_entry_loaded_by_one_worker_is_shared(self):
+        """
+        Test that a value loaded in one worker is served to the other without loading.
+        """
+        assert self.worker_a.get_or_load("project:1", lambda: b"{}") == b"{}"
+        assert self.worker_b.get_or_load("project:1", lambda: b"other") == b"{}"
+
+        page = (b"[]", "cursor")
+        self.worker_a.get_or_load("tasks:list:{}", lambda: page, tags=("tasks:*",))
+        assert self.worker_b.get("tasks:list:{}") == page
+
+        self.worker_a.get_or_load("project:2", lambda: None)
+        assert self.worker_b.get("project:2") is NOT_FOUND
+
+    def test_delete_is_broadcast_to_every_l1(self):
+        """
+        Test that deleting a key in one worker drops the other worker's local copy.
+        """
+        self.worker_a.set("task:7", b"old")
+        assert self.worker_b.get("task:7") == b"old"
+
+        self.worker_a.delete("task:7")
+        assert _wait_for(lambda: "task:7" not in self.worker_b._cache)
+        assert self.worker_b.get_or_load("task:7", lambda: b"new") == b"new"
+
+    def test_tag_invalidation_is_broadcast_to_every_l1(self):
+        """
+        Test that invalidating a tag in one worker makes tagged entries stale in all.
+        """
+        self.worker_a.get_or_load("page", lambda: (b"[1]", None), tags=("project:3",))
+        assert self.worker_b.get("page") == (b"[1]", None)
+
+        self.worker_a.invalidate_tags("project:3")
+        assert _wait_for(lambda: self.worker_b._tag_versions.get("project:3") == 1)
+        assert self.worker_b.get("page") is None
+
+    def test_backend_outage_falls_back_to_loading(self):
+        """
+        Test that an unreachable Redis degrades to the per-process cache, which
+        still honours local deletes and tag invalidations.
+        """
+        client = redis.Redis(port=1, socket_connect_timeout=0.05)
+        cache = Cache(backend=RedisBackend(client))
+        assert cache.get_or_load("project:1", lambda: b"{}") == b"{}"
+        assert cache.get("project:1") == b"{}"
+        cache.delete("project:1")
+        assert cache.get("project:1") is None
+
+        cache.get_or_load("page", lambda: (b"[]", None), tags=("tasks:*",))
+        cache.invalidate_tags("tasks:*")
+        assert cache.get("page") is None
+
+    def test_validated_body_is_shared_with_its_validators(self):
+        """
+        Test that a body cached with its ETag and Last-Modified reaches the other
+        worker with both intact.
+        """
+        body = ValidatedBody.build(b'{"id":7}', datetime(2025, 8, 1, 12, 30))
+        self.worker_a.get_or_load("task:7", lambda: body)
+        assert self.worker_b.get_or_load("task:7", lambda: None) == body
+
+    def test_run_sync_backend_calls_leave_the_event_loop(self):
+        """
+        Test that under AsyncSession.run_sync (a greenlet on the event loop) the
+        backend round trips of a load and an invalidation run on another thread.
+        """
+        server = fakeredis.FakeServer()
+        threads = []
+
+        class RecordingBackend(RedisBackend):
+            def get_with_tags(self, key, tags=()):
+                threads.append(threading.get_ident())
+                return super().get_with_tags(key, tags)
+
+            def incr_tags(self, tags):
+                threads.append(threading.get_ident())
+                return super().incr_tags(tags)
+
+        cache = Cache(backend=RecordingBackend(fakeredis.FakeRedis(server=server)))
+
+        def service_work():
+            value = cache.get_or_load("page", lambda: (b"[]", None), tags=("t",))
+            cache.invalidate_tags("t")
+            return value
+
+        async def main():
+            return await greenlet_spawn(service_work), threading.get_ident()
+
+        value, loop_thread = asyncio.run(main())
+        assert value == (b"[]", None)
+        assert len(threads) == 2 and loop_thread not in threads
+
+    def test_incomplete_backend_is_rejected(self):
+        """
+        Test that a backend missing part of the interface fails when it is created,
+        not on the first request that needs the missing method.
+        """
+
+        class GetOnlyBackend(CacheBackend):
+            def get_with_tags(self, key, tags=()):
+                return None, {}
+
+        with pytest.raises(TypeError):
+            GetOnlyBackend()
@@ -0,0 +1,134 @@
+from fastapi.testclient import TestClient
+
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+class TestSparseFields:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create a project with two tasks.
+        """
+        project = {
+            "name": "Sparse Fields Project",
+            "description": "Project for sparse fieldset testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        cls.project_id = client.post("/projects/", json=project).json()["id"]
+        cls.task_ids = [
+            client.post(
+                "/tasks/",
+                json={
+                    "title": f"Sparse task {i}",
+                    "assigned_to": "Sam",
+                    "status": "to do",
+                    "due_date": "2025-08-10",
+                    "project_id": cls.project_id,
+                },
+            ).json()["id"]
+            for i in range(2)
+        ]
+
+    def test_get_task_fields(self, query_counter):
+        """
+        Test that GET /tasks/{id}?fields= returns only the named fields plus id, and
+        selects only their columns.
+        """
+        query_counter.reset()
+        response = client.get(
+            f"/tasks/{self.task_ids[0]}", params={"fields": "title, status"}
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "id": self.task_ids[0],
+            "title": "Sparse task 0",
+            "status": "to do",
+        }
+        [select] = query_counter.statements
+        assert "tasks.title" in select and "tasks.assigned_to" not in select
+        assert "Last-Modified" not in response.headers
+
+    def test_list_tasks_fields(self, query_counter):
+        """
+        Test that the task list narrows its SELECT to the requested columns and
+        still pages by cursor.
+        """
+        params = {"project_id": self.project_id, "fields": "title", "limit": 1}
+        query_counter.reset()
+        first = client.get("/tasks/", params=params)
+        assert first.json() == [{"id": self.task_ids[0], "title": "Sparse task 0"}]
+        assert all("tasks.due_date" not in s for s in query_counter.statements)
+
+        second = client.get(
+            "/tasks/", params={**params, "cursor": first.headers["X-Next-Cursor"]}
+        )
+        assert second.json() == [{"id": self.task_ids[1], "title": "Sparse task 1"}]
+
+    def test_list_tasks_fields_cached_separately(self):
+        """
+        Test that a sparse page and the full page of the same filters are cached
+        under different keys.
+        """
+        params = {"project_id": self.project_id}
+        sparse = client.get("/tasks/", params={**params, "fields": "status"}).json()
+        full = client.get("/tasks/", params=params).json()
+        assert set(sparse[0]) == {"id", "status"}
+        assert "assigned_to" in full[0]
+
+    def test_project_fields_without_tasks(self, query_counter):
+        """
+        Test that projects requested without "tasks" in fields skip the task SELECT.
+        """
+        query_counter.reset()
+        response = client.get(
+            "/projects/", params={"name": "Sparse Fields", "fields": "name,status"}
+        )
+        assert response.json() == [
+            {
+                "id": self.project_id,
+                "name": "Sparse Fields Project",
+                "status": "in progress",
+            }
+        ]
+        assert query_counter.count == 1, query_counter.statements
+        assert "projects.description" not in query_counter.statements[0]
+
+    def test_project_fields_with_tasks(self):
+        """
+        Test that naming "tasks" in fields embeds the project's tasks.
+        """
+        response = client.get(
+            f"/projects/{self.project_id}", params={"fields": "name,tasks"}
+        )
+        project = response.json()
+        assert set(project) == {"id", "name", "tasks"}
+        assert [t["id"] for t in project["tasks"]] == self.task_ids
+
+    def test_unknown_field(self):
+        """
+        Test that fields naming something the schema lacks is rejected with 400.
+        """
+        for url in ("/tasks/", f"/tasks/{self.task_ids[0]}", "/projects/"):
+            response = client.get(url, params={"fields": "title,secret"})
+            assert response.status_code == 400, url
+            assert "secret" in response.json()["detail"]
+
+    def test_missing_resource_with_fields(self):
+        """
+        Test that a sparse fieldset of a missing task or project still returns 404.
+        """
+        task = client.get("/tasks/999999", params={"fields": "title"})
+        assert task.status_code == 404
+        project = client.get("/projects/999999", params={"fields": "name"})
+        assert project.status_code == 404
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the project (and its tasks) after tests complete.
+        """
+        client.delete(f"/projects/{cls.project_id}")
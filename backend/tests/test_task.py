@@ -97,6 +97,80 @@ class TestTasksFastAPI:
         data_post_patch = response_post_patch.json()
         assert data_post_patch["status"] == "complete"
 
+    def test_update_task_rejects_null_fields(self):
+        """
+        Test that setting a field to null (instead of omitting it) returns 422, one
+        task at a time and in bulk, and leaves the task readable and unchanged.
+        """
+        for field in ("project_id", "title"):
+            response = client.patch(f"/tasks/{self.task_id}", json={field: None})
+            assert response.status_code == 422
+        items = [{"id": self.task_id, "project_id": None}]
+        response = client.patch("/tasks/bulk", json={"items": items})
+        assert response.status_code == 422
+
+        response = client.get(f"/tasks/{self.task_id}")
+        assert response.status_code == 200
+        assert response.json()["project_id"] == self.project_id
+
+    def test_update_task_to_missing_project(self):
+        """
+        Test that moving the task to a project that does not exist returns 422 and
+        writes none of the update.
+        """
+        response = client.patch(
+            f"/tasks/{self.task_id}", json={"project_id": 999999999, "status": "block"}
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Project 999999999 not found"
+
+        data = client.get(f"/tasks/{self.task_id}").json()
+        assert data["project_id"] == self.project_id
+        assert data["status"] != "block"
+
+    def test_move_task_between_projects(self):
+        """
+        Test that moving the task to another project updates the task counters, the
+        cached project views and the cached task lists of both projects.
+        """
+        payload = {
+            "name": "UnitTest Task Project (target)",
+            "description": "Project for task moves",
+            "start_date": "2025-08-04",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        target_id = client.post("/projects/", json=payload).json()["id"]
+
+        def task_count(project_id) -> int:
+            return client.get(f"/projects/{project_id}/summary").json()["task_count"]
+
+        def listed_in(project_id) -> tuple[bool, bool]:
+            view = client.get(f"/projects/{project_id}").json()["tasks"]
+            page = client.get("/tasks", params={"project_id": project_id}).json()
+            return (
+                self.task_id in {t["id"] for t in view},
+                self.task_id in {t["id"] for t in page},
+            )
+
+        assert (task_count(self.project_id), task_count(target_id)) == (1, 0)
+        assert listed_in(self.project_id) == (True, True)
+        assert listed_in(target_id) == (False, False)
+        assert client.get(f"/tasks/{self.task_id}").json()["project_id"] != target_id
+
+        response = client.patch(
+            f"/tasks/{self.task_id}", json={"project_id": target_id}
+        )
+        assert response.status_code == 200
+        assert response.json()["project_id"] == target_id
+        assert client.get(f"/tasks/{self.task_id}").json()["project_id"] == target_id
+        assert (task_count(self.project_id), task_count(target_id)) == (0, 1)
+        assert listed_in(self.project_id) == (False, False)
+        assert listed_in(target_id) == (True, True)
+
+        client.patch(f"/tasks/{self.task_id}", json={"project_id": self.project_id})
+        client.delete(f"/projects/{target_id}")
+
     def test_list_tasks(self):
         """
         Test listing tasks filtered by the project ID.
@@ -0,0 +1,147 @@
+from fastapi.testclient import TestClient
+
+from backend.database_api.main import app
+
+client = TestClient(app)
+
+
+def _task_payload(project_id: int, i: int) -> dict:
+    return {
+        "title": f"Bulk Task {i}",
+        "assigned_to": "Penelope",
+        "status": "to do",
+        "due_date": "2025-08-10",
+        "project_id": project_id,
+    }
+
+
+class TestTaskBulk:
+    @classmethod
+    def setup_class(cls):
+        """
+        Setup method to create a project that the bulk-created tasks belong to.
+        """
+        payload = {
+            "name": "Bulk Test Project",
+            "description": "Project for bulk endpoint testing",
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-15",
+            "status": "in progress",
+        }
+        response = client.post("/projects/", json=payload)
+        assert response.status_code == 200
+        cls.project_id = response.json()["id"]
+
+    def test_bulk_lifecycle(self):
+        """
+        Test creating, updating and deleting 50 tasks with one request each:
+        - created tasks come back in input order with ids
+        - updates apply per item and deletes remove every task
+        """
+        items = [_task_payload(self.project_id, i) for i in range(50)]
+        response = client.post("/tasks/bulk", json={"items": items})
+        assert response.status_code == 200
+        created = response.json()
+        assert [t["title"] for t in created] == [f"Bulk Task {i}" for i in range(50)]
+        assert all(t["assigned_to"] == "penelope" for t in created)
+        ids = [t["id"] for t in created]
+
+        response = client.patch(
+            "/tasks/bulk",
+            json={
+                "items": [
+                    {"id": ids[0], "status": "complete"},
+                    {"id": ids[1], "title": "Renamed"},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        updated = {t["id"]: t for t in response.json()}
+        assert updated[ids[0]]["status"] == "complete"
+        assert updated[ids[1]]["title"] == "Renamed"
+        assert client.get(f"/tasks/{ids[0]}").json()["status"] == "complete"
+
+        response = client.request("DELETE", "/tasks/bulk", json={"ids": ids})
+        assert response.status_code == 200
+        assert sorted(t["id"] for t in response.json()) == sorted(ids)
+        assert client.get(f"/tasks/{ids[0]}").status_code == 404
+
+    def test_bulk_create_reports_errors_per_item(self):
+        """
+        Test that one invalid item rejects the whole batch and is reported by index.
+        """
+        items = [
+            _task_payload(self.project_id, 0),
+            _task_payload(999999999, 1),
+        ]
+        response = client.post("/tasks/bulk", json={"items": items})
+        assert response.status_code == 422
+        assert response.json()["detail"] == [
+            {"index": 1, "error": "Project 999999999 not found"}
+        ]
+        listed = client.get("/tasks", params={"project_id": self.project_id}).json()
+        assert not any(t["title"] == "Bulk Task 0" for t in listed)
+
+    def test_bulk_update_and_delete_report_missing_and_duplicate_ids(self):
+        """
+        Test that unknown and repeated ids are reported per item without writing anything.
+        """
+        created = client.post(
+            "/tasks/bulk", json={"items": [_task_payload(self.project_id, 0)]}
+        ).json()
+        task_id = created[0]["id"]
+
+        response = client.patch(
+            "/tasks/bulk",
+            json={
+                "items": [
+                    {"id": task_id, "status": "complete"},
+                    {"id": 999999999, "status": "complete"},
+                    {"id": task_id, "status": "block"},
+                ]
+            },
+        )
+        assert response.status_code == 422
+        assert [e["index"] for e in response.json()["detail"]] == [1, 2]
+        assert client.get(f"/tasks/{task_id}").json()["status"] == "to do"
+
+        response = client.request(
+            "DELETE", "/tasks/bulk", json={"ids": [task_id, 999999999]}
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"] == [
+            {"index": 1, "error": "Task 999999999 not found"}
+        ]
+        assert client.get(f"/tasks/{task_id}").status_code == 200
+
+    def test_bulk_update_reports_missing_target_project(self):
+        """
+        Test that moving tasks to an unknown project is reported per item.
+        """
+        created = client.post(
+            "/tasks/bulk", json={"items": [_task_payload(self.project_id, 0)]}
+        ).json()
+        task_id = created[0]["id"]
+
+        response = client.patch(
+            "/tasks/bulk", json={"items": [{"id": task_id, "project_id": 999999999}]}
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"] == [
+            {"index": 0, "error": "Project 999999999 not found"}
+        ]
+        assert client.get(f"/tasks/{task_id}").json()["project_id"] == self.project_id
+
+    def test_bulk_create_rejects_empty_batch(self):
+        """
+        Test that an empty item list fails request validation.
+        """
+        response = client.post("/tasks/bulk", json={"items": []})
+        assert response.status_code == 422
+
+    @classmethod
+    def teardown_class(cls):
+        """
+        Cleanup method to delete the project (and any remaining tasks) after tests complete.
+        """
+        client.delete(f"/projects/{cls.project_id}")
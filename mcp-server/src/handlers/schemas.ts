@@ -6,6 +6,9 @@ export const QueryTasksInput = z.object({
   project_id: z.number().optional(),
   title: z.string().optional(),
   due_date: z.string().optional(),
+  limit: z.number().int().positive().optional(),
+  cursor: z.string().optional(),
+  fields: z.string().optional(),
 });
 export type QueryTasksArgs = z.infer<typeof QueryTasksInput>;
 
@@ -14,9 +17,21 @@ export const QueryProjectsInput = z.object({
   status: z.string().optional(),
   start_date: z.string().optional(),
   end_date: z.string().optional(),
+  limit: z.number().int().positive().optional(),
+  cursor: z.string().optional(),
+  fields: z.string().optional(),
 });
 export type QueryProjectsArgs = z.infer<typeof QueryProjectsInput>;
 
+export const ProjectSummaryInput = z.object({
+  project_id: z.number().optional(),
+  name: z.string().optional(),
+  status: z.string().optional(),
+  limit: z.number().int().positive().optional(),
+  cursor: z.string().optional(),
+});
+export type ProjectSummaryArgs = z.infer<typeof ProjectSummaryInput>;
+
 export const CreateProjectInput = z.object({
   name: z.string(),
   description: z.string().optional(),
@@ -3,6 +3,7 @@ import { z } from "zod";
 import {
   fetchTasks,
   fetchProjects,
+  fetchProjectSummary,
   createProject,
   createTask,
 } from "../utils/tasks.js";
@@ -33,16 +34,21 @@ export function registerTools(server: McpServer) {
     "query_tasks",
     {
       title: "Query Tasks",
-      description: "Fetch tasks with optional filters",
+      description:
+        "Fetch tasks with optional filters. Without limit every matching task is returned. " +
+        "Use limit to cap the number of tasks returned; when next_cursor is then set, more " +
+        "match: pass it as cursor to fetch the next page. " +
+        "Set fields to a comma-separated subset of id,title,assigned_to,status,due_date,project_id," +
+        "created_time,last_modified to return only what the question needs (id is always included).",
       inputSchema: Schemas.QueryTasksInput.shape,
     },
     async (args: Schemas.QueryTasksArgs) => {
       try {
-        const tasks = await fetchTasks(args);
+        const { tasks, next_cursor } = await fetchTasks(args);
         if (!tasks || tasks.length === 0) {
           return wrapStructured({ isError: true as const, error: "No matching tasks found." });
         }
-        return wrapStructured({ isError: false as const, tasks });
+        return wrapStructured({ isError: false as const, tasks, next_cursor });
       } catch (err: any) {
         const backendError = err?.response?.data?.error || JSON.stringify(err?.response?.data || {});
         const combinedError = `Error creating task: ${err.message}. Backend response: ${backendError}`;
@@ -56,16 +62,22 @@ export function registerTools(server: McpServer) {
     "query_projects",
     {
       title: "Query Projects",
-      description: "Fetch projects with optional filters",
+      description:
+        "Fetch projects with optional filters. Without limit every matching project is returned. " +
+        "Use limit to cap the number of projects returned; when next_cursor is then set, more " +
+        "match: pass it as cursor to fetch the next page. " +
+        "Set fields to a comma-separated subset of id,name,description,start_date,end_date,status," +
+        "created_time,last_modified,tasks to return only what the question needs (id is always " +
+        "included; tasks only when listed).",
       inputSchema: Schemas.QueryProjectsInput.shape,
     },
     async (args: Schemas.QueryProjectsArgs) => {
       try {
-        const projects = await fetchProjects(args);
+        const { projects, next_cursor } = await fetchProjects(args);
         if (!projects || projects.length === 0) {
           return wrapStructured({ isError: true as const, error: "No matching projects found." });
         }
-        return wrapStructured({ isError: false as const, projects });
+        return wrapStructured({ isError: false as const, projects, next_cursor });
       } catch (err: any) {
         const backendError = err?.response?.data?.error || JSON.stringify(err?.response?.data || {});
         const combinedError = `Error creating task: ${err.message}. Backend response: ${backendError}`;
@@ -74,6 +86,32 @@ export function registerTools(server: McpServer) {
     }
   );
 
+  // project_summary
+  server.registerTool(
+    "project_summary",
+    {
+      title: "Project Summary",
+      description:
+        "Task counts per status, overdue task count and next due date of a project (by project_id) " +
+        "or of the projects matching name/status, computed by the backend without returning the tasks. " +
+        "Prefer this over query_tasks to answer how a project is going or how many of its tasks are in a status.",
+      inputSchema: Schemas.ProjectSummaryInput.shape,
+    },
+    async (args: Schemas.ProjectSummaryArgs) => {
+      try {
+        const { summaries, next_cursor } = await fetchProjectSummary(args);
+        if (!summaries || summaries.length === 0) {
+          return wrapStructured({ isError: true as const, error: "No matching projects found." });
+        }
+        return wrapStructured({ isError: false as const, summaries, next_cursor });
+      } catch (err: any) {
+        const backendError = err?.response?.data?.error || JSON.stringify(err?.response?.data || {});
+        const combinedError = `Error summarizing projects: ${err.message}. Backend response: ${backendError}`;
+        return wrapStructured({ isError: true as const, error: combinedError });
+      }
+    }
+  );
+
   // create_project
   server.registerTool(
     "create_project",
@@ -8,6 +8,9 @@ Raw tasks (JSON): ${toolResult}
 Previous Node/ Step: ${previousNode}
 
 Rules:
+- If the Previous Node is project_summary, the result holds per-project summaries, not raw tasks:
+  - Use task_count, status_counts, overdue_count and next_due_date exactly as given; do not recount.
+  - Answer with the project name and id, its counts per status, how many tasks are overdue and the next due date.
 - A task is considered **overdue** if:
   - assigned_to matches the person in the question (case-insensitive),
   - status != "complete"
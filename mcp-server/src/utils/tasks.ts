@@ -3,8 +3,73 @@ import axios from "axios";
 
 const BACKEND_FASTAPI_BASE = process.env.BACKEND_FASTAPI_BASE;
 
+// Last response per URL, revalidated with If-None-Match so an unchanged page
+// comes back as an empty 304 instead of the full body.
+const MAX_REVALIDATED_RESPONSES = 200;
+type RevalidatedResponse = { etag: string; data: any; headers: any };
+const revalidatedResponses = new Map<string, RevalidatedResponse>();
+
+async function getRevalidated(url: string, params: Record<string, string | number>) {
+  const query = Object.entries(params)
+    .sort(([a], [b]) => a.localeCompare(b))
+    .map(([key, value]) => `${key}=${encodeURIComponent(String(value))}`)
+    .join("&");
+  const cacheKey = `${url}?${query}`;
+  const cached = revalidatedResponses.get(cacheKey);
+  const response = await axios.get(url, {
+    params,
+    headers: cached ? { "If-None-Match": cached.etag } : undefined,
+    validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+  });
+
+  if (response.status === 304 && cached) {
+    rememberResponse(cacheKey, cached);
+    return cached;
+  }
+  const entry: RevalidatedResponse = {
+    etag: response.headers["etag"],
+    data: response.data,
+    headers: response.headers,
+  };
+  if (entry.etag) rememberResponse(cacheKey, entry);
+  return entry;
+}
+
+function rememberResponse(cacheKey: string, entry: RevalidatedResponse) {
+  // Re-insert so the Map stays in least-recently-used-first order.
+  revalidatedResponses.delete(cacheKey);
+  revalidatedResponses.set(cacheKey, entry);
+  if (revalidatedResponses.size > MAX_REVALIDATED_RESPONSES) {
+    const oldest = revalidatedResponses.keys().next().value;
+    if (oldest !== undefined) revalidatedResponses.delete(oldest);
+  }
+}
+
+/**
+ * GET a list endpoint. With an explicit `limit` or `cursor` that one page is
+ * returned; otherwise next_cursor is followed until the last page, so "list all" and
+ * count questions see every match instead of the backend's default first page.
+ */
+async function getList(url: string, params: Record<string, string | number>) {
+  const { data, headers } = await getRevalidated(url, params);
+  let rows: any[] = data || [];
+  let nextCursor: string | null = headers["x-next-cursor"] ?? null;
+  if (params.limit !== undefined || params.cursor !== undefined) {
+    return { rows, next_cursor: nextCursor };
+  }
+  while (nextCursor) {
+    const page = await getRevalidated(url, { ...params, cursor: nextCursor });
+    rows = rows.concat(page.data || []);
+    nextCursor = page.headers["x-next-cursor"] ?? null;
+  }
+  return { rows, next_cursor: null };
+}
+
 /**
- * Fetch tasks from the backend with optional filters.
+ * Fetch tasks from the backend with optional filters: every match, or with `limit`
+ * one page of at most that many. `next_cursor` is then set when more tasks match;
+ * pass it back as `cursor` to continue.
+ * `fields` (comma-separated) asks the backend for only those task fields, plus id.
  */
 export async function fetchTasks(filters?: {
   assigned_to?: string;
@@ -12,6 +77,9 @@ export async function fetchTasks(filters?: {
   project_id?: number;
   title?: string;
   due_date?: string; // YYYY-MM-DD
+  limit?: number;
+  cursor?: string;
+  fields?: string;
 }) {
   console.log("fetchTasks called with filters:", filters);
   const safeFilters = filters || {};
@@ -23,28 +91,70 @@ export async function fetchTasks(filters?: {
     params.project_id = safeFilters.project_id;
   if (safeFilters.due_date) params.due_date = safeFilters.due_date;
    if (safeFilters.title) params.title = safeFilters.title;
-  const { data } = await axios.get(`${BACKEND_FASTAPI_BASE}/tasks`, { params });
-  return data || [];
+  if (safeFilters.limit !== undefined) params.limit = safeFilters.limit;
+  if (safeFilters.cursor) params.cursor = safeFilters.cursor;
+  if (safeFilters.fields) params.fields = safeFilters.fields;
+  const { rows, next_cursor } = await getList(`${BACKEND_FASTAPI_BASE}/tasks`, params);
+  return { tasks: rows, next_cursor };
 }
 
 
 /**
- * Fetch projects from the backend with optional filters.
+ * Fetch projects from the backend with optional filters: every match, or with `limit`
+ * one page of at most that many. `next_cursor` is then set when more projects match;
+ * pass it back as `cursor` to continue.
+ * `fields` (comma-separated) asks the backend for only those project fields, plus id;
+ * tasks are only included when it names "tasks".
  */
 export async function fetchProjects(filters: {
   name?: string;
   status?: string;
   start_date?: string;
   end_date?: string;
+  limit?: number;
+  cursor?: string;
+  fields?: string;
 } = {}) {
    console.log("fetchProjects called with filters:", filters);
-  const params: Record<string, string> = {};
+  const params: Record<string, string | number> = {};
   if (filters.name) params.name = filters.name;
   if (filters.status) params.status = filters.status;
   if (filters.start_date) params.start_date = filters.start_date;
   if (filters.end_date) params.end_date = filters.end_date;
-  const { data } = await axios.get(`${BACKEND_FASTAPI_BASE}/projects`, { params });
-  return data || [];
+  if (filters.limit !== undefined) params.limit = filters.limit;
+  if (filters.cursor) params.cursor = filters.cursor;
+  if (filters.fields) params.fields = filters.fields;
+  const { rows, next_cursor } = await getList(`${BACKEND_FASTAPI_BASE}/projects`, params);
+  return { projects: rows, next_cursor };
+}
+
+
+/**
+ * Task counts per status, overdue count and next due date, aggregated by the backend.
+ * With project_id, the summary of that project; otherwise one page of summaries of
+ * the projects matching the filters (`next_cursor` works as in fetchProjects).
+ */
+export async function fetchProjectSummary(filters: {
+  project_id?: number;
+  name?: string;
+  status?: string;
+  limit?: number;
+  cursor?: string;
+} = {}) {
+  console.log("fetchProjectSummary called with filters:", filters);
+  if (filters.project_id !== undefined) {
+    const { data } = await getRevalidated(
+      `${BACKEND_FASTAPI_BASE}/projects/${filters.project_id}/summary`, {}
+    );
+    return { summaries: [data], next_cursor: null };
+  }
+  const params: Record<string, string | number> = {};
+  if (filters.name) params.name = filters.name;
+  if (filters.status) params.status = filters.status;
+  if (filters.limit !== undefined) params.limit = filters.limit;
+  if (filters.cursor) params.cursor = filters.cursor;
+  const { data, headers } = await getRevalidated(`${BACKEND_FASTAPI_BASE}/projects/summary`, params);
+  return { summaries: data || [], next_cursor: headers["x-next-cursor"] ?? null };
 }
 
 
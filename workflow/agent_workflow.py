@@ -15,6 +15,7 @@ from workflow.nodes.create_project_node import create_project_node
 from workflow.nodes.create_task_node import create_task_node
 from workflow.nodes.plan_node import plan_node
 from workflow.nodes.preprocess_node import preprocess_node
+from workflow.nodes.project_summary_node import project_summary_node
 from workflow.nodes.query_projects_node import query_projects_node
 from workflow.nodes.query_tasks_node import query_tasks_node
 from workflow.setup_mcp import setup_mcp
@@ -39,6 +40,8 @@ class AgentWorkflow:
             return "query_projects"
         elif state.used_tool_name == "query_tasks":
             return "query_tasks"
+        elif state.used_tool_name == "project_summary":
+            return "project_summary"
         elif state.intent == "create_project":
             return "check_project_exists"
         elif state.intent == "create_task":
@@ -70,6 +73,7 @@ class AgentWorkflow:
         graph.add_node("clarify_node", clarify_node)
         graph.add_node("query_tasks", query_tasks_node)
         graph.add_node("query_projects", query_projects_node)
+        graph.add_node("project_summary", project_summary_node)
         graph.add_node("check_project_exists", check_project_exists_node)
         graph.add_node("check_task_exists", check_task_exists_node)
         graph.add_node("analyze_after_check", analyze_after_check_node)
@@ -87,6 +91,7 @@ class AgentWorkflow:
         # Normal query flows -> final_answer
         graph.add_edge("query_projects", "final_answer")
         graph.add_edge("query_tasks", "final_answer")
+        graph.add_edge("project_summary", "final_answer")
 
         # Existence check flows
         graph.add_edge("check_project_exists", "analyze_after_check")
@@ -17,7 +17,11 @@ async def check_project_exists_node(
     try:
         tool_func = runtime.context.mcp_tools["query_projects"]
         project_name_to_query: str = state.tool_input.get("name")
-        params = {"name": project_name_to_query}
+        # What the duplicate check compares: the projects without their tasks.
+        params = {
+            "name": project_name_to_query,
+            "fields": "name,description,start_date,end_date,status,created_time",
+        }
         logger.debug(f"check_project_exists params: {params}")
         result = await tool_func(**params)
         if result["isError"] is True:
@@ -21,6 +21,8 @@ async def check_task_exists_node(
         params = {
             "project_id": project_id_to_query,
             "title": task_title_to_query,
+            # What the duplicate check compares, without timestamps it ignores.
+            "fields": "title,assigned_to,status,due_date,project_id,created_time",
         }
         logger.info(f"check_task_exists params: {params}")
         result = await tool_func(**params)
@@ -0,0 +1,33 @@
+import json
+import logging
+from typing import Any
+
+from langgraph.runtime import Runtime
+
+from workflow.agent_context import AgentContext
+from workflow.agent_state import AgentState
+
+logger = logging.getLogger(__name__)
+
+
+async def project_summary_node(
+    state: AgentState, runtime: Runtime[AgentContext]
+) -> AgentState:
+    """Execute project_summary MCP tool."""
+    logger.info("Project summary node.")
+    try:
+        tool_func = runtime.context.mcp_tools["project_summary"]
+        params: dict[str, Any] = state.tool_input or {}
+        logger.info(f"project_summary params: {params}")
+        result = await tool_func(**params)
+        logger.debug(f'Result for project_summary_node: {result}')
+        if result["isError"] is True:
+            raise RuntimeError(f'Project summary returned an error: {result.get("error")}')
+        state.tool_result = json.dumps(result["summaries"], separators=(",", ":"))
+        logger.info(f"result from project_summary {state.tool_result}")
+    except Exception as e:
+        logger.exception("Cannot summarize projects", exc_info=e)
+        state.tool_result = f"ERROR: Fail to summarize projects because of {e}"
+
+    state.previous_node: str = 'project_summary'
+    return state
@@ -23,7 +23,16 @@ async def query_projects_node(
         logger.debug(f'Result for query_projects_node: {result}')
         if result["isError"] is True:
             raise RuntimeError(f'Query projects returned an error: {result.get("error")}')
-        state.tool_result = json.dumps(result["projects"], separators=(",", ":"))
+        rows = result["projects"]
+        if result.get("next_cursor"):
+            # Only one page was asked for (an explicit limit): say that more match,
+            # so the answer is not taken for the full result.
+            rows = {
+                "projects": rows,
+                "truncated": True,
+                "next_cursor": result["next_cursor"],
+            }
+        state.tool_result = json.dumps(rows, separators=(",", ":"))
         logger.info(f"result from query_projects {state.tool_result}")
     except Exception as e:
         logger.exception("Cannot query projects", exc_info=e)
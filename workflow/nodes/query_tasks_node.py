@@ -23,7 +23,16 @@ async def query_tasks_node(
         logger.debug(f'Result for query_tasks_node: {result}')
         if result["isError"] is True:
             raise RuntimeError(f'Query tasks returned an error: {result.get("error")}')
-        state.tool_result = json.dumps(result["tasks"], separators=(",", ":"))
+        rows = result["tasks"]
+        if result.get("next_cursor"):
+            # Only one page was asked for (an explicit limit): say that more match,
+            # so the answer is not taken for the full result.
+            rows = {
+                "tasks": rows,
+                "truncated": True,
+                "next_cursor": result["next_cursor"],
+            }
+        state.tool_result = json.dumps(rows, separators=(",", ":"))
 
         logger.info(f"result from query_tasks {state.tool_result}")
     except Exception as e: